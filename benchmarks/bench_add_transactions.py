@@ -0,0 +1,75 @@
+"""
+Benchmark adding transactions to a long history.
+
+A tracker is created with the history, and a small batch of new
+transactions is then either added with `add_transactions`, which
+recomputes the months of the batch only, or included in a new tracker
+whose reports are computed from scratch.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_add_transactions.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+from synthetic_data import make_budget, make_expense_log
+
+from expense_tracker import ExpenseTracker
+from utils.file_helper import setup_logging
+
+
+def main() -> None:
+    """Run the benchmark and log the time to update the reports."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+    logger = setup_logging()
+    budget = make_budget()
+    expense_log = make_expense_log(budget, args.rows + 2 * args.batch)
+    history = expense_log.iloc[: args.rows]
+    batch = expense_log.iloc[args.rows + args.batch :]
+
+    tracker = ExpenseTracker.from_frames(history, budget)
+    tracker.append_totals_rows()
+    # The first call splits the history by month once
+    tracker.add_transactions(
+        expense_log.iloc[args.rows : args.rows + args.batch]
+    )
+
+    start = time.perf_counter()
+    tracker.add_transactions(batch)
+    tracker.append_totals_rows()
+    incremental = time.perf_counter() - start
+
+    start = time.perf_counter()
+    full_tracker = ExpenseTracker.from_frames(expense_log, budget)
+    expected = full_tracker.append_totals_rows()
+    full_recompute = time.perf_counter() - start
+
+    assert len(tracker.split_report) == len(expected)
+    for report, expected_report in zip(tracker.split_report, expected):
+        pd.testing.assert_frame_equal(
+            report, expected_report, check_exact=True
+        )
+    logger.info(
+        "Adding %s transactions to %s:\n%s",
+        args.batch,
+        args.rows,
+        pd.DataFrame([
+            {
+                "incremental_s": round(incremental, 3),
+                "full_recompute_s": round(full_recompute, 3),
+                "speedup": round(full_recompute / incremental, 1),
+            }
+        ]).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
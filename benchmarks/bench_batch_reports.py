@@ -0,0 +1,80 @@
+"""
+Benchmark building the reports of a directory of workbooks.
+
+Copies of a scaled-up example workbook stand in for household
+workbooks. Their reports are built by `run_batch` with a growing number
+of worker processes; throughput should grow near-linearly with the
+workers up to the number of cores.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_batch_reports.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from bench_excel_engines import build_workbook
+
+from batch_reports import jobs_from_patterns, run_batch
+from utils.file_helper import setup_logging
+
+
+def main() -> None:
+    """Run the benchmark and log a table of throughput per worker count."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workbooks", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=2_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args()
+    logger = setup_logging()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook_dir = Path(tmp_dir) / "workbooks"
+        workbook_dir.mkdir()
+        build_workbook(workbook_dir / "household_0.xlsx", args.rows)
+        for i in range(1, args.workbooks):
+            shutil.copy(
+                workbook_dir / "household_0.xlsx",
+                workbook_dir / f"household_{i}.xlsx",
+            )
+
+        for max_workers in args.workers:
+            jobs = jobs_from_patterns(
+                [str(workbook_dir / "*.xlsx")],
+                str(Path(tmp_dir) / f"reports_{max_workers}"),
+            )
+            start = time.perf_counter()
+            batch_results = run_batch(jobs, max_workers)
+            elapsed = time.perf_counter() - start
+            results.append({
+                "workers": max_workers,
+                "failed": sum(bool(r.error) for r in batch_results),
+                "time_s": round(elapsed, 3),
+                "workbooks_per_s": round(len(jobs) / elapsed, 1),
+            })
+
+    logger.info(
+        "Building %s reports of %s rows (%s cores):\n%s",
+        args.workbooks,
+        args.rows,
+        os.cpu_count(),
+        pd.DataFrame(results).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark categorizing formatted transactions with merchant rules.
+
+Notes are drawn from merchant names of the default rules file, with
+store numbers appended so that notes repeat as they do in bank exports,
+plus merchants no rule matches. The rules are applied row by row, trying
+each rule's regex in turn, and with `RuleBasedCategorizer`, which runs
+one combined matcher per distinct note.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_categorization.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from categorizers.rule_based import RuleBasedCategorizer
+from utils.file_helper import setup_logging
+
+MERCHANTS = [
+    "STARBUCKS STORE",
+    "SHELL OIL",
+    "KROGER",
+    "NETFLIX.COM",
+    "AMZN MKTP US",
+    "VERIZON WRLS",
+    "LOCAL HARDWARE",
+    "CITY PARKING",
+    "SQ *FARMERS MARKET",
+    "WALGREENS",
+]
+
+
+def make_notes(rows: int, stores: int, seed: int = 0) -> pd.Series:
+    """
+    Build transaction notes of merchants with store numbers.
+
+    Parameters
+    ----------
+    rows : int
+        Number of notes.
+    stores : int
+        Number of store numbers per merchant.
+    seed : int, optional
+        Seed of the random generator. By default 0.
+
+    Returns
+    -------
+    pd.Series
+        The notes.
+
+    """
+    rng = np.random.default_rng(seed)
+    merchants = np.array(MERCHANTS, dtype=object)[
+        rng.integers(0, len(MERCHANTS), rows)
+    ]
+    store_numbers = rng.integers(0, stores, rows).astype(str)
+    return pd.Series(merchants + " #" + store_numbers.astype(object))
+
+
+def categorize_row_by_row(
+    categorizer: RuleBasedCategorizer, notes: pd.Series
+) -> list[str]:
+    """
+    Categorize notes one by one, trying the rules in order.
+
+    Parameters
+    ----------
+    categorizer : RuleBasedCategorizer
+        The categorizer whose rules are applied.
+    notes : pd.Series
+        The notes.
+
+    Returns
+    -------
+    list[str]
+        The category of each note, "" when no rule matches.
+
+    """
+    patterns = [
+        (re.compile(rule.pattern, re.IGNORECASE), rule.category)
+        for rule in categorizer.rules
+    ]
+    return [
+        next(
+            (
+                category
+                for pattern, category in patterns
+                if pattern.search(n)
+            ),
+            "",
+        )
+        for n in notes
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and log timings and rule statistics."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--stores", type=int, default=1_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+    notes = make_notes(args.rows, args.stores)
+    expense_log = pd.DataFrame({
+        "category": "",
+        "subcategory": "",
+        "note": notes,
+    })
+    categorizer = RuleBasedCategorizer()
+
+    start = time.perf_counter()
+    expected = categorize_row_by_row(categorizer, notes)
+    row_by_row = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = categorizer.categorize(expense_log)
+    combined = time.perf_counter() - start
+
+    assert result["category"].tolist() == expected
+    logger.info(
+        "Categorizing %s transactions (%s distinct notes):\n%s",
+        args.rows,
+        notes.nunique(),
+        pd.DataFrame([
+            {
+                "row_by_row_s": round(row_by_row, 3),
+                "combined_s": round(combined, 3),
+                "speedup": round(row_by_row / combined, 1),
+                **{
+                    name: round(t, 3)
+                    for name, t in categorizer.timings.items()
+                },
+            }
+        ]).to_string(index=False),
+    )
+    logger.info("Rule matches:\n%s", categorizer.stats().to_string())
+
+
+if __name__ == "__main__":
+    main()
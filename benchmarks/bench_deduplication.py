@@ -0,0 +1,117 @@
+"""
+Benchmark skipping transactions of overlapping statement exports.
+
+For each history size, a history of imported transactions is recorded
+in a `TransactionIndex`, then a new export whose first half overlaps the
+end of the history is deduplicated. Checking the new export against the
+index is compared with fingerprinting the whole history again, as a
+deduplication without a persisted index would.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_deduplication.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from bench_merchant_normalizer import make_descriptions
+
+from transaction_formatters.deduplicator import (
+    TransactionDeduplicator,
+    transaction_fingerprints,
+)
+from utils.file_helper import setup_logging
+
+
+def make_transactions(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Build formatted transactions, in date order.
+
+    Parameters
+    ----------
+    rows : int
+        Number of transactions.
+    seed : int, optional
+        Seed of the random generator. By default 0.
+
+    Returns
+    -------
+    pd.DataFrame
+        The transactions.
+
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "date": pd.Timestamp("2015-01-01")
+        + pd.to_timedelta(np.sort(rng.integers(0, 3_650, rows)), unit="D"),
+        "category": "",
+        "subcategory": "",
+        "amount": rng.integers(100, 20_000, rows) / 100,
+        "payment_type": rng.choice(["Venture", "Discover"], rows),
+        "note": make_descriptions(rows, 100, seed).to_numpy(),
+    })
+
+
+def main() -> None:
+    """Run the benchmark and log timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--history",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000, 3_000_000],
+    )
+    parser.add_argument("--new", type=int, default=10_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+    results = []
+
+    for history_rows in args.history:
+        transactions = make_transactions(history_rows + args.new // 2)
+        history = transactions.iloc[:history_rows]
+        new_export = transactions.iloc[-args.new :]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            history_import = TransactionDeduplicator(tmp_dir)
+            history_import.deduplicate(history)
+            history_import.commit()
+
+            start = time.perf_counter()
+            deduplicator = TransactionDeduplicator(tmp_dir)
+            result = deduplicator.deduplicate(new_export)
+            indexed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        is_new = ~np.isin(
+            transaction_fingerprints(new_export),
+            transaction_fingerprints(history),
+        )
+        rehashed = time.perf_counter() - start
+
+        assert result.index.equals(new_export.index[is_new])
+        results.append({
+            "history_rows": history_rows,
+            "new_rows": len(new_export),
+            "skipped": deduplicator.skipped,
+            "rehash_history_s": round(rehashed, 3),
+            "with_index_s": round(indexed, 3),
+            **{
+                name: round(t, 3)
+                for name, t in deduplicator.timings.items()
+            },
+        })
+
+    logger.info(
+        "Deduplicating a new export:\n%s",
+        pd.DataFrame(results).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
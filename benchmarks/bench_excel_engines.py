@@ -0,0 +1,144 @@
+"""
+Benchmark Excel parsing engines for loading an expense tracker workbook.
+
+The example input sheet is scaled up to a large expense log and written
+to a temporary workbook. Each engine is then timed reading the expense
+log and budget sheets, both with one `pd.read_excel` call per sheet
+(the original loader) and with a single pass over one open workbook.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_excel_engines.py --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from utils.file_helper import (
+    EXCEL_ENGINE_MODULES,
+    EXCEL_ENGINES,
+    read_excel_sheets,
+    setup_logging,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PARENT_DIR = Path(__file__).resolve().parent.parent
+EXAMPLE_PATH = PARENT_DIR / "notebooks" / "example_input_sheet.xlsx"
+EXPENSE_SHEET = "EXPENSE_LOG"
+BUDGET_SHEET = "BUDGET"
+
+
+def build_workbook(output_path: Path, rows: int) -> None:
+    """
+    Write a workbook whose expense log is the example log scaled up.
+
+    Parameters
+    ----------
+    output_path : Path
+        Path of the workbook to create.
+    rows : int
+        Number of rows in the scaled expense log.
+
+    """
+    sheets = read_excel_sheets(
+        str(EXAMPLE_PATH), sheet_names=[EXPENSE_SHEET, BUDGET_SHEET]
+    )
+    expense_log = sheets[EXPENSE_SHEET]
+    repeats = -(-rows // len(expense_log))
+    scaled_log = pd.concat([expense_log] * repeats, ignore_index=True)
+    with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
+        scaled_log.iloc[:rows].to_excel(
+            writer, sheet_name=EXPENSE_SHEET, index=False
+        )
+        sheets[BUDGET_SHEET].to_excel(
+            writer, sheet_name=BUDGET_SHEET, index=False
+        )
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """
+    Return the best wall-clock time of several calls to a function.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        Function to time. It is called without arguments.
+    repeat : int
+        Number of times the function is called.
+
+    Returns
+    -------
+    float
+        The fastest call, in seconds.
+
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and log a table of timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logger = setup_logging()
+
+    engines = [
+        engine
+        for engine in EXCEL_ENGINES
+        if find_spec(EXCEL_ENGINE_MODULES[engine]) is not None
+    ]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook_path = Path(tmp_dir) / "scaled_expense_log.xlsx"
+        build_workbook(workbook_path, args.rows)
+
+        for engine in engines:
+            two_reads = time_call(
+                lambda engine=engine: [
+                    pd.read_excel(
+                        workbook_path, sheet_name=sheet, engine=engine
+                    )
+                    for sheet in (EXPENSE_SHEET, BUDGET_SHEET)
+                ],
+                args.repeat,
+            )
+            single_pass = time_call(
+                lambda engine=engine: read_excel_sheets(
+                    str(workbook_path),
+                    sheet_names=[EXPENSE_SHEET, BUDGET_SHEET],
+                    engine=engine,
+                ),
+                args.repeat,
+            )
+            results.append({
+                "engine": engine,
+                "two_reads_s": round(two_reads, 3),
+                "single_pass_s": round(single_pass, 3),
+                "speedup": round(two_reads / single_pass, 2),
+            })
+
+    logger.info(
+        "Loading %s expense rows:\n%s",
+        args.rows,
+        pd.DataFrame(results).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
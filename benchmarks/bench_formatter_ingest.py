@@ -0,0 +1,246 @@
+"""
+Benchmark reading multi-year Capital One and Discover exports.
+
+The original reader read every column of the export and parsed the date
+columns in `pd.read_csv` and then again with `pd.to_datetime`. The
+formatters now read only the columns they use and parse each date column
+once with its known format, optionally with the pyarrow engine.
+
+Converting each export to an expense log CSV is also compared formatting
+the whole log in memory and streaming it in chunks, with peak memory
+measured by tracemalloc.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_formatter_ingest.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from transaction_formatters.capital_one import CapitalOneFormatter
+from transaction_formatters.discover import DiscoverFormatter
+from utils.file_helper import setup_logging
+
+if TYPE_CHECKING:
+    from transaction_formatters.base_formatter import BaseFormatter
+
+# Columns of each export and their data types, as read by the original
+# formatters
+EXPORT_COLUMNS = {
+    CapitalOneFormatter: {
+        "Transaction Date": "date",
+        "Posted Date": "date",
+        "Card No.": "Int64",
+        "Description": "str",
+        "Category": "str",
+        "Debit": "float64",
+        "Credit": "float64",
+    },
+    DiscoverFormatter: {
+        "Trans. Date": "date",
+        "Post Date": "date",
+        "Description": "str",
+        "Amount": "float64",
+        "Category": "str",
+    },
+}
+# Method formatting the whole transaction log of each formatter
+FORMAT_METHODS = {
+    CapitalOneFormatter: "format_cap_one_logs",
+    DiscoverFormatter: "format_discover_logs",
+}
+
+
+def make_export(
+    formatter_cls: type[BaseFormatter],
+    file_path: Path,
+    rows: int,
+    years: int,
+    seed: int = 0,
+) -> None:
+    """
+    Write a synthetic transaction export in the format of a formatter.
+
+    Parameters
+    ----------
+    formatter_cls : type[BaseFormatter]
+        The formatter whose export columns and date format are written.
+    file_path : Path
+        The path of the CSV file.
+    rows : int
+        Number of transactions.
+    years : int
+        Number of years the transactions span.
+    seed : int, optional
+        Seed of the random generator. By default 0.
+
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+        np.sort(rng.integers(0, 365 * years, rows)), unit="D"
+    )
+    columns = {}
+    for col, dtype in EXPORT_COLUMNS[formatter_cls].items():
+        if dtype == "date":
+            columns[col] = dates.strftime(formatter_cls.DATE_FORMAT)
+        elif dtype == "str":
+            columns[col] = rng.choice(
+                ["GROCERY STORE", "GAS STATION", "COFFEE SHOP"], rows
+            )
+        elif dtype == "Int64":
+            columns[col] = rng.integers(1000, 9999, rows)
+        else:
+            columns[col] = rng.uniform(1, 200, rows).round(2)
+    pd.DataFrame(columns).to_csv(file_path, index=False)
+
+
+def read_original(
+    formatter_cls: type[BaseFormatter], file_path: Path
+) -> pd.DataFrame:
+    """
+    Read every column of an export with the original date parsing.
+
+    Parameters
+    ----------
+    formatter_cls : type[BaseFormatter]
+        The formatter whose export is read.
+    file_path : Path
+        The path of the CSV file.
+
+    Returns
+    -------
+    pd.DataFrame
+        The transaction log.
+
+    """
+    columns = EXPORT_COLUMNS[formatter_cls]
+    date_cols = [col for col, dtype in columns.items() if dtype == "date"]
+    trans_log = pd.read_csv(
+        file_path,
+        dtype={
+            col: dtype for col, dtype in columns.items() if dtype != "date"
+        },
+        parse_dates=date_cols,
+    )
+    trans_log[date_cols] = trans_log[date_cols].apply(pd.to_datetime)
+    return trans_log
+
+
+def convert(
+    formatter_cls: type[BaseFormatter],
+    file_path: Path,
+    output_path: Path,
+    chunk_size: int | None,
+) -> dict:
+    """
+    Convert an export to an expense log CSV, measuring time and memory.
+
+    Parameters
+    ----------
+    formatter_cls : type[BaseFormatter]
+        The formatter of the export.
+    file_path : Path
+        The path of the export.
+    output_path : Path
+        The path of the expense log CSV.
+    chunk_size : int | None
+        Rows formatted at a time, or None to format the whole log.
+
+    Returns
+    -------
+    dict
+        The peak traced memory, in MB, and the time of the conversion.
+
+    """
+
+    def run() -> None:
+        formatter = formatter_cls(str(file_path), chunk_size=chunk_size)
+        if chunk_size is None:
+            format_logs = getattr(formatter, FORMAT_METHODS[formatter_cls])
+            format_logs().to_csv(output_path, index=False)
+        else:
+            formatter.write_formatted_logs(str(output_path))
+
+    # Time and memory are measured in separate runs, since tracemalloc
+    # slows down the conversion
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"peak_mb": round(peak / 1e6, 1), "time_s": round(elapsed, 3)}
+
+
+def main() -> None:
+    """Run the benchmark and log a table of read times per formatter."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+    engines = ["c"] + (["pyarrow"] if find_spec("pyarrow") else [])
+
+    results = []
+    conversions = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for formatter_cls in (CapitalOneFormatter, DiscoverFormatter):
+            file_path = Path(tmp_dir) / f"{formatter_cls.__name__}.csv"
+            make_export(formatter_cls, file_path, args.rows, args.years)
+
+            start = time.perf_counter()
+            read_original(formatter_cls, file_path)
+            timings = {"original_s": time.perf_counter() - start}
+            for engine in engines:
+                start = time.perf_counter()
+                formatter_cls(str(file_path), engine=engine)
+                timings[f"{engine}_s"] = time.perf_counter() - start
+
+            results.append({
+                "formatter": formatter_cls.__name__,
+                **{name: round(t, 3) for name, t in timings.items()},
+                "speedup": round(
+                    timings["original_s"] / min(timings.values()), 1
+                ),
+            })
+
+            output_path = Path(tmp_dir) / "expense_log.csv"
+            for mode, chunk_size in (
+                ("whole", None),
+                ("streamed", args.chunk_size),
+            ):
+                conversions.append({
+                    "formatter": formatter_cls.__name__,
+                    "mode": mode,
+                    **convert(
+                        formatter_cls, file_path, output_path, chunk_size
+                    ),
+                })
+
+    logger.info(
+        "Reading %s transactions over %s years:\n%s",
+        args.rows,
+        args.years,
+        pd.DataFrame(results).to_string(index=False),
+    )
+    logger.info(
+        "Converting to an expense log CSV:\n%s",
+        pd.DataFrame(conversions).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark the aggregate-first grouped report against the original one.
+
+The original method sums every transaction with `transform`, joins the
+whole transaction log to the budget and collapses it again with
+`drop_duplicates`. `build_grouped_report` aggregates first and joins only
+the (month, category, subcategory) groups.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_grouped_report.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+from synthetic_data import make_budget, make_expense_log
+
+from expense_tracker import ExpenseTracker
+from utils.data_helper import GROUPED_REPORT_COLUMNS, build_grouped_report
+from utils.file_helper import setup_logging
+
+
+def transaction_level_report(
+    expense_log: pd.DataFrame,
+    budget: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Build the grouped report with the original transaction-level method.
+
+    Parameters
+    ----------
+    expense_log : pd.DataFrame
+        The validated expense log.
+    budget : pd.DataFrame
+        The validated budget.
+
+    Returns
+    -------
+    pd.DataFrame
+        The grouped report.
+
+    """
+    expense_log = expense_log.copy()
+    expense_log["month"] = expense_log["date"].dt.month_name()
+    expense_log["total_amount_spent"] = expense_log.groupby(
+        ["month", "category", "subcategory"], observed=True
+    )["amount"].transform("sum")
+    grouped_report = (
+        expense_log.merge(
+            budget, on=["category", "subcategory"], how="left"
+        )
+        .drop(columns=["date", "amount", "payment_type", "note"])
+        .sort_values(by=["month", "category", "subcategory"])
+    ).drop_duplicates()
+    grouped_report["difference"] = (
+        grouped_report["amount_budgeted"]
+        - grouped_report["total_amount_spent"]
+    )
+    return grouped_report[GROUPED_REPORT_COLUMNS]
+
+
+def main() -> None:
+    """Run the benchmark and log a table of timings per log size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+    )
+    args = parser.parse_args()
+    logger = setup_logging()
+    budget = make_budget()
+
+    results = []
+    for rows in args.rows:
+        tracker = ExpenseTracker.from_frames(
+            make_expense_log(budget, rows), budget
+        )
+        expense_log = tracker.get_expense_log()
+        validated_budget = tracker.get_budget()
+
+        start = time.perf_counter()
+        expected = transaction_level_report(expense_log, validated_budget)
+        transaction_level = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = build_grouped_report(
+            expense_log,
+            validated_budget,
+            months=expense_log["date"].dt.month_name(),
+        )
+        aggregate_first = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(
+            result, expected.reset_index(drop=True)
+        )
+        results.append({
+            "rows": rows,
+            "groups": len(result),
+            "transaction_level_s": round(transaction_level, 3),
+            "aggregate_first_s": round(aggregate_first, 3),
+            "speedup": round(transaction_level / aggregate_first, 1),
+        })
+
+    logger.info(
+        "Grouped report:\n%s", pd.DataFrame(results).to_string(index=False)
+    )
+
+
+if __name__ == "__main__":
+    main()
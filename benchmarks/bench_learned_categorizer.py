@@ -0,0 +1,153 @@
+"""
+Benchmark training and applying the naive Bayes categorizer.
+
+A history of notes is labeled with the default rules, as a categorized
+expense log would be. The model is trained on it, updated with a month of
+new transactions, saved and loaded, then predicts new notes with unseen
+store numbers. Prediction is compared with scoring notes one at a time
+in Python on a sample, and its accuracy with the rule labels.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_learned_categorizer.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from bench_categorization import make_notes
+
+from categorizers.learned import WORD_PATTERN, NaiveBayesCategorizer
+from categorizers.rule_based import RuleBasedCategorizer
+from utils.file_helper import setup_logging
+
+
+def label_notes(notes: pd.Series) -> pd.DataFrame:
+    """
+    Build an expense log of notes categorized with the default rules.
+
+    Parameters
+    ----------
+    notes : pd.Series
+        The notes.
+
+    Returns
+    -------
+    pd.DataFrame
+        The expense log, with "" for notes no rule matches.
+
+    """
+    return RuleBasedCategorizer().categorize(
+        pd.DataFrame({"category": "", "subcategory": "", "note": notes})
+    )
+
+
+def predict_row_by_row(
+    categorizer: NaiveBayesCategorizer, notes: pd.Series
+) -> list[str]:
+    """
+    Predict the category of notes one by one.
+
+    Parameters
+    ----------
+    categorizer : NaiveBayesCategorizer
+        The trained categorizer.
+    notes : pd.Series
+        The notes.
+
+    Returns
+    -------
+    list[str]
+        The category of the most likely budget line of each note.
+
+    """
+    log_prior, log_likelihood = categorizer._log_probabilities()
+    n_features = np.uint64(categorizer.n_features)
+    categories = []
+    for note in notes:
+        tokens = re.findall(WORD_PATTERN, note.upper())
+        features = (
+            pd.util.hash_array(np.array(tokens, dtype=object)) % n_features
+        ).astype(np.intp)
+        scores = log_prior + log_likelihood[:, features].sum(axis=1)
+        categories.append(categorizer.classes[scores.argmax()][0])
+    return categories
+
+
+def main() -> None:
+    """Run the benchmark and log timings and accuracy."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--stores", type=int, default=1_000)
+    parser.add_argument("--sample", type=int, default=10_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+    history = label_notes(make_notes(args.rows, args.stores, seed=0))
+    new_month = label_notes(
+        make_notes(args.rows // 12, args.stores, seed=1)
+    )
+    # Unseen store numbers, so notes are new but merchants are known
+    test_log = label_notes(
+        make_notes(args.rows, args.stores, seed=2).str.replace(
+            "#", "#9", regex=False
+        )
+    )
+    categorizer = NaiveBayesCategorizer()
+    timings = {}
+
+    start = time.perf_counter()
+    categorizer.fit(history)
+    timings["fit_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    categorizer.partial_fit(new_month)
+    timings["partial_fit_s"] = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = Path(tmp_dir) / "categorizer.npz"
+        start = time.perf_counter()
+        categorizer.save(str(model_path))
+        timings["save_s"] = time.perf_counter() - start
+        timings["model_kb"] = model_path.stat().st_size / 1024
+
+        start = time.perf_counter()
+        categorizer = NaiveBayesCategorizer.load(str(model_path))
+        timings["load_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictions = categorizer.predict(test_log["note"])
+    timings["predict_s"] = time.perf_counter() - start
+
+    sample = test_log["note"].iloc[: args.sample]
+    start = time.perf_counter()
+    expected = predict_row_by_row(categorizer, sample)
+    timings["row_by_row_s"] = (
+        (time.perf_counter() - start) * len(test_log) / len(sample)
+    )
+    assert predictions["category"].iloc[: args.sample].tolist() == expected
+
+    labeled = test_log["category"].ne("").to_numpy()
+    timings["accuracy"] = np.mean(
+        predictions["category"].to_numpy()[labeled]
+        == test_log["category"].to_numpy()[labeled]
+    )
+    logger.info(
+        "Naive Bayes categorizer, %s training and test transactions "
+        "(row by row extrapolated from %s notes):\n%s",
+        args.rows,
+        len(sample),
+        pd.DataFrame([
+            {name: round(t, 3) for name, t in timings.items()}
+        ]).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
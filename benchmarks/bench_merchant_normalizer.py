@@ -0,0 +1,114 @@
+"""
+Benchmark normalizing statement descriptions into merchant names.
+
+Descriptions are drawn from raw bank descriptions with store numbers and
+reference codes, so that they repeat as they do in bank exports. They
+are normalized row by row, with a cold `MerchantNormalizer`, which
+normalizes each distinct description once, and with a normalizer loading
+the cache persisted by the cold run, as a repeated import would.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_merchant_normalizer.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from transaction_formatters.merchant_normalizer import MerchantNormalizer
+from utils.file_helper import setup_logging
+
+DESCRIPTIONS = [
+    "AMAZON MKTPLACE PMTS AMZN.COM/BILL WA",
+    "AMZN MKTP US*{ref}",
+    "STARBUCKS STORE #{store}",
+    "SQ *FARMERS MARKET {store} COLUMBUS OH",
+    "SHELL OIL {store} DAYTON OH",
+    "NETFLIX.COM",
+    "TST* LOCAL DINER {store}",
+    "WAL-MART #{store}",
+]
+
+
+def make_descriptions(rows: int, stores: int, seed: int = 0) -> pd.Series:
+    """
+    Build raw descriptions with store numbers and reference codes.
+
+    Parameters
+    ----------
+    rows : int
+        Number of descriptions.
+    stores : int
+        Number of store numbers and reference codes per template.
+    seed : int, optional
+        Seed of the random generator. By default 0.
+
+    Returns
+    -------
+    pd.Series
+        The descriptions.
+
+    """
+    rng = np.random.default_rng(seed)
+    variants = np.array(
+        [
+            template.format(store=i, ref=f"{i:06X}")
+            for template in DESCRIPTIONS
+            for i in range(stores)
+        ],
+        dtype=object,
+    )
+    return pd.Series(variants[rng.integers(0, len(variants), rows)])
+
+
+def main() -> None:
+    """Run the benchmark and log timings and cache statistics."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--stores", type=int, default=1_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+    descriptions = make_descriptions(args.rows, args.stores)
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = str(Path(tmp_dir) / "merchants.json")
+        normalizer = MerchantNormalizer(cache_path)
+        start = time.perf_counter()
+        expected = descriptions.map(normalizer.canonical_name)
+        results.append({
+            "run": "row_by_row",
+            "seconds": time.perf_counter() - start,
+        })
+
+        for run in ("cold", "warm"):
+            start = time.perf_counter()
+            normalizer = MerchantNormalizer(cache_path)
+            merchants = normalizer.normalize(descriptions)
+            normalizer.save()
+            results.append({
+                "run": run,
+                "seconds": time.perf_counter() - start,
+                **normalizer.stats(),
+            })
+            assert merchants.equals(expected)
+        cache_kb = Path(cache_path).stat().st_size / 1024
+
+    logger.info(
+        "Normalizing %s descriptions (%s distinct, cache %.0f KiB):\n%s",
+        args.rows,
+        descriptions.nunique(),
+        cache_kb,
+        pd.DataFrame(results).round(3).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark exporting a report with many months using several processes.
+
+The report of a long history is exported to one Excel workbook per
+sheet, written one after another and by a pool of processes. Wall-clock
+time should fall with the number of workers up to the number of cores.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_parallel_export.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from synthetic_data import make_budget, make_expense_log
+
+from expense_tracker import ExpenseTracker
+from utils.file_helper import setup_logging
+
+
+def main() -> None:
+    """Run the benchmark and log a table of timings per worker count."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args()
+    logger = setup_logging()
+    budget = make_budget()
+    tracker = ExpenseTracker.from_frames(
+        make_expense_log(budget, args.rows, years=args.years), budget
+    )
+    # Build the reports once so only the export is timed
+    tracker.append_totals_rows()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for max_workers in args.workers:
+            start = time.perf_counter()
+            file_paths = tracker.export_report(
+                str(Path(tmp_dir) / f"workers_{max_workers}"),
+                max_workers=max_workers,
+            )
+            results.append({
+                "workers": max_workers,
+                "files": len(file_paths),
+                "time_s": round(time.perf_counter() - start, 3),
+            })
+
+    logger.info(
+        "Exporting %s expense rows over %s years (%s cores):\n%s",
+        args.rows,
+        args.years,
+        os.cpu_count(),
+        pd.DataFrame(results).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark exporting a large expense log with each report exporter.
+
+The expense log is written to one file per backend, and the write time
+and file size are compared. The Parquet exporter is skipped when neither
+pyarrow nor fastparquet is installed.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_report_exporters.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from synthetic_data import make_budget, make_expense_log
+
+from report_exporters.registry import EXPORTERS, get_exporter
+from utils.file_helper import setup_logging
+
+
+def main() -> None:
+    """Run the benchmark and log a table of write time per exporter."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+    sheets = {"Expense Log": make_expense_log(make_budget(), args.rows)}
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for report_format in EXPORTERS:
+            try:
+                exporter = get_exporter(report_format)
+            except ImportError as e:
+                logger.warning("Skipping %s: %s", report_format, e)
+                continue
+
+            start = time.perf_counter()
+            (file_path,) = exporter.export(
+                sheets, str(Path(tmp_dir) / report_format)
+            )
+            results.append({
+                "format": report_format,
+                "time_s": round(time.perf_counter() - start, 3),
+                "size_mb": round(file_path.stat().st_size / 2**20, 1),
+            })
+
+    logger.info(
+        "Exporting %s expense rows:\n%s",
+        args.rows,
+        pd.DataFrame(results).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
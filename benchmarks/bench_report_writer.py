@@ -0,0 +1,94 @@
+"""
+Benchmark writing a large expense log to an Excel report.
+
+The sheet is written with `convert_dfs_to_workbook` followed by
+`worksheet.autofit()` (the original method), and with
+`write_excel_report`, which streams rows in xlsxwriter's constant memory
+mode. Peak memory is measured with tracemalloc.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_report_writer.py --rows 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from bench_streaming_memory import measure
+from reference_reports import convert_dfs_to_workbook
+from synthetic_data import make_budget, make_expense_log
+
+from utils.data_helper import convert_datetime_to_str
+from utils.file_helper import setup_logging, write_excel_report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def write_with_autofit(expense_log: pd.DataFrame, file_path: Path) -> None:
+    """
+    Write the expense log with the original `to_excel` and autofit method.
+
+    Parameters
+    ----------
+    expense_log : pd.DataFrame
+        The expense log.
+    file_path : Path
+        The path of the Excel file.
+
+    """
+    workbook = convert_dfs_to_workbook(
+        [convert_datetime_to_str(expense_log)],
+        str(file_path),
+        ["Expense Log"],
+    )
+    for worksheet in workbook.worksheets():
+        worksheet.autofit()
+    workbook.close()
+
+
+def main() -> None:
+    """Run the benchmark and log a table of peak memory per writer."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+    expense_log = make_expense_log(make_budget(), args.rows)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, write in (
+            ("to_excel + autofit", write_with_autofit),
+            (
+                "write_excel_report",
+                lambda df, path: write_excel_report(
+                    [df], str(path), ["Expense Log"]
+                ),
+            ),
+        ):
+            file_path = Path(tmp_dir) / "report.xlsx"
+
+            def run(
+                write: Callable[[pd.DataFrame, Path], None] = write,
+                file_path: Path = file_path,
+            ) -> pd.DataFrame:
+                write(expense_log, file_path)
+                return expense_log
+
+            # Peak memory is compared with the size of the expense log
+            results.append({"writer": name, **measure(run)})
+
+    logger.info(
+        "Writing %s expense rows:\n%s",
+        args.rows,
+        pd.DataFrame(results).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark the single-pass totals rollup against the per-month helpers.
+
+The original method appends the grand total and the category totals of
+each month with `append_totals_row` and `append_category_totals`, then
+reorders the rows with `place_totals_rows`, which loops over every
+category. `build_rollup_report` computes the totals of every month in one
+grouped pass and orders the rows with a single sort.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_rollup_report.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+from reference_reports import (
+    append_category_totals,
+    append_totals_row,
+    place_totals_rows,
+)
+from synthetic_data import make_budget, make_expense_log
+
+from expense_tracker import ExpenseTracker
+from utils.data_helper import (
+    build_rollup_report,
+    build_split_report,
+    fill_missing_budget_lines,
+)
+from utils.file_helper import setup_logging
+
+
+def per_month_rollup_report(
+    split_report: list[pd.DataFrame, ...],
+) -> list[pd.DataFrame, ...]:
+    """
+    Add totals rows to each month with the original helpers.
+
+    Parameters
+    ----------
+    split_report : list[pd.DataFrame, ...]
+        The monthly reports.
+
+    Returns
+    -------
+    list[pd.DataFrame, ...]
+        The monthly reports with totals rows in place.
+
+    """
+    return [
+        place_totals_rows(append_category_totals(append_totals_row(month)))
+        for month in split_report
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and log a table of timings per history length."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--rows-per-year", type=int, default=20_000)
+    parser.add_argument("--categories", type=int, default=50)
+    args = parser.parse_args()
+    logger = setup_logging()
+    budget = make_budget(n_categories=args.categories)
+
+    results = []
+    for years in args.years:
+        tracker = ExpenseTracker.from_frames(
+            make_expense_log(
+                budget, args.rows_per_year * years, years=years
+            ),
+            budget,
+        )
+        grouped_report = tracker.create_grouped_report()
+        validated_budget = tracker.get_budget()
+
+        start = time.perf_counter()
+        expected = per_month_rollup_report(
+            build_split_report(grouped_report, validated_budget)
+        )
+        per_month = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = build_rollup_report(
+            fill_missing_budget_lines(grouped_report, validated_budget)
+        )
+        single_pass = time.perf_counter() - start
+
+        assert len(result) == len(expected)
+        for result_month, expected_month in zip(result, expected):
+            pd.testing.assert_frame_equal(result_month, expected_month)
+        results.append({
+            "months": len(result),
+            "budget_lines": len(validated_budget),
+            "per_month_s": round(per_month, 3),
+            "single_pass_s": round(single_pass, 3),
+            "speedup": round(per_month / single_pass, 1),
+        })
+
+    logger.info(
+        "Totals rollup:\n%s", pd.DataFrame(results).to_string(index=False)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark cold and warm starts of ExpenseTracker with the sidecar cache.
+
+A scaled-up copy of the example input sheet is loaded once with an empty
+cache directory (cold start, parsed from Excel and validated) and then
+again with the populated cache (warm start, read from the cache).
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_sidecar_cache.py --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+from bench_excel_engines import BUDGET_SHEET, EXPENSE_SHEET, build_workbook
+
+from expense_tracker import ExpenseTracker
+from utils.cache_helper import cache_format
+from utils.file_helper import setup_logging
+
+
+def main() -> None:
+    """Run the benchmark and log the cold and warm start times."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook_path = Path(tmp_dir) / "scaled_expense_log.xlsx"
+        build_workbook(workbook_path, args.rows)
+
+        for start in ("cold", "warm"):
+            tracker = ExpenseTracker(
+                excel_path=str(workbook_path),
+                expense_sheet=EXPENSE_SHEET,
+                budget_sheet=BUDGET_SHEET,
+                cache_dir=str(Path(tmp_dir) / "cache"),
+            )
+            results.append({
+                "start": start,
+                "cache_hit": tracker.cache_hit,
+                "load_s": round(tracker.timings["load"], 3),
+            })
+
+    results_df = pd.DataFrame(results)
+    speedup = results_df["load_s"].iloc[0] / results_df["load_s"].iloc[1]
+    logger.info(
+        "Loading %s expense rows (cache format: %s, speedup: %.1fx):\n%s",
+        args.rows,
+        cache_format(),
+        speedup,
+        results_df.to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
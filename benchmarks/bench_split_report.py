@@ -0,0 +1,106 @@
+"""
+Benchmark the single-pass split report against the per-month one.
+
+The original method masks the grouped report once per month and fills
+the missing budget lines of each month separately with
+`fill_missing_expenses`. `build_split_report` fills the missing lines of
+all months with one cross join and anti-join, and splits the report in a
+single groupby.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_split_report.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+from reference_reports import fill_missing_expenses
+from synthetic_data import make_budget, make_expense_log
+
+from expense_tracker import ExpenseTracker
+from utils.data_helper import MONTHLY_REPORT_COLUMNS, build_split_report
+from utils.file_helper import setup_logging
+
+
+def per_month_split_report(
+    grouped_report: pd.DataFrame,
+    budget: pd.DataFrame,
+) -> list[pd.DataFrame, ...]:
+    """
+    Build the split report with the original per-month method.
+
+    Parameters
+    ----------
+    grouped_report : pd.DataFrame
+        The grouped report.
+    budget : pd.DataFrame
+        The validated budget.
+
+    Returns
+    -------
+    list[pd.DataFrame, ...]
+        The monthly reports in chronological order.
+
+    """
+    monthly_report = grouped_report[MONTHLY_REPORT_COLUMNS]
+    return [
+        fill_missing_expenses(
+            monthly_report[monthly_report["month"] == month],
+            budget,
+            month,
+        ).sort_values(by=["category", "subcategory"])
+        for month in monthly_report["month"].unique()
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and log a table of timings per history length."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--rows-per-year", type=int, default=20_000)
+    parser.add_argument("--categories", type=int, default=50)
+    args = parser.parse_args()
+    logger = setup_logging()
+    budget = make_budget(n_categories=args.categories)
+
+    results = []
+    for years in args.years:
+        tracker = ExpenseTracker.from_frames(
+            make_expense_log(
+                budget, args.rows_per_year * years, years=years
+            ),
+            budget,
+        )
+        grouped_report = tracker.create_grouped_report()
+        validated_budget = tracker.get_budget()
+
+        start = time.perf_counter()
+        expected = per_month_split_report(grouped_report, validated_budget)
+        per_month = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = build_split_report(grouped_report, validated_budget)
+        single_pass = time.perf_counter() - start
+
+        assert len(result) == len(expected)
+        for result_month, expected_month in zip(result, expected):
+            pd.testing.assert_frame_equal(result_month, expected_month)
+        results.append({
+            "months": len(result),
+            "budget_lines": len(validated_budget),
+            "per_month_s": round(per_month, 3),
+            "single_pass_s": round(single_pass, 3),
+            "speedup": round(per_month / single_pass, 1),
+        })
+
+    logger.info(
+        "Split report:\n%s", pd.DataFrame(results).to_string(index=False)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark identifying the bank of a statement against reading it whole.
+
+`detect_formatter` reads only the header and a few rows of a statement,
+so identifying or rejecting a large export costs the same as a small
+one. A full read with the formatter is timed for comparison.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_statement_detection.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from bench_formatter_ingest import make_export
+
+from transaction_formatters.formatter_registry import (
+    FORMATTERS,
+    detect_formatter,
+)
+from utils.file_helper import setup_logging
+
+
+def main() -> None:
+    """Run the benchmark and log a table of timings per bank."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for bank, formatter_cls in FORMATTERS.items():
+            file_path = Path(tmp_dir) / f"{bank}.csv"
+            make_export(formatter_cls, file_path, args.rows, years=10)
+
+            start = time.perf_counter()
+            assert detect_formatter(str(file_path)) is formatter_cls
+            detect = time.perf_counter() - start
+
+            start = time.perf_counter()
+            formatter_cls(str(file_path))
+            full_read = time.perf_counter() - start
+
+            results.append({
+                "bank": bank,
+                "detect_ms": round(detect * 1e3, 1),
+                "full_read_ms": round(full_read * 1e3, 1),
+            })
+
+    logger.info(
+        "Identifying statements of %s rows:\n%s",
+        args.rows,
+        pd.DataFrame(results).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark peak memory of loading a large expense log sheet.
+
+A scaled-up copy of the example input sheet is loaded with
+`pd.read_excel` followed by `validate_excel` (the default path), and with
+`stream_excel_sheet` (the chunked path). Peak memory is measured with
+tracemalloc and compared with the size of the final DataFrame.
+
+Run from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_streaming_memory.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from bench_excel_engines import EXPENSE_SHEET, build_workbook
+
+from utils.file_helper import load_yaml, setup_logging, stream_excel_sheet
+from utils.validation import validate_excel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PARENT_DIR = Path(__file__).resolve().parent.parent
+SCHEMA_PATH = PARENT_DIR / "configs" / "data_schema.yaml"
+
+
+def measure(load: Callable[[], pd.DataFrame]) -> dict:
+    """
+    Measure the peak traced memory and wall-clock time of a loader.
+
+    Parameters
+    ----------
+    load : Callable[[], pd.DataFrame]
+        Function returning the loaded DataFrame.
+
+    Returns
+    -------
+    dict
+        The peak memory, final DataFrame size (both in MB) and time.
+
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    loaded_df = load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    final_size = loaded_df.memory_usage(deep=True).sum()
+    return {
+        "peak_mb": round(peak / 1e6, 1),
+        "final_mb": round(final_size / 1e6, 1),
+        "peak_to_final": round(peak / final_size, 2),
+        "time_s": round(elapsed, 2),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and log a table of peak memory per loader."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+    logger = setup_logging()
+    schema = load_yaml(SCHEMA_PATH)["EXPENSE_LOG"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook_path = Path(tmp_dir) / "scaled_expense_log.xlsx"
+        build_workbook(workbook_path, args.rows)
+
+        results = [
+            {
+                "loader": "read_excel",
+                **measure(
+                    lambda: validate_excel(
+                        pd.read_excel(
+                            workbook_path, sheet_name=EXPENSE_SHEET
+                        ),
+                        schema,
+                    )
+                ),
+            },
+            {
+                "loader": f"stream (chunk_size={args.chunk_size})",
+                **measure(
+                    lambda: stream_excel_sheet(
+                        str(workbook_path),
+                        EXPENSE_SHEET,
+                        schema,
+                        chunk_size=args.chunk_size,
+                    )
+                ),
+            },
+        ]
+
+    logger.info(
+        "Loading %s expense rows:\n%s",
+        args.rows,
+        pd.DataFrame(results).to_string(index=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Reference implementations of reports replaced by faster code in src.
+
+The benchmarks time them as baselines, and the tests check that the
+replacements give the same results. `build_rollup_report` replaced
+`append_totals_row`, `append_category_totals` and `place_totals_rows`,
+`fill_missing_budget_lines` replaced `fill_missing_expenses`, and
+`write_excel_report` replaced `convert_dfs_to_workbook` and
+`bold_totals`.
+"""
+
+from __future__ import annotations
+
+from calendar import month_name
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import xlsxwriter
+
+
+def append_totals_row(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Append an overall totals row to a DataFrame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame to which the totals row will be appended.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with the totals row appended.
+
+    """
+    totals = pd.DataFrame({
+        "category": ["Total"],
+        "subcategory": [None],
+        "month": [None],
+        "total_amount_spent": [df["total_amount_spent"].sum()],
+        "amount_budgeted": [df["amount_budgeted"].sum()],
+        "difference": [df["difference"].sum()],
+    })
+    # "Total" is not one of the budget's categories and has no month, so
+    # label columns are stored as plain objects once it is appended
+    label_cols = df.select_dtypes(exclude=["number", "object"]).columns
+    return pd.concat(
+        [df.astype(dict.fromkeys(label_cols, object)), totals],
+        ignore_index=True,
+    )
+
+
+def append_category_totals(expense_report: pd.DataFrame) -> pd.DataFrame:
+    """
+    Append category totals to a DataFrame.
+
+    Parameters
+    ----------
+    expense_report : pd.DataFrame
+        The DataFrame to which the category totals will be appended.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with the category totals appended.
+
+    """
+    # Calculate category totals. Only observed categories are kept so
+    # categorical columns do not produce empty rows.
+    category_totals = (
+        expense_report.groupby(["category"], observed=True)[
+            ["amount_budgeted", "total_amount_spent"]
+        ]
+        .sum()
+        .reset_index()
+    )
+    # Drop overall total
+    category_totals = category_totals[
+        category_totals["category"] != "Total"
+    ]
+    category_totals["subcategory"] = "Total"
+    category_totals["month"] = None
+    category_totals["difference"] = (
+        category_totals["amount_budgeted"]
+        - category_totals["total_amount_spent"]
+    )
+    # Append category totals to the expense report
+    return pd.concat([expense_report, category_totals], ignore_index=True)
+
+
+def place_totals_rows(expense_report: pd.DataFrame) -> pd.DataFrame:
+    """
+    Place totals rows in the expense report in their correct locations.
+    Category totals are placed below their respective categories,
+    and an overall total is placed at the end.
+
+    Parameters
+    ----------
+    expense_report : pd.DataFrame
+        The expense report with totals rows unordered.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with the totals rows in their correct locations.
+
+    """
+    # Identify category total rows
+    category_totals = expense_report[
+        expense_report["subcategory"] == "Total"
+    ]
+
+    # Identify overall total row
+    overall_total = expense_report[expense_report["category"] == "Total"]
+
+    # Identify non-total rows
+    non_totals = expense_report[
+        ~(
+            (expense_report["subcategory"] == "Total")
+            | (expense_report["category"] == "Total")
+        )
+    ]
+
+    # Create separate DataFrames for each category
+    category_dfs = []
+    category_list = category_totals["category"].unique()
+
+    for cat in category_list:
+        # Filter rows for the current category
+        cat_df = non_totals[(non_totals["category"] == cat)]
+        cat_total = category_totals[category_totals["category"] == cat]
+
+        # Append the category total row to the DataFrame
+        cat_df = pd.concat([cat_df, cat_total], ignore_index=True)
+        category_dfs.append(cat_df)
+
+    # Concatenate all category DataFrames
+    sorted_report = pd.concat(category_dfs, ignore_index=True)
+
+    # Append overall total at the end
+    sorted_report = pd.concat([sorted_report, overall_total])
+
+    return sorted_report.reset_index(drop=True)
+
+
+def fill_missing_expenses(
+    expense_report: pd.DataFrame,
+    budget: pd.DataFrame,
+    month: str,
+) -> pd.DataFrame:
+    """
+    Fill budgeted expenses with no transactions attached to them.
+
+    Parameters
+    ----------
+    expense_report : pd.DataFrame
+        The expense report for a given month.
+    budget : pd.DataFrame
+        The DataFrame containing the budget for a given month.
+    month : str
+        The month corresponding to the expense report and budget.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with missing expenses filled in.
+
+    """
+    # Find categories and subcategories that are in the budget
+    # but not in the expense log
+    missing_expenses = budget[
+        ~budget.set_index(["category", "subcategory"]).index.isin(
+            expense_report.set_index(["category", "subcategory"]).index
+        )
+    ]
+    # Create a new DataFrame with the missing expenses
+    missing_expenses = pd.DataFrame({
+        "category": missing_expenses["category"],
+        "subcategory": missing_expenses["subcategory"],
+        "month": month,
+        "total_amount_spent": [0] * len(missing_expenses),
+        "amount_budgeted": missing_expenses["amount_budgeted"],
+        "difference": missing_expenses["amount_budgeted"],
+    })
+
+    # Append the missing expenses to the expense report
+    return pd.concat([expense_report, missing_expenses], ignore_index=True)
+
+
+def convert_dfs_to_workbook(
+    df_list: list[pd.DataFrame, ...],
+    file_path: str,
+    sheet_names: list[str],
+) -> xlsxwriter.Workbook:
+    """
+    Convert a list of DataFrames to an xlsxwriter Workbook.
+
+    Parameters
+    ----------
+    df_list : list[pd.DataFrame, ...]
+        A list of DataFrames to be written to the Excel file.
+    file_path : str
+        The path for the Excel file to be created.
+    sheet_names : list[str]
+        A list of sheet names corresponding to each DataFrame in the tuple.
+
+    Returns
+    -------
+    xlsx.Workbook
+        A Workbook object containing the DataFrames as sheets.
+
+    """
+    writer = pd.ExcelWriter(file_path, engine="xlsxwriter")
+
+    for df, sheet_name in zip(df_list, sheet_names):
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    return writer.book
+
+
+def bold_totals(
+    report_wb: xlsxwriter.Workbook,
+    sheet_names: list[str] | None = None,
+) -> xlsxwriter.Workbook:
+    """
+    Bold the total rows in the report Workbook.
+
+    Parameters
+    ----------
+    report_wb : xlsxwriter.Workbook
+        The report Workbook containing the total rows.
+    sheet_names : list[str] | None, optional
+        The monthly report sheets, whose last row is a total row.
+        By default None, which uses the sheets named after a month.
+
+    Returns
+    -------
+    report_wb : xlsxwriter.Workbook
+        The report Workbook with bolded total rows.
+
+    """
+    if sheet_names is None:
+        sheet_names = list(month_name)
+
+    # Define a format for bold text
+    bold_format = report_wb.add_format({"bold": True})
+
+    # Iterate through all the sheets in the workbook
+    for sheet_name in report_wb.sheetnames:
+        worksheet = report_wb.get_worksheet_by_name(sheet_name)
+        # Apply bold format to monthly reports
+        if sheet_name in sheet_names:
+            # Get the number of rows in the worksheet
+            num_rows = worksheet.dim_rowmax
+            # Apply bold format to the last row (total row)
+            worksheet.set_row(num_rows, None, bold_format)
+
+    return report_wb
@@ -0,0 +1,85 @@
+"""Synthetic budgets and expense logs for benchmarks."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+PAYMENT_TYPES = ["Cash", "Checking", "Discover", "Venture"]
+
+
+def make_budget(
+    n_categories: int = 20,
+    n_subcategories: int = 10,
+) -> pd.DataFrame:
+    """
+    Build a budget with every category split into subcategories.
+
+    Parameters
+    ----------
+    n_categories : int, optional
+        Number of categories. By default 20.
+    n_subcategories : int, optional
+        Number of subcategories per category. By default 10.
+
+    Returns
+    -------
+    pd.DataFrame
+        A budget sheet with one row per (category, subcategory).
+
+    """
+    return pd.DataFrame({
+        "category": [
+            f"Category {i:02d}"
+            for i in range(n_categories)
+            for _ in range(n_subcategories)
+        ],
+        "subcategory": [
+            f"Subcategory {j:02d}"
+            for _ in range(n_categories)
+            for j in range(n_subcategories)
+        ],
+        "amount_budgeted": np.arange(n_categories * n_subcategories) + 1.0,
+    })
+
+
+def make_expense_log(
+    budget: pd.DataFrame,
+    rows: int,
+    start: str = "2020-01-01",
+    years: int = 5,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Build an expense log drawing random budget lines and dates.
+
+    Parameters
+    ----------
+    budget : pd.DataFrame
+        The budget whose (category, subcategory) pairs are used.
+    rows : int
+        Number of transactions.
+    start : str, optional
+        First date of the log. By default "2020-01-01".
+    years : int, optional
+        Number of years covered by the log. By default 5.
+    seed : int, optional
+        Seed of the random generator. By default 0.
+
+    Returns
+    -------
+    pd.DataFrame
+        An expense log sheet sorted by date.
+
+    """
+    rng = np.random.default_rng(seed)
+    lines = rng.integers(0, len(budget), rows)
+    days = np.sort(rng.integers(0, 365 * years, rows))
+    return pd.DataFrame({
+        "date": pd.Timestamp(start) + pd.to_timedelta(days, unit="D"),
+        "category": budget["category"].to_numpy()[lines],
+        "subcategory": budget["subcategory"].to_numpy()[lines],
+        "amount": rng.integers(100, 50_000, rows) / 100,
+        "payment_type": rng.choice(PAYMENT_TYPES, rows),
+        "note": "Synthetic transaction",
+    })
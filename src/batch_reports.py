@@ -0,0 +1,496 @@
+"""Command-line entry point building the reports of many workbooks."""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from expense_tracker import ExpenseTracker
+from utils.file_helper import load_yaml, setup_logging
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# Stages of a report job, in the order they run
+STAGES = ("load", "report", "export")
+
+
+@dataclass(frozen=True)
+class ReportJob:
+    """
+    A workbook whose report is built by `run_batch`.
+
+    Parameters
+    ----------
+    excel_path : str
+        Path to the expense tracker excel file.
+    output_path : str
+        The file or directory the report is exported to.
+    expense_sheet : str, optional
+        Name of the sheet containing the expense log.
+        By default "EXPENSE_LOG".
+    budget_sheet : str, optional
+        Name of the sheet containing the budgeted amounts per category.
+        By default "BUDGET".
+    report_format : str, optional
+        The format of the report. See
+        `report_exporters.registry.get_exporter`. By default "excel".
+
+    """
+
+    excel_path: str
+    output_path: str
+    expense_sheet: str = "EXPENSE_LOG"
+    budget_sheet: str = "BUDGET"
+    report_format: str = "excel"
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """
+    The outcome of a report job.
+
+    Parameters
+    ----------
+    job : ReportJob
+        The job.
+    timings : dict[str, float]
+        The time, in seconds, of each stage that ran.
+    error : str | None, optional
+        The error that stopped the job, or None if it succeeded.
+        By default None.
+
+    """
+
+    job: ReportJob
+    timings: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+
+def output_path_for(
+    excel_path: str,
+    output_dir: str | None = None,
+    report_format: str = "excel",
+) -> str:
+    """
+    Return the default output path of the report of a workbook.
+
+    Parameters
+    ----------
+    excel_path : str
+        Path to the expense tracker excel file.
+    output_dir : str | None, optional
+        Directory the reports are written to. By default None, which
+        writes each report next to its workbook.
+    report_format : str, optional
+        The format of the report. By default "excel".
+
+    Returns
+    -------
+    str
+        "<workbook name>_report.xlsx" for Excel reports, which hold every
+        sheet in one file, and a "<workbook name>_report" directory of
+        sheet files for the other formats.
+
+    """
+    excel_path = Path(excel_path)
+    output_dir = Path(output_dir) if output_dir else excel_path.parent
+    suffix = ".xlsx" if report_format == "excel" else ""
+    return str(output_dir / f"{excel_path.stem}_report{suffix}")
+
+
+def jobs_from_patterns(
+    patterns: list[str],
+    output_dir: str | None = None,
+    **job_options: str,
+) -> list[ReportJob]:
+    """
+    Create a report job for every workbook matching glob patterns.
+
+    Parameters
+    ----------
+    patterns : list[str]
+        Glob patterns of the workbooks. "**" matches any number of
+        directories.
+    output_dir : str | None, optional
+        Directory the reports are written to. By default None, which
+        writes each report next to its workbook.
+    **job_options : str
+        Sheet names and report format shared by every job. See
+        `ReportJob`.
+
+    Returns
+    -------
+    list[ReportJob]
+        One job per matching workbook, sorted by path.
+
+    """
+    excel_paths = sorted({
+        excel_path
+        for pattern in patterns
+        for excel_path in glob.glob(pattern, recursive=True)  # noqa: PTH207
+    })
+    report_format = job_options.get("report_format", "excel")
+    return [
+        ReportJob(
+            excel_path=excel_path,
+            output_path=output_path_for(
+                excel_path, output_dir, report_format
+            ),
+            **job_options,
+        )
+        for excel_path in excel_paths
+    ]
+
+
+def load_manifest(
+    manifest_path: str,
+    output_dir: str | None = None,
+    **job_options: str,
+) -> list[ReportJob]:
+    """
+    Load report jobs from a YAML manifest.
+
+    The manifest is a list of workbooks, each either a path or a mapping
+    with an "excel_path" and any other field of `ReportJob`. Relative
+    paths are resolved against the directory of the manifest.
+
+    Parameters
+    ----------
+    manifest_path : str
+        Path to the YAML manifest.
+    output_dir : str | None, optional
+        Directory the reports are written to when a workbook has no
+        "output_path". By default None, which writes each report next to
+        its workbook.
+    **job_options : str
+        Default sheet names and report format of the workbooks. See
+        `ReportJob`.
+
+    Returns
+    -------
+    list[ReportJob]
+        One job per workbook, in manifest order.
+
+    """
+    base_dir = Path(manifest_path).resolve().parent
+    jobs = []
+    for entry in load_yaml(manifest_path) or []:
+        options = {
+            **job_options,
+            **(
+                entry if isinstance(entry, dict) else {"excel_path": entry}
+            ),
+        }
+        for key in ("excel_path", "output_path"):
+            if key in options:
+                options[key] = str(base_dir / options[key])
+        options.setdefault(
+            "output_path",
+            output_path_for(
+                options["excel_path"],
+                output_dir,
+                options.get("report_format", "excel"),
+            ),
+        )
+        jobs.append(ReportJob(**options))
+    return jobs
+
+
+def run_job(
+    job: ReportJob,
+    engine: str | None = None,
+    cache_dir: str | None = None,
+) -> JobResult:
+    """
+    Build and export the report of a workbook, timing each stage.
+
+    Errors are recorded in the result rather than raised, so that one
+    invalid workbook does not stop the others.
+
+    Parameters
+    ----------
+    job : ReportJob
+        The job.
+    engine : str | None, optional
+        Engine used to parse the workbook. By default None.
+    cache_dir : str | None, optional
+        Directory in which validated sheets are cached between runs.
+        By default None, which disables caching.
+
+    Returns
+    -------
+    JobResult
+        The time of each stage that ran, and the error if one was raised.
+
+    """
+    timings = {}
+    stage = STAGES[0]
+    try:
+        start = time.perf_counter()
+        tracker = ExpenseTracker(
+            excel_path=job.excel_path,
+            expense_sheet=job.expense_sheet,
+            budget_sheet=job.budget_sheet,
+            engine=engine,
+            cache_dir=cache_dir,
+        )
+        timings[stage] = time.perf_counter() - start
+
+        stage = STAGES[1]
+        start = time.perf_counter()
+        tracker.append_totals_rows()
+        timings[stage] = time.perf_counter() - start
+
+        stage = STAGES[2]
+        start = time.perf_counter()
+        tracker.export_report(job.output_path, job.report_format)
+        timings[stage] = time.perf_counter() - start
+    except Exception as e:  # noqa: BLE001
+        return JobResult(
+            job, timings, f"{stage} failed: {type(e).__name__}: {e}"
+        )
+    return JobResult(job, timings)
+
+
+def run_batch(
+    jobs: list[ReportJob],
+    max_workers: int | None = None,
+    engine: str | None = None,
+    cache_dir: str | None = None,
+) -> list[JobResult]:
+    """
+    Run report jobs concurrently in a pool of processes.
+
+    A worker process that dies, e.g. killed for using too much memory,
+    breaks the pool and every job it had not finished. Those jobs are run
+    again, each in a process of its own, so that only the job killing
+    its process fails.
+
+    Parameters
+    ----------
+    jobs : list[ReportJob]
+        The jobs.
+    max_workers : int | None, optional
+        Number of processes running jobs. 1 runs the jobs one after
+        another in this process. By default None, which uses one process
+        per CPU.
+    engine : str | None, optional
+        Engine used to parse the workbooks. By default None.
+    cache_dir : str | None, optional
+        Directory in which validated sheets are cached between runs.
+        By default None, which disables caching.
+
+    Returns
+    -------
+    list[JobResult]
+        The result of each job, in job order.
+
+    """
+    if max_workers == 1:
+        return [run_job(job, engine, cache_dir) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(run_job, job, engine, cache_dir)
+            for job in jobs
+        ]
+        results = list(map(_future_result, jobs, futures))
+
+    broken = [
+        i
+        for i, future in enumerate(futures)
+        if isinstance(future.exception(), BrokenProcessPool)
+    ]
+    if broken:
+        logger = setup_logging()
+        logger.warning(
+            "A worker process died, running %s unfinished jobs again",
+            len(broken),
+        )
+    for i in broken:
+        results[i] = _run_isolated(jobs[i], engine, cache_dir)
+    return results
+
+
+def _run_isolated(
+    job: ReportJob,
+    engine: str | None = None,
+    cache_dir: str | None = None,
+) -> JobResult:
+    """
+    Run a report job in a process of its own.
+
+    Parameters
+    ----------
+    job : ReportJob
+        The job.
+    engine : str | None, optional
+        Engine used to parse the workbook. By default None.
+    cache_dir : str | None, optional
+        Directory in which validated sheets are cached between runs.
+        By default None, which disables caching.
+
+    Returns
+    -------
+    JobResult
+        The result of the job, or a failed result if its process died.
+
+    """
+    with ProcessPoolExecutor(1) as executor:
+        return _future_result(
+            job, executor.submit(run_job, job, engine, cache_dir)
+        )
+
+
+def _future_result(job: ReportJob, future: Future) -> JobResult:
+    """
+    Wait for the result of a report job run by a worker process.
+
+    Parameters
+    ----------
+    job : ReportJob
+        The job.
+    future : Future
+        The future of `run_job` for the job.
+
+    Returns
+    -------
+    JobResult
+        The result of the job, or a failed result if the worker process
+        itself failed, e.g. because it was killed.
+
+    """
+    try:
+        return future.result()
+    except Exception as e:  # noqa: BLE001
+        return JobResult(job, error=f"{type(e).__name__}: {e}")
+
+
+def summarize_results(results: list[JobResult]) -> pd.DataFrame:
+    """
+    Summarize the timings of report jobs per file and per stage.
+
+    Parameters
+    ----------
+    results : list[JobResult]
+        The results of the jobs.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per workbook with its status and the seconds spent in
+        each stage, followed by a "Total" row summing the stages over
+        every workbook.
+
+    """
+    summary = pd.DataFrame(
+        [
+            {
+                "workbook": result.job.excel_path,
+                "status": "failed" if result.error else "ok",
+                **{
+                    f"{stage}_s": result.timings.get(stage, 0.0)
+                    for stage in STAGES
+                },
+            }
+            for result in results
+        ],
+        columns=[
+            "workbook",
+            "status",
+            *(f"{stage}_s" for stage in STAGES),
+        ],
+    )
+    summary["total_s"] = summary.filter(like="_s").sum(axis=1)
+    totals = summary.filter(like="_s").sum().to_frame().T
+    totals.insert(0, "workbook", "Total")
+    totals.insert(1, "status", f"{(summary['status'] == 'ok').sum()} ok")
+    return pd.concat([summary, totals], ignore_index=True).round(3)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Build the reports of many workbooks from the command line.
+
+    Parameters
+    ----------
+    argv : list[str] | None, optional
+        The command-line arguments. By default None, which reads them
+        from `sys.argv`.
+
+    Returns
+    -------
+    int
+        The exit code: 0 if every report was built, 1 otherwise.
+
+    """
+    parser = argparse.ArgumentParser(
+        description="Build the expense reports of many workbooks."
+    )
+    parser.add_argument(
+        "workbooks",
+        nargs="*",
+        help='Glob patterns of the workbooks, e.g. "households/*.xlsx".',
+    )
+    parser.add_argument(
+        "--manifest", help="YAML list of workbooks and their sheets."
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Directory of the reports. By default next to each workbook.",
+    )
+    parser.add_argument("--expense-sheet", default="EXPENSE_LOG")
+    parser.add_argument("--budget-sheet", default="BUDGET")
+    parser.add_argument("--format", default="excel", dest="report_format")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes. By default one per CPU.",
+    )
+    parser.add_argument("--engine", help="Engine used to parse workbooks.")
+    parser.add_argument("--cache-dir", help="Cache of validated sheets.")
+    args = parser.parse_args(argv)
+    if not args.workbooks and not args.manifest:
+        parser.error("give workbook patterns or a --manifest")
+    logger = setup_logging()
+
+    job_options = {
+        "expense_sheet": args.expense_sheet,
+        "budget_sheet": args.budget_sheet,
+        "report_format": args.report_format,
+    }
+    jobs = jobs_from_patterns(
+        args.workbooks, args.output_dir, **job_options
+    )
+    if args.manifest:
+        jobs += load_manifest(
+            args.manifest, args.output_dir, **job_options
+        )
+
+    start = time.perf_counter()
+    results = run_batch(jobs, args.workers, args.engine, args.cache_dir)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result.error:
+            logger.error("%s: %s", result.job.excel_path, result.error)
+    logger.info(
+        "Built %s reports in %.3f s:\n%s",
+        len(results),
+        elapsed,
+        summarize_results(results).to_string(index=False),
+    )
+    return int(any(result.error for result in results))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""Base transaction categorizer object."""
+
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from utils.file_helper import setup_logging
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class BaseCategorizer(ABC):
+    """
+    Base class for transaction categorizers.
+
+    Subclasses implement `_predict`, which assigns a budget category and
+    subcategory to each transaction note, and `targets`, which lists the
+    categories it can assign.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the BaseCategorizer object."""
+        self.log = setup_logging()
+        self.timings = {}
+
+    def categorize(
+        self,
+        expense_log: pd.DataFrame,
+        *,
+        overwrite: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Fill the category and subcategory of transactions from their note.
+
+        The expense log is not modified.
+
+        Parameters
+        ----------
+        expense_log : pd.DataFrame
+            The expense log, e.g. formatted transaction logs.
+        overwrite : bool, optional
+            Whether to replace categories already filled in. By default
+            False, which only categorizes transactions whose category is
+            blank.
+
+        Returns
+        -------
+        pd.DataFrame
+            A copy of the expense log with the category and subcategory
+            of categorized transactions filled in. Transactions that
+            cannot be categorized are left unchanged.
+
+        """
+        start = time.perf_counter()
+        categories = self._predict(expense_log["note"])
+        self.timings["predict_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = categories["category"].ne("").to_numpy()
+        if not overwrite:
+            category = expense_log["category"]
+            found &= (category.isna() | category.eq("")).to_numpy()
+        result = expense_log.copy(deep=False)
+        for col in ("category", "subcategory"):
+            result[col] = np.where(
+                found,
+                categories[col].to_numpy(),
+                expense_log[col].to_numpy(dtype=object),
+            )
+        self.timings["assign_s"] = time.perf_counter() - start
+
+        self.log.info(
+            "Categorized %s of %s transactions", found.sum(), len(found)
+        )
+        return result
+
+    def validate_targets(self, budget: pd.DataFrame) -> None:
+        """
+        Check that every category the categorizer assigns is budgeted.
+
+        Parameters
+        ----------
+        budget : pd.DataFrame
+            The budget, with "category" and "subcategory" columns.
+
+        Raises
+        ------
+        ValueError
+            If a target is not a budget line.
+
+        """
+        budget_lines = set(
+            zip(
+                budget["category"].astype(str),
+                budget["subcategory"].astype(str),
+            )
+        )
+        unknown = [
+            f"{category} / {subcategory}"
+            for category, subcategory in self.targets()
+            if (category, subcategory) not in budget_lines
+        ]
+        if unknown:
+            msg = (
+                "Categorization targets missing from the budget: "
+                f"{', '.join(unknown)}"
+            )
+            raise ValueError(msg)
+
+    @abstractmethod
+    def targets(self) -> list[tuple[str, str]]:
+        """
+        Return the (category, subcategory) pairs the categorizer assigns.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The (category, subcategory) pairs.
+
+        """
+
+    @abstractmethod
+    def _predict(self, notes: pd.Series) -> pd.DataFrame:
+        """
+        Assign a category and subcategory to transaction notes.
+
+        Parameters
+        ----------
+        notes : pd.Series
+            The note of each transaction.
+
+        Returns
+        -------
+        pd.DataFrame
+            The "category" and "subcategory" of each note, aligned with
+            it. Both are blank for notes that cannot be categorized.
+
+        """
@@ -0,0 +1,504 @@
+"""Transaction categorizer learned from a categorized expense log."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from categorizers.base_categorizer import BaseCategorizer
+
+# Number of buckets the note tokens are hashed into
+DEFAULT_N_FEATURES = 2**16
+# Predictions less likely than this are left uncategorized
+DEFAULT_MIN_CONFIDENCE = 0.5
+# Words of a note, once uppercased. Digits such as store numbers and
+# single letters are not tokens.
+WORD_PATTERN = r"[A-Z][A-Z&']+"
+
+
+def hash_tokens(
+    notes: pd.Series, n_features: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split notes into tokens and hash each token into a feature bucket.
+
+    Tokens are hashed with `pd.util.hash_array`, which does not depend on
+    the Python process, so features are the same across runs.
+
+    Parameters
+    ----------
+    notes : pd.Series
+        The notes.
+    n_features : int
+        The number of feature buckets.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The position of the note of each token, in ascending order, and
+        the feature bucket of each token.
+
+    """
+    tokens = (
+        notes.reset_index(drop=True)
+        .str.upper()
+        .str.findall(WORD_PATTERN)
+        .explode()
+        .dropna()
+    )
+    features = pd.util.hash_array(
+        tokens.to_numpy(dtype=object)
+    ) % np.uint64(n_features)
+    return (
+        tokens.index.to_numpy(dtype=np.intp),
+        features.astype(np.intp),
+    )
+
+
+class NaiveBayesCategorizer(BaseCategorizer):
+    """
+    Categorizes transactions with a naive Bayes model of their notes.
+
+    The model counts the hashed tokens of the notes of each budget line
+    (category and subcategory) in a categorized expense log, and predicts
+    the most likely budget line of a note from its tokens. Counts add up,
+    so `partial_fit` updates the model with new transactions without
+    refitting, and gives the same model as fitting all of them at once.
+
+    Parameters
+    ----------
+    n_features : int, optional
+        The number of buckets the note tokens are hashed into. By default
+        `DEFAULT_N_FEATURES`.
+    alpha : float, optional
+        The additive smoothing of the token counts. By default 1.0.
+    min_confidence : float, optional
+        Transactions whose most likely budget line has a lower
+        probability are left uncategorized by `categorize`. By default
+        `DEFAULT_MIN_CONFIDENCE`.
+
+    """
+
+    def __init__(
+        self,
+        n_features: int = DEFAULT_N_FEATURES,
+        alpha: float = 1.0,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    ) -> None:
+        """
+        Initialize the NaiveBayesCategorizer object.
+
+        Parameters
+        ----------
+        n_features : int, optional
+            The number of buckets the note tokens are hashed into. By
+            default `DEFAULT_N_FEATURES`.
+        alpha : float, optional
+            The additive smoothing of the token counts. By default 1.0.
+        min_confidence : float, optional
+            The probability below which predictions are left out by
+            `categorize`. By default `DEFAULT_MIN_CONFIDENCE`.
+
+        """
+        super().__init__()
+        self.n_features = n_features
+        self.alpha = alpha
+        self.min_confidence = min_confidence
+        self.classes: list[tuple[str, str]] = []
+        self.class_counts = np.zeros(0, dtype=np.int64)
+        self.feature_counts = np.zeros((0, n_features), dtype=np.float64)
+        self._log_probs = None
+
+    def fit(self, expense_log: pd.DataFrame) -> NaiveBayesCategorizer:
+        """
+        Train the model from scratch on a categorized expense log.
+
+        Parameters
+        ----------
+        expense_log : pd.DataFrame
+            The expense log. Only transactions with a note and a category
+            are used.
+
+        Returns
+        -------
+        NaiveBayesCategorizer
+            The categorizer.
+
+        """
+        self.classes = []
+        self.class_counts = np.zeros(0, dtype=np.int64)
+        self.feature_counts = np.zeros(
+            (0, self.n_features), dtype=np.float64
+        )
+        return self.partial_fit(expense_log)
+
+    def partial_fit(
+        self, expense_log: pd.DataFrame
+    ) -> NaiveBayesCategorizer:
+        """
+        Add the transactions of a categorized expense log to the model.
+
+        Budget lines not seen before are added to the model.
+
+        Parameters
+        ----------
+        expense_log : pd.DataFrame
+            The new transactions. Only transactions with a note and a
+            category are used.
+
+        Returns
+        -------
+        NaiveBayesCategorizer
+            The categorizer.
+
+        """
+        start = time.perf_counter()
+        labeled = expense_log.loc[
+            expense_log["note"].notna()
+            & expense_log["note"].ne("")
+            & expense_log["category"].notna()
+            & expense_log["category"].ne(""),
+            ["category", "subcategory", "note"],
+        ]
+        category_codes, categories = pd.factorize(
+            labeled["category"].astype(str)
+        )
+        subcategory_codes, subcategories = pd.factorize(
+            labeled["subcategory"].fillna("").astype(str)
+        )
+        label_codes, label_keys = pd.factorize(
+            category_codes * len(subcategories) + subcategory_codes
+        )
+        labels = [
+            (
+                categories[key // len(subcategories)],
+                subcategories[key % len(subcategories)],
+            )
+            for key in label_keys
+        ]
+        class_idx = {label: i for i, label in enumerate(self.classes)}
+        new_classes = [label for label in labels if label not in class_idx]
+        if new_classes:
+            self._add_classes(new_classes)
+            class_idx = {label: i for i, label in enumerate(self.classes)}
+        label_classes = np.array(
+            [class_idx[label] for label in labels], dtype=np.intp
+        )
+
+        row_classes = label_classes[label_codes]
+        self._add_counts(labeled["note"], row_classes)
+        n_classes = len(self.classes)
+        self.class_counts += np.bincount(row_classes, minlength=n_classes)
+        self._log_probs = None
+        self.timings["fit_s"] = time.perf_counter() - start
+        self.log.info(
+            "Trained on %s transactions, %s budget lines",
+            len(labeled),
+            n_classes,
+        )
+        return self
+
+    def _add_counts(self, notes: pd.Series, classes: np.ndarray) -> None:
+        """
+        Add the tokens of labeled notes to the feature counts.
+
+        The tokens of each distinct (note, budget line) pair are counted
+        once, weighted by the number of transactions of the pair.
+
+        Parameters
+        ----------
+        notes : pd.Series
+            The note of each transaction.
+        classes : np.ndarray
+            The position of the budget line of each transaction in
+            `classes`.
+
+        """
+        n_classes = len(self.classes)
+        note_codes, uniques = pd.factorize(notes)
+        pairs, pair_counts = np.unique(
+            note_codes.astype(np.int64) * n_classes + classes,
+            return_counts=True,
+        )
+        pair_notes = pairs // max(n_classes, 1)
+
+        rows, features = hash_tokens(
+            pd.Series(uniques, dtype=object), self.n_features
+        )
+        note_lengths = np.bincount(rows, minlength=len(uniques))
+        note_starts = np.cumsum(note_lengths) - note_lengths
+        pair_lengths = note_lengths[pair_notes]
+        # Pair and position in `features` of each token of each pair
+        token_pairs = np.repeat(np.arange(len(pairs)), pair_lengths)
+        token_positions = (
+            np.repeat(note_starts[pair_notes], pair_lengths)
+            + np.arange(len(token_pairs))
+            - np.repeat(
+                np.cumsum(pair_lengths) - pair_lengths, pair_lengths
+            )
+        )
+        self.feature_counts += np.bincount(
+            pairs[token_pairs] % max(n_classes, 1) * self.n_features
+            + features[token_positions],
+            weights=pair_counts[token_pairs],
+            minlength=n_classes * self.n_features,
+        ).reshape(n_classes, self.n_features)
+
+    def _add_classes(self, new_classes: list[tuple[str, str]]) -> None:
+        """
+        Add budget lines with no transactions to the model.
+
+        Parameters
+        ----------
+        new_classes : list[tuple[str, str]]
+            The (category, subcategory) pairs to add.
+
+        """
+        self.classes = [*self.classes, *new_classes]
+        self.class_counts = np.concatenate([
+            self.class_counts,
+            np.zeros(len(new_classes), dtype=np.int64),
+        ])
+        self.feature_counts = np.vstack([
+            self.feature_counts,
+            np.zeros((len(new_classes), self.n_features)),
+        ])
+
+    def _log_probabilities(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the log probabilities of the model, computed once per fit.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The log prior of each budget line, and the smoothed log
+            likelihood of each feature bucket for each budget line.
+
+        Raises
+        ------
+        ValueError
+            If the model has not been trained.
+
+        """
+        if not self.classes:
+            msg = f"{type(self).__name__} has not been trained."
+            raise ValueError(msg)
+        if self._log_probs is None:
+            smoothed = self.feature_counts + self.alpha
+            self._log_probs = (
+                np.log(self.class_counts / self.class_counts.sum()),
+                np.log(smoothed)
+                - np.log(smoothed.sum(axis=1, keepdims=True)),
+            )
+        return self._log_probs
+
+    def predict(self, notes: pd.Series) -> pd.DataFrame:
+        """
+        Predict the most likely budget line of each note.
+
+        Each distinct note is scored once.
+
+        Parameters
+        ----------
+        notes : pd.Series
+            The note of each transaction.
+
+        Returns
+        -------
+        pd.DataFrame
+            The category, subcategory and probability ("confidence") of
+            the most likely budget line of each note. Notes that are
+            missing or have no token get "" and a confidence of 0.
+
+        """
+        # Fails before tokenizing when the model is not trained
+        self._log_probabilities()
+        start = time.perf_counter()
+        codes, uniques = pd.factorize(notes)
+        rows, features = hash_tokens(
+            pd.Series(uniques, dtype=object), self.n_features
+        )
+        self.timings["tokenize_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        best, confidence = self._score(rows, features, len(uniques))
+        # The last entry, for the missing notes, whose code is -1, is the
+        # empty budget line
+        unique_classes = np.append(best, -1)
+        unique_confidence = np.append(confidence, 0)
+        self.timings["score_s"] = time.perf_counter() - start
+
+        class_idx = unique_classes[codes]
+        return pd.DataFrame(
+            {
+                **{
+                    col: np.array(
+                        [label[i] for label in self.classes] + [""],
+                        dtype=object,
+                    )[class_idx]
+                    for i, col in enumerate(("category", "subcategory"))
+                },
+                "confidence": unique_confidence[codes],
+            },
+            index=notes.index,
+        )
+
+    def _score(
+        self, rows: np.ndarray, features: np.ndarray, n_notes: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the most likely budget line of hashed notes.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            The position of the note of each token. See `hash_tokens`.
+        features : np.ndarray
+            The feature bucket of each token.
+        n_notes : int
+            The number of notes.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The position in `classes` of the most likely budget line of
+            each note and its probability, -1 and 0 for notes without a
+            token.
+
+        """
+        log_prior, log_likelihood = self._log_probabilities()
+        # Sum the log likelihoods of the tokens of each note, one budget
+        # line at a time to keep memory proportional to the tokens
+        scores = np.empty((n_notes, len(self.classes)))
+        for i in range(len(self.classes)):
+            scores[:, i] = np.bincount(
+                rows,
+                weights=log_likelihood[i, features],
+                minlength=n_notes,
+            )
+        scores += log_prior
+        best = scores.argmax(axis=1)
+        best_scores = np.take_along_axis(scores, best[:, None], axis=1)
+        confidence = 1 / np.exp(scores - best_scores).sum(axis=1)
+        has_tokens = np.bincount(rows, minlength=n_notes) > 0
+        return (
+            np.where(has_tokens, best, -1),
+            np.where(has_tokens, confidence, 0),
+        )
+
+    def targets(self) -> list[tuple[str, str]]:
+        """
+        Return the (category, subcategory) pairs the model assigns.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The budget lines seen in training, in order of appearance.
+
+        """
+        return list(self.classes)
+
+    def save(self, model_path: str) -> None:
+        """
+        Save the model to a NumPy archive.
+
+        Only the non-zero token counts are stored. The archive holds no
+        pickled objects.
+
+        Parameters
+        ----------
+        model_path : str
+            The path of the archive. Missing parent directories are
+            created.
+
+        """
+        model_path = Path(model_path)
+        model_path.parent.mkdir(parents=True, exist_ok=True)
+        class_rows, feature_cols = np.nonzero(self.feature_counts)
+        with model_path.open("wb") as f:
+            np.savez(
+                f,
+                n_features=self.n_features,
+                alpha=self.alpha,
+                categories=np.array(
+                    [category for category, _ in self.classes], dtype=str
+                ),
+                subcategories=np.array(
+                    [subcategory for _, subcategory in self.classes],
+                    dtype=str,
+                ),
+                class_counts=self.class_counts,
+                class_rows=class_rows,
+                feature_cols=feature_cols,
+                feature_values=self.feature_counts[
+                    class_rows, feature_cols
+                ],
+            )
+        self.log.info("Saved categorization model to %s", model_path)
+
+    @classmethod
+    def load(
+        cls,
+        model_path: str,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    ) -> NaiveBayesCategorizer:
+        """
+        Load a model saved with `save`.
+
+        Parameters
+        ----------
+        model_path : str
+            The path of the archive.
+        min_confidence : float, optional
+            The probability below which predictions are left out by
+            `categorize`. By default `DEFAULT_MIN_CONFIDENCE`.
+
+        Returns
+        -------
+        NaiveBayesCategorizer
+            The categorizer, which can be trained further.
+
+        """
+        with np.load(model_path, allow_pickle=False) as archive:
+            categorizer = cls(
+                n_features=int(archive["n_features"]),
+                alpha=float(archive["alpha"]),
+                min_confidence=min_confidence,
+            )
+            categorizer._add_classes(
+                list(
+                    zip(
+                        archive["categories"].tolist(),
+                        archive["subcategories"].tolist(),
+                    )
+                )
+            )
+            categorizer.class_counts = archive["class_counts"]
+            categorizer.feature_counts[
+                archive["class_rows"], archive["feature_cols"]
+            ] = archive["feature_values"]
+        return categorizer
+
+    def _predict(self, notes: pd.Series) -> pd.DataFrame:
+        """
+        Assign the most likely budget line of each note, if confident.
+
+        Parameters
+        ----------
+        notes : pd.Series
+            The note of each transaction.
+
+        Returns
+        -------
+        pd.DataFrame
+            The prediction of `predict`, with "" as category and
+            subcategory where the confidence is below `min_confidence`.
+
+        """
+        predictions = self.predict(notes)
+        unsure = predictions["confidence"].to_numpy() < self.min_confidence
+        predictions.loc[unsure, ["category", "subcategory"]] = ""
+        return predictions
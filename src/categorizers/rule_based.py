@@ -0,0 +1,294 @@
+"""Transaction categorizer driven by a YAML rules file."""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from categorizers.base_categorizer import BaseCategorizer
+from utils.file_helper import load_yaml
+
+PARENT_DIR = Path(__file__).resolve().parent.parent.parent
+RULES_PATH = str(PARENT_DIR / "configs" / "categorization_rules.yaml")
+# Prefix of the group named after each rule in the combined matcher
+RULE_GROUP_PREFIX = "_rule"
+# Backreferences, e.g. "\1" or "(?P=name)", and global inline flags,
+# e.g. "(?i)", not escaped by a backslash. They cannot be combined with
+# the patterns and groups of other rules.
+BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?P=)")
+GLOBAL_FLAGS = re.compile(r"(?<!\\)(?:\\\\)*\(\?[aiLmsux]+\)")
+
+
+@dataclass(frozen=True)
+class CategorizationRule:
+    """
+    A rule assigning a budget line to the notes matching a pattern.
+
+    Parameters
+    ----------
+    name : str
+        The name of the rule.
+    pattern : str
+        The regular expression searched for in transaction notes.
+    category : str
+        The budget category assigned to matching transactions.
+    subcategory : str
+        The budget subcategory assigned to matching transactions.
+
+    """
+
+    name: str
+    pattern: str
+    category: str
+    subcategory: str
+
+
+def load_rules(rules_path: str) -> list[CategorizationRule]:
+    """
+    Load categorization rules from a YAML file.
+
+    Each rule has a "name", a "category", a "subcategory", and a list of
+    literal substrings under "contains", a regular expression under
+    "regex", or both. See `configs/categorization_rules.yaml`. Since
+    rules are combined into one pattern by `compile_rules`, regular
+    expressions cannot use backreferences, named groups or global inline
+    flags such as "(?i)". Scoped flags such as "(?i:...)" are allowed.
+
+    Parameters
+    ----------
+    rules_path : str
+        The path to the rules YAML file.
+
+    Returns
+    -------
+    list[CategorizationRule]
+        The rules, in file order, each with a single pattern matching any
+        of its substrings or its regular expression.
+
+    Raises
+    ------
+    ValueError
+        If a rule is missing a field, has no pattern, has an invalid
+        regular expression or one that cannot be combined with other
+        rules, or has the name of another rule.
+
+    """
+    rules = []
+    for entry in (load_yaml(rules_path) or {}).get("rules", []):
+        missing = {"name", "category", "subcategory"} - set(entry)
+        if missing:
+            msg = f"Rule {entry} is missing: {', '.join(sorted(missing))}"
+            raise ValueError(msg)
+        name = entry["name"]
+        alternatives = [re.escape(s) for s in entry.get("contains", [])]
+        if entry.get("regex"):
+            alternatives.append(entry["regex"])
+        if not alternatives:
+            msg = f"Rule {name} has neither 'contains' nor 'regex'."
+            raise ValueError(msg)
+        if name in {rule.name for rule in rules}:
+            msg = f"Duplicate rule name: {name}"
+            raise ValueError(msg)
+
+        pattern = "|".join(alternatives)
+        try:
+            compiled = re.compile(pattern)
+        except re.error as e:
+            msg = f"Invalid regex in rule {name}: {e}"
+            raise ValueError(msg) from e
+        unsupported = [
+            construct
+            for construct, found in (
+                ("backreferences", BACKREFERENCE.search(pattern)),
+                ("named groups", compiled.groupindex),
+                ("global inline flags", GLOBAL_FLAGS.search(pattern)),
+            )
+            if found
+        ]
+        if unsupported:
+            msg = (
+                f"Regex of rule {name} uses {', '.join(unsupported)}, "
+                "which cannot be combined with other rules."
+            )
+            raise ValueError(msg)
+        rules.append(
+            CategorizationRule(
+                name=name,
+                pattern=pattern,
+                category=str(entry["category"]),
+                subcategory=str(entry["subcategory"]),
+            )
+        )
+    return rules
+
+
+def compile_rules(rules: list[CategorizationRule]) -> re.Pattern:
+    """
+    Compile rules into a single case-insensitive regular expression.
+
+    Each rule becomes an alternative made of a lookahead searching the
+    whole note for its pattern, followed by an empty group named after
+    the rule. Matching from the start of a note tries the rules in
+    order, so `match.lastgroup` names the first rule whose pattern
+    occurs anywhere in the note.
+
+    Parameters
+    ----------
+    rules : list[CategorizationRule]
+        The rules, in priority order.
+
+    Returns
+    -------
+    re.Pattern
+        The combined matcher.
+
+    """
+    return re.compile(
+        "|".join(
+            f"(?=.*?(?:{rule.pattern}))(?P<{RULE_GROUP_PREFIX}{i}>)"
+            for i, rule in enumerate(rules)
+        )
+        # A pattern that never matches when there are no rules
+        or "(?!)",
+        re.IGNORECASE | re.DOTALL,
+    )
+
+
+class RuleBasedCategorizer(BaseCategorizer):
+    """
+    Categorizes transactions with merchant rules from a YAML file.
+
+    All rules are compiled into one matcher, which is run once per
+    distinct note rather than once per transaction. The number of
+    transactions each rule categorized in the last call to `categorize`
+    is reported by `stats`.
+
+    Parameters
+    ----------
+    rules_path : str, optional
+        The path to the rules YAML file. By default `RULES_PATH`.
+    budget : pd.DataFrame | None, optional
+        If given, the rule targets are checked against its budget lines.
+        By default None.
+
+    """
+
+    def __init__(
+        self,
+        rules_path: str = RULES_PATH,
+        budget: pd.DataFrame | None = None,
+    ) -> None:
+        """
+        Initialize the RuleBasedCategorizer object.
+
+        Parameters
+        ----------
+        rules_path : str, optional
+            The path to the rules YAML file. By default `RULES_PATH`.
+        budget : pd.DataFrame | None, optional
+            If given, the rule targets are checked against its budget
+            lines. See `BaseCategorizer.validate_targets`. By default
+            None.
+
+        """
+        super().__init__()
+        start = time.perf_counter()
+        self.rules = load_rules(rules_path)
+        self.matcher = compile_rules(self.rules)
+        self.timings["compile_s"] = time.perf_counter() - start
+        self.match_counts = np.zeros(len(self.rules), dtype=np.int64)
+        self.unique_match_counts = np.zeros(
+            len(self.rules), dtype=np.int64
+        )
+        if budget is not None:
+            self.validate_targets(budget)
+
+    def targets(self) -> list[tuple[str, str]]:
+        """
+        Return the (category, subcategory) pairs the rules assign.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The target of each rule, in rule order.
+
+        """
+        return [(rule.category, rule.subcategory) for rule in self.rules]
+
+    def stats(self) -> pd.DataFrame:
+        """
+        Return how often each rule matched in the last categorization.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per rule with its target, the number of transactions
+            and of distinct notes it matched. Timings of the compilation,
+            matching and assignment steps are in `timings`.
+
+        """
+        return pd.DataFrame({
+            "rule": [rule.name for rule in self.rules],
+            "category": [rule.category for rule in self.rules],
+            "subcategory": [rule.subcategory for rule in self.rules],
+            "matches": self.match_counts,
+            "unique_notes": self.unique_match_counts,
+        })
+
+    def _predict(self, notes: pd.Series) -> pd.DataFrame:
+        """
+        Assign the target of the first matching rule to each note.
+
+        Parameters
+        ----------
+        notes : pd.Series
+            The note of each transaction.
+
+        Returns
+        -------
+        pd.DataFrame
+            The category and subcategory of each note, both "" when no
+            rule matches or the note is missing.
+
+        """
+        start = time.perf_counter()
+        codes, uniques = pd.factorize(notes)
+        match = self.matcher.match
+        prefix_len = len(RULE_GROUP_PREFIX)
+        # Rule of each distinct note, with -1 for no match and a last -1
+        # for the missing notes, whose code is -1
+        unique_rules = np.fromiter(
+            (
+                int(m.lastgroup[prefix_len:]) if (m := match(note)) else -1
+                for note in uniques.astype(str)
+            ),
+            dtype=np.intp,
+            count=len(uniques),
+        )
+        unique_rules = np.append(unique_rules, -1)
+        self.timings["match_s"] = time.perf_counter() - start
+
+        rule_idx = unique_rules[codes]
+        n_rules = len(self.rules)
+        self.match_counts = np.bincount(
+            rule_idx[rule_idx >= 0], minlength=n_rules
+        )
+        self.unique_match_counts = np.bincount(
+            unique_rules[unique_rules >= 0], minlength=n_rules
+        )
+        # The last target is "" for transactions without a rule
+        return pd.DataFrame(
+            {
+                col: np.array(
+                    [getattr(rule, col) for rule in self.rules] + [""],
+                    dtype=object,
+                )[rule_idx]
+                for col in ("category", "subcategory")
+            },
+            index=notes.index,
+        )
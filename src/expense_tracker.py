@@ -1,27 +1,48 @@
 """Expense Tracker Object."""
 
-import copy
-from calendar import month_name
+from __future__ import annotations
+
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
+from report_exporters.registry import get_exporter
+from utils.cache_helper import (
+    REPORT_CACHE_BYTES,
+    ReportCache,
+    cache_entry_name,
+    load_cached_frames,
+    save_cached_frames,
+    source_fingerprint,
+)
 from utils.data_helper import (
-    append_category_totals,
-    append_totals_row,
-    convert_datetime_to_str,
-    fill_missing_expenses,
-    place_totals_rows,
-    sort_month_order,
+    aggregate_spending,
+    align_categories,
+    build_grouped_report,
+    build_period_pivot,
+    build_rollup_report,
+    build_split_report,
+    fill_missing_budget_lines,
+    join_budget,
+    period_window,
+    select_periods,
+    union_categories,
 )
 from utils.file_helper import (
-    bold_totals,
-    convert_dfs_to_workbook,
-    load_yaml,
+    load_schema,
+    read_excel_sheets,
+    stream_excel_sheet,
 )
 from utils.validation import validate_excel, validate_expenses
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
 PARENT_DIR = Path(__file__).resolve().parent.parent
+# Expense log columns needed to recompute the amount spent of a month
+PARTITION_COLUMNS = ["date", "category", "subcategory", "amount"]
 
 
 class ExpenseTracker:
@@ -36,14 +57,39 @@ class ExpenseTracker:
         Name of the sheet containing the expense log.
     budget_sheet : str
         Name of the sheet containing the budgeted amounts per category.
+    engine : str | None, optional
+        Engine used to parse the Excel file. See
+        `utils.file_helper.resolve_excel_engine`. By default None.
+    cache_dir : str | None, optional
+        Directory in which validated sheets are cached between runs.
+        The cache entry is invalidated whenever the Excel file or the
+        data schema changes. By default None, which disables caching.
+    lazy : bool, optional
+        Whether to defer parsing each sheet until it is first used.
+        By default False.
+    chunk_size : int | None, optional
+        If given, the expense log is streamed from the workbook in
+        chunks of this many rows, which bounds peak memory for very
+        large logs. See `utils.file_helper.stream_excel_sheet`.
+        By default None.
+    report_cache_bytes : int, optional
+        Memory budget of the in-memory report cache. Least recently used
+        reports are evicted beyond it. By default
+        `utils.cache_helper.REPORT_CACHE_BYTES`.
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         excel_path: str,
         expense_sheet: str,
         budget_sheet: str,
+        engine: str | None = None,
+        cache_dir: str | None = None,
+        *,
+        lazy: bool = False,
+        chunk_size: int | None = None,
+        report_cache_bytes: int = REPORT_CACHE_BYTES,
     ) -> None:
         """
         Initialize the ExpenseTracker object.
@@ -56,27 +102,280 @@ class ExpenseTracker:
             Name of the sheet containing the expense log.
         budget_sheet : str
             Name of the sheet containing the budgeted amounts per category.
+        engine : str | None, optional
+            Engine used to parse the Excel file. See
+            `utils.file_helper.resolve_excel_engine`. By default None.
+        cache_dir : str | None, optional
+            Directory in which validated sheets are cached between runs.
+            The cache entry is invalidated whenever the Excel file or the
+            data schema changes. By default None, which disables caching.
+        lazy : bool, optional
+            Whether to defer parsing each sheet until it is first used.
+            By default False.
+        chunk_size : int | None, optional
+            If given, the expense log is streamed from the workbook in
+            chunks of this many rows, which bounds peak memory for very
+            large logs. See `utils.file_helper.stream_excel_sheet`.
+            By default None.
+        report_cache_bytes : int, optional
+            Memory budget of the in-memory report cache. Least recently
+            used reports are evicted beyond it. By default
+            `utils.cache_helper.REPORT_CACHE_BYTES`.
 
         """
         self.excel_path = excel_path
         self.expense_sheet = expense_sheet
         self.budget_sheet = budget_sheet
+        self.engine = engine
+        self.cache_dir = cache_dir
+        self.chunk_size = chunk_size
         config_path = f"{PARENT_DIR}/configs/data_schema.yaml"
-        self.dtypes_dict = load_yaml(config_path)
+        self.dtypes_dict = load_schema(config_path)
         self.expense_log_dtypes = self.dtypes_dict["EXPENSE_LOG"]
         self.budget_dtypes = self.dtypes_dict["BUDGET"]
+        # Wall-clock time of each stage, in seconds
+        self.timings = {}
+        self.cache_hit = False
+
+        # Sheets are parsed and validated on first access
+        self._expense_log = None
+        self._budget = None
+        self._expenses_validated = False
+
+        # Incremental state, built on the first call to add_transactions:
+        # transactions added since the expense log was last read, and the
+        # transactions and amount spent of each month
+        self._added_transactions = []
+        self._period_transactions = None
+        self._period_spent = None
+        # Months changed by add_transactions since their reports were
+        # last built
+        self.dirty_periods = set()
+
+        # Reports are cached under the version of the data they are built
+        # from. The version is bumped whenever the data changes, and
+        # recorded when the data was last replaced as a whole and when the
+        # transactions of each month last changed.
+        self.report_cache = ReportCache(report_cache_bytes)
+        self.data_version = 0
+        self._base_version = 0
+        self._period_versions = {}
+        if not lazy:
+            self._materialize("expense_log", "budget")
+
+    @classmethod
+    def from_frames(
+        cls,
+        expense_log: pd.DataFrame,
+        budget: pd.DataFrame,
+    ) -> ExpenseTracker:
+        """
+        Create an ExpenseTracker from DataFrames instead of a workbook.
+
+        Parameters
+        ----------
+        expense_log : pd.DataFrame
+            The expense log, in the format of the expense log sheet.
+        budget : pd.DataFrame
+            The budget, in the format of the budget sheet.
+
+        Returns
+        -------
+        ExpenseTracker
+            The tracker, with both DataFrames validated.
 
-        self.expense_log = validate_excel(
-            pd.read_excel(self.excel_path, sheet_name=self.expense_sheet),
-            self.expense_log_dtypes,
+        """
+        tracker = cls(
+            excel_path=None,
+            expense_sheet=None,
+            budget_sheet=None,
+            lazy=True,
         )
-        self.budget = validate_excel(
-            pd.read_excel(self.excel_path, sheet_name=self.budget_sheet),
-            self.budget_dtypes,
+        tracker._expense_log = validate_excel(
+            expense_log, tracker.expense_log_dtypes
         )
-        validate_expenses(
-            expense_df=self.expense_log, budget_df=self.budget
+        tracker._budget = validate_excel(budget, tracker.budget_dtypes)
+        tracker._materialize()
+        return tracker
+
+    @property
+    def expense_log(self) -> pd.DataFrame:
+        """Expense log, parsed and validated on first access."""
+        self._materialize("expense_log")
+        if self._added_transactions:
+            # Batches have their own categories for columns not aligned
+            # with the budget, such as the payment type
+            frames = union_categories(
+                [self._expense_log, *self._added_transactions],
+                columns=list(
+                    self._expense_log.select_dtypes("category").columns
+                ),
+            )
+            self._expense_log = pd.concat(frames, ignore_index=True)
+            self._added_transactions = []
+        return self._expense_log
+
+    @expense_log.setter
+    def expense_log(self, expense_log: pd.DataFrame) -> None:
+        """Replace the expense log, validating it against the budget."""
+        expense_log = validate_excel(expense_log, self.expense_log_dtypes)
+        validate_expenses(expense_df=expense_log, budget_df=self.budget)
+        self._expense_log = align_categories(
+            expense_log, self.budget, columns=["category", "subcategory"]
         )
+        self._added_transactions = []
+        self._expenses_validated = True
+        self._bump_data_version()
+
+    @property
+    def budget(self) -> pd.DataFrame:
+        """Budget, parsed and validated on first access."""
+        self._materialize("budget")
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: pd.DataFrame) -> None:
+        """Replace the budget, validating the expense log against it."""
+        budget = validate_excel(budget, self.budget_dtypes)
+        expense_log = self.expense_log
+        validate_expenses(expense_df=expense_log, budget_df=budget)
+        self._budget = budget
+        self._expense_log = align_categories(
+            expense_log, budget, columns=["category", "subcategory"]
+        )
+        self._expenses_validated = True
+        self._bump_data_version()
+
+    def _materialize(self, *names: str) -> None:
+        """
+        Parse and validate sheets that have not been loaded yet.
+
+        Sheets are read from the sidecar cache when it is enabled and up
+        to date, otherwise from a single pass over the workbook. Once both
+        sheets are loaded, the expenses are validated against the budget.
+
+        Parameters
+        ----------
+        *names : str
+            The sheets to load, "expense_log" and/or "budget".
+
+        """
+        missing = [
+            name for name in names if getattr(self, f"_{name}") is None
+        ]
+        if missing:
+            start = time.perf_counter()
+            if not self._load_from_cache():
+                self._load_from_workbook(missing)
+            self.timings["load"] = (
+                self.timings.get("load", 0.0) + time.perf_counter() - start
+            )
+
+        if (
+            not self._expenses_validated
+            and self._expense_log is not None
+            and self._budget is not None
+        ):
+            validate_expenses(
+                expense_df=self._expense_log, budget_df=self._budget
+            )
+            # Share the budget's categories so both sheets use the same
+            # integer codes
+            self._expense_log = align_categories(
+                self._expense_log,
+                self._budget,
+                columns=["category", "subcategory"],
+            )
+            self._expenses_validated = True
+            if self.cache_dir is not None and not self.cache_hit:
+                save_cached_frames(
+                    self.cache_dir,
+                    *self._cache_key(),
+                    {
+                        "expense_log": self._expense_log,
+                        "budget": self._budget,
+                    },
+                )
+
+    def _cache_key(self) -> tuple[str, str]:
+        """
+        Return the name and fingerprint of this workbook's cache entry.
+
+        Returns
+        -------
+        tuple[str, str]
+            The cache entry name and the current source fingerprint.
+
+        """
+        entry_name = cache_entry_name(
+            self.excel_path, [self.expense_sheet, self.budget_sheet]
+        )
+        fingerprint = source_fingerprint(self.excel_path, self.dtypes_dict)
+        return entry_name, fingerprint
+
+    def _load_from_cache(self) -> bool:
+        """
+        Load both sheets from the sidecar cache, if possible.
+
+        Returns
+        -------
+        bool
+            Whether the sheets were loaded from the cache.
+
+        """
+        if self.cache_dir is None or self.cache_hit:
+            return False
+        cached_frames = load_cached_frames(
+            self.cache_dir, *self._cache_key()
+        )
+        if cached_frames is None:
+            return False
+
+        # Cached frames were validated before they were saved
+        self._expense_log = cached_frames["expense_log"]
+        self._budget = cached_frames["budget"]
+        self._expenses_validated = True
+        self.cache_hit = True
+        return True
+
+    def _load_from_workbook(self, names: list[str]) -> None:
+        """
+        Read and validate sheets from the workbook.
+
+        Parameters
+        ----------
+        names : list[str]
+            The sheets to load, "expense_log" and/or "budget".
+
+        """
+        sheet_specs = {
+            "expense_log": (self.expense_sheet, self.expense_log_dtypes),
+            "budget": (self.budget_sheet, self.budget_dtypes),
+        }
+        if self.chunk_size is not None and "expense_log" in names:
+            self._expense_log = stream_excel_sheet(
+                self.excel_path,
+                self.expense_sheet,
+                self.expense_log_dtypes,
+                chunk_size=self.chunk_size,
+            )
+            names = [name for name in names if name != "expense_log"]
+        if not names:
+            return
+
+        # Open the workbook once and read all sheets from the same handle
+        sheets = read_excel_sheets(
+            self.excel_path,
+            sheet_names=[sheet_specs[name][0] for name in names],
+            engine=self.engine,
+        )
+        for name in names:
+            sheet_name, sheet_schema = sheet_specs[name]
+            setattr(
+                self,
+                f"_{name}",
+                validate_excel(sheets[sheet_name], sheet_schema),
+            )
 
     def get_expense_log(self) -> pd.DataFrame:
         """
@@ -102,182 +401,459 @@ class ExpenseTracker:
         """
         return self.budget
 
-    def create_grouped_report(self) -> pd.DataFrame:
+    def create_grouped_report(
+        self,
+        start: str | pd.Period | None = None,
+        end: str | pd.Period | None = None,
+    ) -> pd.DataFrame:
         """
         Return an expense report grouped by category and subcategory.
 
+        Parameters
+        ----------
+        start : str | pd.Period | None, optional
+            First month of the report, e.g. "2025-01". By default None,
+            which starts at the first transaction.
+        end : str | pd.Period | None, optional
+            Last month of the report, e.g. "2025-12". By default None,
+            which ends at the last transaction.
+
         Returns
         -------
         pd.DataFrame
-            Expense report.
-
-        """
-        self.expense_log["month"] = self.expense_log[
-            "date"
-        ].dt.month_name()
-
-        # Calculate total amount spent per category and subcategory
-        self.expense_log["total_amount_spent"] = self.expense_log.groupby([
-            "month",
-            "category",
-            "subcategory",
-        ])["amount"].transform("sum")
-
-        # Create expense_report
-        self.grouped_report = (
-            self.expense_log.merge(
-                self.budget,
-                on=["category", "subcategory"],
-                how="left",
-            )
-            # Drop transaction details
-            .drop(columns=["date", "amount", "payment_type", "note"])
-            .sort_values(
-                by=["month", "category", "subcategory"],
-            )
-        ).drop_duplicates()
+            Expense report, with the year and month of each row in the
+            "month" column.
 
-        # Calculate difference between budgeted and spent
-        self.grouped_report["difference"] = (
-            self.grouped_report["amount_budgeted"]
-            - self.grouped_report["total_amount_spent"]
+        """
+        window = period_window(start, end)
+        self.grouped_report = self._cached_report(
+            ("grouped_report", self.data_version, window),
+            lambda: self._build_grouped_report(*window),
         )
+        return self.grouped_report
 
-        # Reorder columns
-        column_order = [
-            "month",
-            "category",
-            "subcategory",
-            "amount_budgeted",
-            "total_amount_spent",
-            "difference",
-        ]
+    def create_pivot_report(
+        self,
+        values: str = "total_amount_spent",
+        start: str | pd.Period | None = None,
+        end: str | pd.Period | None = None,
+    ) -> pd.DataFrame:
+        """
+        Return a report with one row per budget line and one column per
+        month.
+
+        Parameters
+        ----------
+        values : str, optional
+            The grouped report column to pivot. By default
+            "total_amount_spent".
+        start : str | pd.Period | None, optional
+            First month of the report. By default None.
+        end : str | pd.Period | None, optional
+            Last month of the report. By default None.
+
+        Returns
+        -------
+        pd.DataFrame
+            The pivoted report.
 
-        return self.grouped_report[column_order]
+        """
+        return self._cached_report(
+            (
+                "pivot_report",
+                self.data_version,
+                period_window(start, end),
+                values,
+            ),
+            lambda: build_period_pivot(
+                self.create_grouped_report(start, end), self.budget, values
+            ),
+        )
 
-    def create_split_report(self) -> list[pd.DataFrame, ...]:
+    def create_split_report(
+        self,
+        start: str | pd.Period | None = None,
+        end: str | pd.Period | None = None,
+    ) -> list[pd.DataFrame, ...]:
         """
         Return a list of DataFrames, one for each month.
 
+        Parameters
+        ----------
+        start : str | pd.Period | None, optional
+            First month of the report. By default None.
+        end : str | pd.Period | None, optional
+            Last month of the report. By default None.
+
         Returns
         -------
         list[pd.DataFrame, ...]
-            List of DataFrames, one per month.
+            List of DataFrames, one per month, in chronological order.
 
         """
-        if not hasattr(self, "grouped_report"):
-            self.create_grouped_report()
-        self.split_report = [
-            self.grouped_report[self.grouped_report["month"] == month]
-            for month in self.grouped_report["month"].unique()
-        ]
-        # Fill missing expenses with no transactions attached to them
-        for i in range(len(self.split_report)):
-            # Get the month name from the DataFrame
-            month = self.split_report[i]["month"].unique()[0]
-            # Fill missing expenses for the month
-            self.split_report[i] = fill_missing_expenses(
-                self.split_report[i],
-                self.budget,
-                month,
-            ).sort_values(
-                by=["category", "subcategory"],
-            )
-            # Sort the list of reports by month.
-        return sort_month_order(self.split_report)
+        self.split_report = self._cached_report(
+            ("split_report", self.data_version, period_window(start, end)),
+            lambda: build_split_report(
+                self.create_grouped_report(start, end), self.budget
+            ),
+        )
+        # Reports with totals are built as new frames, so the split
+        # report is shared rather than copied
+        self.original_split_report = self.split_report
+        return self.split_report
 
-    def append_totals_rows(self) -> list[pd.DataFrame, ...]:
+    def append_totals_rows(
+        self,
+        start: str | pd.Period | None = None,
+        end: str | pd.Period | None = None,
+    ) -> list[pd.DataFrame, ...]:
         """
         Append overall and category-wise totals to the report.
 
+        Parameters
+        ----------
+        start : str | pd.Period | None, optional
+            First month of the report. By default None.
+        end : str | pd.Period | None, optional
+            Last month of the report. By default None.
+
         Returns
         -------
         list[pd.DataFrame, ...]
             List of DataFrames, one per month, with totals rows appended.
 
         """
-        if not hasattr(self, "split_report"):
-            self.create_split_report()
+        grouped_report = self.create_grouped_report(start, end)
+        months = grouped_report["month"].unique()
+
+        # Monthly reports are cached under the version of their month, so
+        # only the reports of changed months are rebuilt
+        report_keys = {
+            month: (
+                "monthly_report",
+                month,
+                self._period_versions.get(month, self._base_version),
+            )
+            for month in months
+        }
+        monthly_reports = {
+            month: self.report_cache.get(key)
+            for month, key in report_keys.items()
+        }
+        stale_months = [
+            month
+            for month, report in monthly_reports.items()
+            if report is None
+        ]
+        if stale_months:
+            # Compute the totals of the stale months in a single pass
+            stale_report = grouped_report[
+                grouped_report["month"].isin(stale_months)
+            ]
+            for month, report in zip(
+                stale_months,
+                build_rollup_report(
+                    fill_missing_budget_lines(stale_report, self.budget)
+                ),
+            ):
+                self.report_cache.put(report_keys[month], report)
+                monthly_reports[month] = report
+        self.dirty_periods.difference_update(months)
+
+        # Copied so that modifying the reports does not change the cache
+        self.split_report = [
+            monthly_reports[month].copy() for month in months
+        ]
+        return self.split_report
 
-        # Store original unmodified split report
-        self.original_split_report = copy.deepcopy(self.split_report)
+    def add_transactions(self, transactions: pd.DataFrame) -> None:
+        """
+        Add transactions to the expense log and update the reports.
 
-        # Reset `split_report` to its original state before modification
-        self.split_report = copy.deepcopy(self.original_split_report)
+        Only the new transactions are validated. The amount spent is
+        recomputed for the months of the new transactions only, and their
+        monthly reports are marked as dirty, to be rebuilt on next use.
+        Reports are identical to those of a tracker created with every
+        transaction at once.
 
-        for i in range(len(self.split_report)):
-            # Append overall totals row
-            self.split_report[i] = append_totals_row(self.split_report[i])
+        Parameters
+        ----------
+        transactions : pd.DataFrame
+            The new transactions, in the format of the expense log sheet.
+            A ValueError is raised if they do not match the expense log
+            schema, or their categories or subcategories are not in the
+            budget.
 
-            # Append category-wise totals row
-            self.split_report[i] = append_category_totals(
-                self.split_report[i]
+        """
+        transactions = validate_excel(
+            transactions, self.expense_log_dtypes
+        )
+        validate_expenses(expense_df=transactions, budget_df=self.budget)
+        transactions = align_categories(
+            transactions, self.budget, columns=["category", "subcategory"]
+        )
+        if self._period_spent is None:
+            self._partition_by_period()
+
+        months = transactions["date"].dt.to_period("M")
+        for month, month_transactions in transactions.groupby(
+            months, sort=False
+        ):
+            # Appended after the existing transactions of the month, so
+            # amounts are summed in the order of the full expense log
+            period_transactions = pd.concat(
+                [
+                    self._period_transactions.get(month),
+                    month_transactions[PARTITION_COLUMNS],
+                ],
+                ignore_index=True,
+            )
+            self._period_transactions[month] = period_transactions
+            self._period_spent[month] = aggregate_spending(
+                period_transactions,
+                months=period_transactions["date"].dt.to_period("M"),
             )
 
-            # Place totals rows in correct order
-            self.split_report[i] = place_totals_rows(self.split_report[i])
+        self._added_transactions.append(transactions)
+        # Reports are rebuilt from the running amounts spent on next use
+        self._bump_data_version(months.unique())
+
+    def _partition_by_period(self) -> None:
+        """Split the expense log and the amount spent by month."""
+        expense_log = self.expense_log[PARTITION_COLUMNS]
+        months = expense_log["date"].dt.to_period("M")
+        self._period_transactions = {
+            month: month_transactions.reset_index(drop=True)
+            for month, month_transactions in expense_log.groupby(months)
+        }
+        self._period_spent = {
+            month: month_spent.reset_index(drop=True)
+            for month, month_spent in aggregate_spending(
+                expense_log, months
+            ).groupby("month")
+        }
+
+    def _running_spent(
+        self,
+        start: pd.Period | None,
+        end: pd.Period | None,
+    ) -> pd.DataFrame:
+        """
+        Return the running amount spent in a range of months.
+
+        Parameters
+        ----------
+        start : pd.Period | None
+            First month of the range, or None.
+        end : pd.Period | None
+            Last month of the range, or None.
 
-        return self.split_report
+        Returns
+        -------
+        pd.DataFrame
+            The amount spent, as returned by `aggregate_spending`.
 
-    def write_report_to_excel(
-        self,
-        file_path: str,
+        """
+        selected = [
+            spent
+            for month, spent in sorted(self._period_spent.items())
+            if (start is None or month >= start)
+            and (end is None or month <= end)
+        ]
+        if not selected:
+            expense_log = self.expense_log.iloc[:0]
+            return aggregate_spending(
+                expense_log, months=expense_log["date"].dt.to_period("M")
+            )
+        return pd.concat(selected, ignore_index=True)
+
+    def _bump_data_version(
+        self, months: list[pd.Period] | None = None
     ) -> None:
         """
-        Write the expense report to an Excel file.
+        Record a change of the data, so reports built before it are no
+        longer used.
 
         Parameters
         ----------
-        file_path : str
-            Path to the output Excel file.
+        months : list[pd.Period] | None, optional
+            The months whose transactions changed. By default None, which
+            means the expense log or budget was replaced as a whole.
 
         """
-        if not hasattr(self, "split_report"):
-            self.append_totals_rows()
+        self.data_version += 1
+        if months is None:
+            self._base_version = self.data_version
+            self._period_versions = {}
+            self._period_transactions = None
+            self._period_spent = None
+            self.dirty_periods.clear()
+        else:
+            self._period_versions.update(
+                dict.fromkeys(months, self.data_version)
+            )
+            self.dirty_periods.update(months)
 
-        # Append the expense log and budget to the report
-        self.full_report = [
-            self.expense_log,
-            self.budget,
-            *sort_month_order(self.split_report),
-        ]
+    def _cached_report(
+        self,
+        key: Hashable,
+        build: Callable[[], pd.DataFrame | list[pd.DataFrame, ...]],
+    ) -> pd.DataFrame | list[pd.DataFrame, ...]:
+        """
+        Return a report from the report cache, building it if needed.
 
-        # Convert datetime columns to string columns
-        self.full_report = [
-            convert_datetime_to_str(df) for df in self.full_report
-        ]
+        Callers get a copy, so that modifying it does not change the
+        cached report.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the report, including the data version.
+        build : Callable[[], pd.DataFrame | list[pd.DataFrame, ...]]
+            Function building the report.
+
+        Returns
+        -------
+        pd.DataFrame | list[pd.DataFrame, ...]
+            A copy of the report.
 
-        # Remove the month column from monthly reports
-        for i in range(2, len(self.full_report)):
-            self.full_report[i] = self.full_report[i].drop(
-                columns=["month"]
+        """
+        report = self.report_cache.get(key)
+        if report is None:
+            report = build()
+            self.report_cache.put(key, report)
+        if isinstance(report, list):
+            return [df.copy() for df in report]
+        return report.copy()
+
+    def _build_grouped_report(
+        self,
+        start: pd.Period | None,
+        end: pd.Period | None,
+    ) -> pd.DataFrame:
+        """
+        Build the grouped report of a range of months.
+
+        Parameters
+        ----------
+        start : pd.Period | None
+            First month of the range, or None.
+        end : pd.Period | None
+            Last month of the range, or None.
+
+        Returns
+        -------
+        pd.DataFrame
+            The grouped report.
+
+        """
+        if self._period_spent is not None:
+            # Join the running amounts spent of the selected months
+            return join_budget(
+                self._running_spent(start, end), self.budget
             )
 
-        # Sort the months in the report
-        month_lookup = list(month_name)
-        report_months = self.grouped_report["month"].unique()
-        sorted_months = sorted(report_months, key=month_lookup.index)
+        expense_log = select_periods(self.expense_log, start, end)
+        return build_grouped_report(
+            expense_log,
+            self.budget,
+            months=expense_log["date"].dt.to_period("M"),
+        )
+
+    def export_report(  # noqa: PLR0913
+        self,
+        output_path: str,
+        report_format: str = "excel",
+        start: str | pd.Period | None = None,
+        end: str | pd.Period | None = None,
+        *,
+        single_file: bool | None = None,
+        max_workers: int | None = 1,
+    ) -> list[Path]:
+        """
+        Export the expense report to a file or a directory.
+
+        The report has an "Expense Log" sheet, a "Budget" sheet, and one
+        sheet per month named after its year and month, e.g. "2025-01".
+        Dates are written as dates in every format.
+
+        Parameters
+        ----------
+        output_path : str
+            The file or directory to write to.
+        report_format : str, optional
+            The format of the report: "excel", "csv", "tsv", "jsonl" or
+            "parquet". See `report_exporters.registry.get_exporter`.
+            By default "excel".
+        start : str | pd.Period | None, optional
+            First month of the report. By default None.
+        end : str | pd.Period | None, optional
+            Last month of the report. By default None.
+        single_file : bool | None, optional
+            Whether to write every sheet to a single file, or each sheet
+            to its own file in a directory. By default None, which writes
+            a single file if `output_path` has a file extension. See
+            `report_exporters.base_exporter.BaseExporter.export`.
+        max_workers : int | None, optional
+            Number of processes writing the sheets in parallel when each
+            sheet is written to its own file. The files are returned in
+            sheet order regardless. By default 1. None uses one process
+            per CPU.
+
+        Returns
+        -------
+        list[Path]
+            The paths of the written files.
+
+        """
+        exporter = get_exporter(report_format)
 
+        # Append the expense log and budget to the report
+        monthly_reports = self.append_totals_rows(start, end)
+        # Name each monthly sheet after its period, e.g. "2025-01", and
+        # remove the month column from monthly reports
+        month_sheets = [str(df["month"].iloc[0]) for df in monthly_reports]
+        self.full_report = [
+            self.expense_log,
+            self.budget,
+            *(df.drop(columns=["month"]) for df in monthly_reports),
+        ]
         sheet_names = [
             "Expense Log",
             "Budget",
-            *sorted_months,
+            *month_sheets,
         ]
 
-        # Convert the DataFrames to an xlsxwriter Workbook
-        report_wb = convert_dfs_to_workbook(
-            df_list=self.full_report,
-            file_path=file_path,
-            sheet_names=sheet_names,
+        return exporter.export(
+            dict(zip(sheet_names, self.full_report)),
+            output_path,
+            total_sheets=month_sheets,
+            single_file=single_file,
+            max_workers=max_workers,
         )
 
-        # Bold the total rows in the report Workbook
-        report_wb = bold_totals(report_wb)
+    def write_report_to_excel(
+        self,
+        file_path: str,
+        start: str | pd.Period | None = None,
+        end: str | pd.Period | None = None,
+    ) -> None:
+        """
+        Write the expense report to an Excel file.
+
+        Monthly reports are written to sheets named after their year and
+        month, e.g. "2025-01".
 
-        # Autofit the columns in the report
-        for sheet_name in report_wb.sheetnames:
-            worksheet = report_wb.get_worksheet_by_name(sheet_name)
-            worksheet.autofit()
+        Parameters
+        ----------
+        file_path : str
+            Path to the output Excel file.
+        start : str | pd.Period | None, optional
+            First month of the report. By default None.
+        end : str | pd.Period | None, optional
+            Last month of the report. By default None.
 
-        # Save the workbook
-        report_wb.close()
+        """
+        self.export_report(
+            file_path, "excel", start, end, single_file=True
+        )
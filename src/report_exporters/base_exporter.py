@@ -0,0 +1,188 @@
+"""Base report exporter object."""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import pandas as pd
+
+from utils.file_helper import setup_logging
+
+
+def sheet_file_name(sheet_name: str) -> str:
+    """
+    Return the file name, without extension, of an exported sheet.
+
+    Parameters
+    ----------
+    sheet_name : str
+        The name of the sheet, e.g. "Expense Log" or "2025-01".
+
+    Returns
+    -------
+    str
+        The sheet name in lower case, with runs of characters other than
+        letters, digits, underscores and hyphens replaced by "_".
+
+    """
+    return re.sub(r"[^\w-]+", "_", sheet_name.strip()).lower()
+
+
+def stack_sheets(sheets: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Stack the sheets of a report into a single DataFrame.
+
+    Parameters
+    ----------
+    sheets : dict[str, pd.DataFrame]
+        The sheets of the report, by sheet name.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of every sheet, with the sheet name in a leading "sheet"
+        column. Columns missing from a sheet are left empty.
+
+    """
+    return pd.concat(
+        [df.assign(sheet=sheet_name) for sheet_name, df in sheets.items()],
+        ignore_index=True,
+    ).pipe(lambda df: df[["sheet", *df.columns.drop("sheet")]])
+
+
+class BaseExporter(ABC):
+    """
+    Base class for report exporters.
+
+    Subclasses set the file `extension` of their format and implement
+    `_write_frame`, which writes one DataFrame to a file. Formats that can
+    hold several sheets in one file also override `_write_file`.
+
+    """
+
+    extension = ""
+
+    def __init__(self) -> None:
+        """Initialize the BaseExporter object."""
+        self.log = setup_logging()
+
+    def export(
+        self,
+        sheets: dict[str, pd.DataFrame],
+        output_path: str,
+        total_sheets: list[str] | None = None,
+        *,
+        single_file: bool | None = None,
+        max_workers: int | None = 1,
+    ) -> list[Path]:
+        """
+        Export the sheets of a report to a file or a directory.
+
+        Parameters
+        ----------
+        sheets : dict[str, pd.DataFrame]
+            The sheets of the report, by sheet name.
+        output_path : str
+            The file or directory to write to. Missing parent directories
+            are created.
+        total_sheets : list[str] | None, optional
+            The monthly report sheets, whose total rows are highlighted by
+            formats that support formatting. By default None.
+        single_file : bool | None, optional
+            Whether to write every sheet to `output_path` as a single
+            file, or each sheet to its own file in the `output_path`
+            directory. By default None, which writes a single file if
+            `output_path` has a file extension.
+        max_workers : int | None, optional
+            Number of processes writing the sheet files in parallel when
+            each sheet is written to its own file. A single file is
+            always written by this process. By default 1, which writes
+            the sheet files one after another in this process. None uses
+            one process per CPU.
+
+        Returns
+        -------
+        list[Path]
+            The paths of the written files.
+
+        """
+        output_path = Path(output_path)
+        if single_file is None:
+            single_file = bool(output_path.suffix)
+        total_sheets = total_sheets or []
+
+        if single_file:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_file(sheets, output_path, total_sheets)
+            file_paths = [output_path]
+        else:
+            output_path.mkdir(parents=True, exist_ok=True)
+            file_paths = [
+                output_path
+                / (sheet_file_name(sheet_name) + self.extension)
+                for sheet_name in sheets
+            ]
+            sheet_dicts = [{name: df} for name, df in sheets.items()]
+            if max_workers == 1:
+                for sheet_dict, file_path in zip(sheet_dicts, file_paths):
+                    self._write_file(sheet_dict, file_path, total_sheets)
+            else:
+                with ProcessPoolExecutor(max_workers) as executor:
+                    # Consume the results to raise errors of the workers
+                    list(
+                        executor.map(
+                            self._write_file,
+                            sheet_dicts,
+                            file_paths,
+                            repeat(total_sheets),
+                        )
+                    )
+
+        self.log.info("Exported report to %s", output_path)
+        return file_paths
+
+    def _write_file(
+        self,
+        sheets: dict[str, pd.DataFrame],
+        file_path: Path,
+        total_sheets: list[str],  # noqa: ARG002
+    ) -> None:
+        """
+        Write sheets to a single file.
+
+        A single sheet is written as is, and several sheets are stacked
+        with `stack_sheets`.
+
+        Parameters
+        ----------
+        sheets : dict[str, pd.DataFrame]
+            The sheets to write, by sheet name.
+        file_path : Path
+            The path of the file.
+        total_sheets : list[str]
+            The monthly report sheets. Unused by formats without
+            formatting.
+
+        """
+        if len(sheets) == 1:
+            self._write_frame(next(iter(sheets.values())), file_path)
+        else:
+            self._write_frame(stack_sheets(sheets), file_path)
+
+    @abstractmethod
+    def _write_frame(self, df: pd.DataFrame, file_path: Path) -> None:
+        """
+        Write a DataFrame to a file.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to write.
+        file_path : Path
+            The path of the file.
+
+        """
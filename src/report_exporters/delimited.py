@@ -0,0 +1,45 @@
+"""Report exporters for delimited text files."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from report_exporters.base_exporter import BaseExporter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pandas as pd
+
+
+class CsvExporter(BaseExporter):
+    """
+    Exports reports to comma-separated values files.
+
+    Dates are written in ISO 8601 format.
+
+    """
+
+    extension = ".csv"
+    separator = ","
+
+    def _write_frame(self, df: pd.DataFrame, file_path: Path) -> None:
+        """
+        Write a DataFrame to a delimited text file.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to write.
+        file_path : Path
+            The path of the file.
+
+        """
+        df.to_csv(file_path, sep=self.separator, index=False)
+
+
+class TsvExporter(CsvExporter):
+    """Exports reports to tab-separated values files."""
+
+    extension = ".tsv"
+    separator = "\t"
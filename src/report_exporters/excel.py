@@ -0,0 +1,86 @@
+"""Report exporter for Excel workbooks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from report_exporters.base_exporter import BaseExporter
+from utils.file_helper import write_excel_report
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pandas as pd
+
+
+class ExcelExporter(BaseExporter):
+    """
+    Exports reports to Excel workbooks, one worksheet per sheet.
+
+    Total rows of the monthly report sheets are bolded. See
+    `utils.file_helper.write_excel_report`.
+
+    Parameters
+    ----------
+    chunk_size : int, optional
+        Number of rows converted to Python values at a time while
+        writing. By default 10_000.
+
+    """
+
+    extension = ".xlsx"
+
+    def __init__(self, chunk_size: int = 10_000) -> None:
+        """
+        Initialize the ExcelExporter object.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Number of rows converted to Python values at a time while
+            writing. By default 10_000.
+
+        """
+        super().__init__()
+        self.chunk_size = chunk_size
+
+    def _write_file(
+        self,
+        sheets: dict[str, pd.DataFrame],
+        file_path: Path,
+        total_sheets: list[str],
+    ) -> None:
+        """
+        Write sheets to a workbook.
+
+        Parameters
+        ----------
+        sheets : dict[str, pd.DataFrame]
+            The sheets to write, by sheet name.
+        file_path : Path
+            The path of the workbook.
+        total_sheets : list[str]
+            The monthly report sheets, whose total rows are bolded.
+
+        """
+        write_excel_report(
+            df_list=list(sheets.values()),
+            file_path=str(file_path),
+            sheet_names=list(sheets),
+            total_sheets=[name for name in total_sheets if name in sheets],
+            chunk_size=self.chunk_size,
+        )
+
+    def _write_frame(self, df: pd.DataFrame, file_path: Path) -> None:
+        """
+        Write a DataFrame to a workbook with a single worksheet.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to write.
+        file_path : Path
+            The path of the workbook.
+
+        """
+        self._write_file({"Sheet1": df}, file_path, total_sheets=[])
@@ -0,0 +1,41 @@
+"""Report exporter for JSON Lines files."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from report_exporters.base_exporter import BaseExporter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pandas as pd
+
+
+class JsonLinesExporter(BaseExporter):
+    """
+    Exports reports to JSON Lines files, one JSON object per row.
+
+    Dates are written in ISO 8601 format, and missing values as null.
+
+    """
+
+    extension = ".jsonl"
+
+    def _write_frame(  # noqa: PLR6301
+        self, df: pd.DataFrame, file_path: Path
+    ) -> None:
+        """
+        Write a DataFrame to a JSON Lines file.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to write.
+        file_path : Path
+            The path of the file.
+
+        """
+        df.to_json(
+            file_path, orient="records", lines=True, date_format="iso"
+        )
@@ -0,0 +1,68 @@
+"""Report exporter for Parquet files."""
+
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from report_exporters.base_exporter import BaseExporter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pandas as pd
+
+# Libraries pandas can write Parquet files with, in order of preference
+PARQUET_ENGINES = ("pyarrow", "fastparquet")
+
+
+class ParquetExporter(BaseExporter):
+    """
+    Exports reports to Parquet files.
+
+    Column types, including dates and categories, are preserved. Requires
+    pyarrow or fastparquet.
+
+    """
+
+    extension = ".parquet"
+
+    def __init__(self) -> None:
+        """
+        Initialize the ParquetExporter object.
+
+        Raises
+        ------
+        ImportError
+            If neither pyarrow nor fastparquet is installed.
+
+        """
+        super().__init__()
+        self.engine = next(
+            (
+                name
+                for name in PARQUET_ENGINES
+                if find_spec(name) is not None
+            ),
+            None,
+        )
+        if self.engine is None:
+            msg = (
+                "Parquet export requires one of: "
+                f"{', '.join(PARQUET_ENGINES)}."
+            )
+            raise ImportError(msg)
+
+    def _write_frame(self, df: pd.DataFrame, file_path: Path) -> None:
+        """
+        Write a DataFrame to a Parquet file.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to write.
+        file_path : Path
+            The path of the file.
+
+        """
+        df.to_parquet(file_path, engine=self.engine, index=False)
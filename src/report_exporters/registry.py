@@ -0,0 +1,68 @@
+"""Registry of the report exporters, by report format."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from report_exporters.delimited import CsvExporter, TsvExporter
+from report_exporters.excel import ExcelExporter
+from report_exporters.json_lines import JsonLinesExporter
+from report_exporters.parquet import ParquetExporter
+
+if TYPE_CHECKING:
+    from report_exporters.base_exporter import BaseExporter
+
+EXPORTERS = {
+    "excel": ExcelExporter,
+    "csv": CsvExporter,
+    "tsv": TsvExporter,
+    "jsonl": JsonLinesExporter,
+    "parquet": ParquetExporter,
+}
+
+
+def register_exporter(
+    report_format: str, exporter_cls: type[BaseExporter]
+) -> None:
+    """
+    Register an exporter for a report format.
+
+    Parameters
+    ----------
+    report_format : str
+        The name of the report format, e.g. "csv".
+    exporter_cls : type[BaseExporter]
+        The exporter class. Replaces any exporter already registered for
+        the format.
+
+    """
+    EXPORTERS[report_format] = exporter_cls
+
+
+def get_exporter(report_format: str) -> BaseExporter:
+    """
+    Return an exporter for a report format.
+
+    Parameters
+    ----------
+    report_format : str
+        The name of the report format. See `EXPORTERS`.
+
+    Returns
+    -------
+    BaseExporter
+        A new exporter for the format.
+
+    Raises
+    ------
+    ValueError
+        If no exporter is registered for the format.
+
+    """
+    if report_format not in EXPORTERS:
+        msg = (
+            f"Unsupported report format: {report_format}. "
+            f"Expected one of: {', '.join(EXPORTERS)}."
+        )
+        raise ValueError(msg)
+    return EXPORTERS[report_format]()
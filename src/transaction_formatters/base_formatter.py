@@ -2,23 +2,98 @@
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
 import pandas as pd
 
-from utils.file_helper import setup_logging
+from utils.file_helper import resolve_csv_engine, setup_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
+# Columns of a formatted transaction log, in expense log order
+EXPENSE_LOG_COLUMNS = [
+    "date",
+    "category",
+    "subcategory",
+    "amount",
+    "payment_type",
+    "note",
+]
+# Rows read at a time when streaming a transaction log
+DEFAULT_CHUNK_SIZE = 100_000
 
-class BaseFormatter:
+
+def parse_date_columns(
+    trans_log: pd.DataFrame,
+    date_cols: list[str],
+    date_format: str | None = None,
+) -> pd.DataFrame:
+    """
+    Convert the date columns of a transaction log read as text.
+
+    Parameters
+    ----------
+    trans_log : pd.DataFrame
+        The transaction log. Its date columns are replaced in place.
+    date_cols : list[str]
+        The list of columns to convert to datetime.
+    date_format : str | None, optional
+        The strftime format of the date columns. By default None,
+        which infers the format from the first date of each column.
+
+    Returns
+    -------
+    pd.DataFrame
+        The transaction log.
+
+    """
+    for col in date_cols:
+        trans_log[col] = pd.to_datetime(trans_log[col], format=date_format)
+    return trans_log
+
+
+class BaseFormatter(ABC):
     """
     Base class for transaction log formatters.
 
+    Subclasses declare the columns they read: `SCHEMA` maps the
+    non-date columns to their data types, `DATE_COLS` lists the date
+    columns, and `DATE_FORMAT` is the strftime format of the dates.
+    `PAYMENT_TYPE` is the payment type of the formatted rows, and
+    `CARD_COL`, if set, is the schema column of the card number, which
+    tells apart the cards of one payment type. Subclasses
+    implement `_format_chunk`, which formats a part of the transaction
+    log as expense log rows.
+
     Parameters
     ----------
     file_path : str
         The path to the file containing the transaction logs.
+    engine : str | None, optional
+        Engine used to parse the file. See
+        `utils.file_helper.resolve_csv_engine`. By default None.
+    chunk_size : int | None, optional
+        If given, the transaction log is not read up front, and is
+        streamed in chunks of this many rows by `iter_formatted_logs`
+        and `write_formatted_logs`. By default None.
 
     """
 
-    def __init__(self, file_path: str) -> None:
+    SCHEMA: ClassVar[dict[str, str]] = {}
+    DATE_COLS: ClassVar[list[str]] = []
+    DATE_FORMAT: ClassVar[str | None] = None
+    PAYMENT_TYPE: ClassVar[str] = ""
+    CARD_COL: ClassVar[str | None] = None
+
+    def __init__(
+        self,
+        file_path: str,
+        engine: str | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
         """
         Initialize the BaseFormatter object.
 
@@ -26,19 +101,60 @@ class BaseFormatter:
         ----------
         file_path : str
             The path to the file containing the transaction logs.
+        engine : str | None, optional
+            Engine used to parse the file. See
+            `utils.file_helper.resolve_csv_engine`. By default None.
+        chunk_size : int | None, optional
+            If given, the transaction log is not read up front, and is
+            streamed in chunks of this many rows. By default None.
 
         """
         self.file_path = file_path
+        self.engine = engine
+        self.chunk_size = chunk_size
         self.log = setup_logging()
 
+    @classmethod
+    def matches(cls, sample: pd.DataFrame) -> bool:
+        """
+        Check whether a sample of a transaction log fits this formatter.
+
+        Parameters
+        ----------
+        sample : pd.DataFrame
+            The header and first rows of the transaction log, read as
+            text.
+
+        Returns
+        -------
+        bool
+            Whether the sample has every column read by the formatter,
+            with dates in `DATE_FORMAT` and values of the schema types.
+
+        """
+        columns = [*cls.DATE_COLS, *cls.SCHEMA]
+        if not columns or not set(columns).issubset(sample.columns):
+            return False
+        try:
+            for col in cls.DATE_COLS:
+                pd.to_datetime(sample[col], format=cls.DATE_FORMAT)
+            sample[list(cls.SCHEMA)].astype(cls.SCHEMA)
+        except (ValueError, TypeError):
+            return False
+        return True
+
     def _read_transaction_logs(
         self,
         schema: dict[str, str],
         date_cols: list[str],
+        date_format: str | None = None,
     ) -> pd.DataFrame | None:
         """
         Read the transaction logs from the file and return a DataFrame.
 
+        Only the columns of the schema and the date columns are read. The
+        date columns are read as text and parsed once each.
+
         Parameters
         ----------
         schema : dict[str, str]
@@ -46,6 +162,9 @@ class BaseFormatter:
             include columns listed in date_cols.
         date_cols : list[str]
             The list of columns to convert to datetime.
+        date_format : str | None, optional
+            The strftime format of the date columns. By default None,
+            which infers the format from the first date of each column.
 
         Returns
         -------
@@ -55,13 +174,15 @@ class BaseFormatter:
 
         """
         try:
-            trans_log = pd.read_csv(
-                self.file_path,
-                dtype=schema,
-                parse_dates=date_cols,
-            )
-            trans_log[date_cols] = trans_log[date_cols].apply(
-                pd.to_datetime
+            trans_log = parse_date_columns(
+                pd.read_csv(
+                    self.file_path,
+                    usecols=[*date_cols, *schema],
+                    dtype={**schema, **dict.fromkeys(date_cols, "str")},
+                    engine=resolve_csv_engine(self.engine),
+                ),
+                date_cols,
+                date_format,
             )
 
         except Exception:
@@ -70,3 +191,94 @@ class BaseFormatter:
         else:
             self.log.info("Successfully read transaction log!")
             return trans_log
+
+    def iter_formatted_logs(
+        self, *, keep_card: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream the formatted transaction logs in chunks.
+
+        Each chunk is read, formatted and yielded before the next one is
+        read, so memory use is bounded by the chunk size. Chunks are read
+        with pandas' C parser, since the pyarrow engine cannot read in
+        chunks.
+
+        Parameters
+        ----------
+        keep_card : bool, optional
+            Whether to add a "card" column, after the expense log
+            columns, with the card number of each row as text. It is ""
+            if the formatter has no `CARD_COL`. By default False.
+
+        Yields
+        ------
+        pd.DataFrame
+            The formatted rows of each chunk, keeping the row numbers of
+            the file as index.
+
+        """
+        with pd.read_csv(
+            self.file_path,
+            usecols=[*self.DATE_COLS, *self.SCHEMA],
+            dtype={**self.SCHEMA, **dict.fromkeys(self.DATE_COLS, "str")},
+            chunksize=self.chunk_size or DEFAULT_CHUNK_SIZE,
+        ) as reader:
+            for chunk in reader:
+                formatted = self._format_chunk(
+                    parse_date_columns(
+                        chunk, self.DATE_COLS, self.DATE_FORMAT
+                    )
+                )
+                if keep_card:
+                    formatted["card"] = (
+                        chunk.loc[formatted.index, self.CARD_COL]
+                        .astype("string")
+                        .fillna("")
+                        .to_numpy(dtype=object)
+                        if self.CARD_COL is not None
+                        else ""
+                    )
+                yield formatted
+
+    def write_formatted_logs(self, output_path: str) -> int:
+        """
+        Stream the formatted transaction logs to a CSV file.
+
+        Parameters
+        ----------
+        output_path : str
+            The path of the CSV file. Missing parent directories are
+            created.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        n_rows = 0
+        with output_path.open("w", encoding="utf-8", newline="") as f:
+            for chunk_idx, chunk in enumerate(self.iter_formatted_logs()):
+                chunk.to_csv(f, header=chunk_idx == 0, index=False)
+                n_rows += len(chunk)
+        self.log.info("Wrote %s formatted rows to %s", n_rows, output_path)
+        return n_rows
+
+    @abstractmethod
+    def _format_chunk(self, trans_log: pd.DataFrame) -> pd.DataFrame:
+        """
+        Format part of a transaction log as expense log rows.
+
+        Parameters
+        ----------
+        trans_log : pd.DataFrame
+            The rows of the transaction log, with parsed dates.
+
+        Returns
+        -------
+        pd.DataFrame
+            The expense log rows, with `EXPENSE_LOG_COLUMNS`.
+
+        """
@@ -1,10 +1,16 @@
 """Transaction log formatter for Capital One data."""
 
+from __future__ import annotations
+
 import logging
+from typing import ClassVar
 
 import pandas as pd
 
-from transaction_formatters.base_formatter import BaseFormatter
+from transaction_formatters.base_formatter import (
+    EXPENSE_LOG_COLUMNS,
+    BaseFormatter,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,10 +24,42 @@ class CapitalOneFormatter(BaseFormatter):
     ----------
     file_path : str
         The path to the CSV file containing the transaction logs.
+    engine : str | None, optional
+        Engine used to parse the file. See
+        `utils.file_helper.resolve_csv_engine`. By default None.
+    chunk_size : int | None, optional
+        If given, the transaction log is not read up front, and is
+        streamed in chunks of this many rows. By default None.
+
+    Notes
+    -----
+    Only the columns of `SCHEMA` and `DATE_COLS` are read, so
+    `cap_one_df` holds "Posted Date", "Card No.", "Description", "Debit"
+    and "Credit". The "Transaction Date" and "Category" columns of the
+    export are not read.
 
     """
 
-    def __init__(self, file_path: str) -> None:
+    # Only the columns used by `format_cap_one_logs`, and the card number
+    # telling apart the cards of one account, are read. Schema does not
+    # include date columns.
+    SCHEMA: ClassVar[dict[str, str]] = {
+        "Card No.": "Int64",
+        "Description": "str",
+        "Debit": "float64",
+        "Credit": "float64",
+    }
+    DATE_COLS: ClassVar[list[str]] = ["Posted Date"]
+    DATE_FORMAT: ClassVar[str] = "%Y-%m-%d"
+    PAYMENT_TYPE: ClassVar[str] = "Venture"
+    CARD_COL: ClassVar[str] = "Card No."
+
+    def __init__(
+        self,
+        file_path: str,
+        engine: str | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
         """
         Initialize the CapitalOneFormatter object.
 
@@ -29,6 +67,13 @@ class CapitalOneFormatter(BaseFormatter):
         ----------
         file_path : str
             The path to the CSV file containing the transaction logs.
+        engine : str | None, optional
+            Engine used to parse the file. See
+            `utils.file_helper.resolve_csv_engine`. By default None.
+        chunk_size : int | None, optional
+            If given, the transaction log is not read up front, and is
+            streamed in chunks of this many rows. See
+            `BaseFormatter.iter_formatted_logs`. By default None.
 
         Raises
         ------
@@ -36,18 +81,17 @@ class CapitalOneFormatter(BaseFormatter):
             If the transaction logs cannot be read from the file path.
 
         """
-        super().__init__(file_path)
+        super().__init__(file_path, engine, chunk_size)
         self.logger = logger
+        if chunk_size is not None:
+            # The transaction log is streamed when it is formatted
+            self.cap_one_df = None
+            return
+
         self.cap_one_df = self._read_transaction_logs(
-            # Schema does not include date columns
-            schema={
-                "Card No.": "Int64",
-                "Description": "str",
-                "Category": "str",
-                "Debit": "float64",
-                "Credit": "float64",
-            },
-            date_cols=["Transaction Date", "Posted Date"],
+            schema=self.SCHEMA,
+            date_cols=self.DATE_COLS,
+            date_format=self.DATE_FORMAT,
         )
 
         if self.cap_one_df is None:
@@ -64,45 +108,57 @@ class CapitalOneFormatter(BaseFormatter):
         """
         Format the transaction logs for Capital One.
 
+        When the formatter streams the transaction log, the formatted
+        chunks are concatenated.
+
         Returns
         -------
         pd.DataFrame
             The formatted DataFrame containing the transaction logs.
 
         """
-        format_df = self.cap_one_df.copy()
-        # Remove credit transactions
-        format_df = format_df[
-            (format_df["Credit"] == 0) | (format_df["Credit"].isna())
-        ]
-
-        # Insert blank columns for category and subcategory
-        format_df["category"] = ""
-        format_df["subcategory"] = ""
-
-        # Insert payment_type
-        format_df["payment_type"] = "Venture"
-
-        # Drop unneeded columns
-        format_df = format_df[
-            [
-                "Posted Date",
-                "category",
-                "subcategory",
-                "Debit",
-                "payment_type",
-                "Description",
-            ]
-        ]
-
-        # Rename columns to match expected output
-        format_df = format_df.rename(
-            columns={
-                "Posted Date": "date",
-                "Debit": "amount",
-                "Description": "note",
-            }
-        )
+        if self.cap_one_df is None:
+            format_df = pd.concat(list(self.iter_formatted_logs()))
+        else:
+            format_df = self._format_chunk(self.cap_one_df)
 
         self.cap_one_formatted_df = format_df
         return self.cap_one_formatted_df
+
+    def _format_chunk(self, trans_log: pd.DataFrame) -> pd.DataFrame:
+        """
+        Format part of the Capital One transaction logs.
+
+        Parameters
+        ----------
+        trans_log : pd.DataFrame
+            The rows of the transaction log, with parsed dates.
+
+        Returns
+        -------
+        pd.DataFrame
+            The debit transactions as expense log rows, with blank
+            category and subcategory.
+
+        """
+        # Remove credit transactions
+        credit = trans_log["Credit"]
+        is_debit = (credit == 0) | credit.isna()
+
+        # Keep only relevant columns and rename them
+        return (
+            trans_log.loc[
+                is_debit, ["Posted Date", "Debit", "Description"]
+            ]
+            .rename(
+                columns={
+                    "Posted Date": "date",
+                    "Debit": "amount",
+                    "Description": "note",
+                }
+            )
+            .assign(
+                category="", subcategory="", payment_type=self.PAYMENT_TYPE
+            )
+            .reindex(columns=EXPENSE_LOG_COLUMNS)
+        )
@@ -0,0 +1,404 @@
+"""Detection of transactions imported from overlapping statements."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from transaction_formatters.merchant_normalizer import (
+    NORMALIZER_VERSION,
+    clean_description,
+)
+from utils.file_helper import setup_logging
+
+# Number of index segments above which they are merged into one
+DEFAULT_MAX_SEGMENTS = 16
+SEGMENT_PREFIX = "segment_"
+# Bump when `transaction_fingerprints` changes, so that persisted indexes
+# are refused rather than matching no transaction
+FINGERPRINT_VERSION = 1
+# Versions of the fingerprints stored in an index. They depend on
+# `clean_description` too.
+FINGERPRINT_SCHEME = {
+    "fingerprint_version": FINGERPRINT_VERSION,
+    "normalizer_version": NORMALIZER_VERSION,
+}
+SCHEME_FILE = "scheme.json"
+
+
+def transaction_fingerprints(
+    expense_log: pd.DataFrame,
+    sources: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Compute a stable fingerprint of each transaction of an expense log.
+
+    A transaction is identified by its date, amount in cents, cleaned
+    note, payment type and card number, and by how many identical
+    transactions come before it in its statement. Repeated identical
+    transactions of a statement, such as two coffees on the same day,
+    get different fingerprints, while the same transaction exported
+    again in another statement gets the same fingerprint. Fingerprints
+    are computed with `pd.util.hash_pandas_object`, which does not
+    depend on the Python process.
+
+    Parameters
+    ----------
+    expense_log : pd.DataFrame
+        The expense log, with "date", "amount", "note" and
+        "payment_type" columns, and optionally a "card" column telling
+        apart the cards of one payment type. See
+        `BaseFormatter.iter_formatted_logs`.
+    sources : np.ndarray | None, optional
+        The statement of each transaction. By default None, which
+        counts repeats over the whole expense log.
+
+    Returns
+    -------
+    np.ndarray
+        The uint64 fingerprint of each transaction.
+
+    """
+    codes, uniques = pd.factorize(expense_log["note"])
+    # The last description, for the missing notes, whose code is -1, is ""
+    descriptions = np.array(
+        [clean_description(str(note)) for note in uniques] + [""],
+        dtype=object,
+    )
+    card = (
+        expense_log["card"]
+        if "card" in expense_log.columns
+        else pd.Series("", index=expense_log.index)
+    )
+    keys = pd.util.hash_pandas_object(
+        pd.DataFrame({
+            "date": pd.to_datetime(expense_log["date"]).to_numpy(),
+            "cents": np.round(
+                expense_log["amount"].to_numpy(dtype=np.float64) * 100
+            ),
+            "description": descriptions[codes],
+            "payment_type": expense_log["payment_type"]
+            .fillna("")
+            .astype(str)
+            .to_numpy(),
+            "card": card.fillna("").astype(str).to_numpy(),
+        }),
+        index=False,
+    ).to_numpy()
+    occurrences = (
+        pd.Series(keys)
+        .groupby(
+            [keys] if sources is None else [sources, keys], sort=False
+        )
+        .cumcount()
+        .to_numpy()
+    )
+    return pd.util.hash_pandas_object(
+        pd.DataFrame({"key": keys, "occurrence": occurrences}),
+        index=False,
+    ).to_numpy()
+
+
+class TransactionIndex:
+    """
+    Persisted set of the fingerprints of imported transactions.
+
+    Fingerprints are stored in a directory as sorted NumPy segments, one
+    per call to `add`, which are memory-mapped and binary searched, so
+    checking and adding new transactions costs time in the number of new
+    transactions rather than of imported ones. Segments are merged into
+    one when there are more than `max_segments`. The directory also
+    records the `FINGERPRINT_SCHEME` of its fingerprints.
+
+    Parameters
+    ----------
+    index_dir : str
+        The directory of the index. It is created when fingerprints are
+        first added.
+    max_segments : int, optional
+        The number of segments above which they are merged. By default
+        `DEFAULT_MAX_SEGMENTS`.
+
+    """
+
+    def __init__(
+        self,
+        index_dir: str,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+    ) -> None:
+        """
+        Initialize the TransactionIndex object.
+
+        Parameters
+        ----------
+        index_dir : str
+            The directory of the index. It is created when fingerprints
+            are first added.
+        max_segments : int, optional
+            The number of segments above which they are merged. By
+            default `DEFAULT_MAX_SEGMENTS`.
+
+        Raises
+        ------
+        ValueError
+            If the index holds fingerprints of another scheme, which
+            would not match those of the same transactions.
+
+        """
+        self.index_dir = Path(index_dir)
+        self.max_segments = max_segments
+        self.segments = [
+            np.load(path, mmap_mode="r") for path in self._segment_paths()
+        ]
+        scheme_path = self.index_dir / SCHEME_FILE
+        scheme = (
+            json.loads(scheme_path.read_text(encoding="utf-8"))
+            if scheme_path.exists()
+            else None
+        )
+        if self.segments and scheme != FINGERPRINT_SCHEME:
+            msg = (
+                f"Transaction index {index_dir} has fingerprint scheme "
+                f"{scheme}, not {FINGERPRINT_SCHEME}. Import the "
+                "transactions into a new index."
+            )
+            raise ValueError(msg)
+
+    def __len__(self) -> int:
+        """
+        Return the number of fingerprints in the index.
+
+        Returns
+        -------
+        int
+            The number of fingerprints.
+
+        """
+        return sum(len(segment) for segment in self.segments)
+
+    def _segment_paths(self) -> list[Path]:
+        """
+        Return the paths of the segments, from oldest to newest.
+
+        Returns
+        -------
+        list[Path]
+            The paths of the segment files.
+
+        """
+        return sorted(self.index_dir.glob(f"{SEGMENT_PREFIX}*.npy"))
+
+    def contains(self, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Check which fingerprints are in the index.
+
+        Parameters
+        ----------
+        fingerprints : np.ndarray
+            The uint64 fingerprints.
+
+        Returns
+        -------
+        np.ndarray
+            Whether each fingerprint is in the index.
+
+        """
+        found = np.zeros(len(fingerprints), dtype=bool)
+        for segment in self.segments:
+            if not len(segment):
+                continue
+            positions = np.minimum(
+                np.searchsorted(segment, fingerprints), len(segment) - 1
+            )
+            found |= segment[positions] == fingerprints
+        return found
+
+    def add(self, fingerprints: np.ndarray) -> None:
+        """
+        Add fingerprints to the index as a new segment.
+
+        Parameters
+        ----------
+        fingerprints : np.ndarray
+            The uint64 fingerprints, which should not be in the index
+            yet.
+
+        """
+        if not len(fingerprints):
+            return
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        if not self.segments:
+            (self.index_dir / SCHEME_FILE).write_text(
+                json.dumps(FINGERPRINT_SCHEME), encoding="utf-8"
+            )
+        self.segments.append(
+            self._write_segment(np.unique(fingerprints.astype(np.uint64)))
+        )
+        if len(self.segments) > self.max_segments:
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge every segment of the index into one."""
+        paths = self._segment_paths()
+        if len(paths) <= 1:
+            return
+        merged = np.unique(np.concatenate(self.segments))
+        self.segments = [self._write_segment(merged)]
+        for path in paths:
+            path.unlink()
+
+    def _write_segment(self, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Write a segment after the existing ones and memory-map it.
+
+        Parameters
+        ----------
+        fingerprints : np.ndarray
+            The sorted unique fingerprints of the segment.
+
+        Returns
+        -------
+        np.ndarray
+            The memory-mapped segment.
+
+        """
+        paths = self._segment_paths()
+        number = (
+            int(paths[-1].stem.removeprefix(SEGMENT_PREFIX)) + 1
+            if paths
+            else 0
+        )
+        path = self.index_dir / f"{SEGMENT_PREFIX}{number:06d}.npy"
+        # Write to a temporary file so a partially written segment is
+        # never read
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            np.save(f, fingerprints)
+        tmp_path.replace(path)
+        return np.load(path, mmap_mode="r")
+
+
+class TransactionDeduplicator:
+    """
+    Removes transactions that were already imported.
+
+    The fingerprints of the transactions kept by `deduplicate` are held
+    as pending until `commit` adds them to a persisted
+    `TransactionIndex`, so later imports of overlapping statements skip
+    them. Commit once the new transactions are saved: if the import
+    fails before, nothing is recorded and it can be run again.
+
+    Parameters
+    ----------
+    index_dir : str
+        The directory of the index of imported transactions.
+    max_segments : int, optional
+        See `TransactionIndex`. By default `DEFAULT_MAX_SEGMENTS`.
+
+    """
+
+    def __init__(
+        self,
+        index_dir: str,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+    ) -> None:
+        """
+        Initialize the TransactionDeduplicator object.
+
+        Parameters
+        ----------
+        index_dir : str
+            The directory of the index of imported transactions.
+        max_segments : int, optional
+            See `TransactionIndex`. By default `DEFAULT_MAX_SEGMENTS`.
+
+        """
+        self.log = setup_logging()
+        self.index = TransactionIndex(index_dir, max_segments)
+        self.timings = {}
+        self.skipped = 0
+        self.kept = 0
+        self.pending = np.empty(0, dtype=np.uint64)
+
+    def deduplicate(
+        self,
+        expense_log: pd.DataFrame,
+        sources: np.ndarray | None = None,
+    ) -> pd.DataFrame:
+        """
+        Drop already imported transactions.
+
+        A transaction is dropped if its fingerprint is in the index, or
+        if an earlier transaction of the expense log from another
+        statement has the same fingerprint. See
+        `transaction_fingerprints`. The fingerprints of the kept
+        transactions replace the pending ones, and are only recorded as
+        imported by `commit`.
+
+        Parameters
+        ----------
+        expense_log : pd.DataFrame
+            The expense log, e.g. formatted transaction logs.
+        sources : np.ndarray | None, optional
+            The statement of each transaction, so that overlapping
+            statements imported together are deduplicated. By default
+            None, which treats the expense log as a single statement.
+
+        Returns
+        -------
+        pd.DataFrame
+            The new transactions, keeping their index.
+
+        """
+        start = time.perf_counter()
+        fingerprints = transaction_fingerprints(expense_log, sources)
+        self.timings["fingerprint_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        is_new = ~(
+            self.index.contains(fingerprints)
+            | pd.Series(fingerprints).duplicated().to_numpy()
+        )
+        self.pending = fingerprints[is_new]
+        self.timings["index_s"] = time.perf_counter() - start
+
+        self.kept = int(is_new.sum())
+        self.skipped = len(is_new) - self.kept
+        self.log.info(
+            "Skipped %s already imported transactions of %s",
+            self.skipped,
+            len(is_new),
+        )
+        return expense_log[is_new]
+
+    def commit(self) -> None:
+        """Record the transactions kept by `deduplicate` as imported."""
+        start = time.perf_counter()
+        self.index.add(self.pending)
+        self.timings["commit_s"] = time.perf_counter() - start
+        self.log.info(
+            "Recorded %s imported transactions", len(self.pending)
+        )
+        self.pending = np.empty(0, dtype=np.uint64)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the statistics of the last deduplication.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of kept and skipped transactions, of transactions
+            waiting to be committed, and of transactions in the index.
+
+        """
+        return {
+            "kept": self.kept,
+            "skipped": self.skipped,
+            "pending": len(self.pending),
+            "indexed": len(self.index),
+        }
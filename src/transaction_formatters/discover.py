@@ -1,10 +1,16 @@
 """Transaction log formatter for Discover data."""
 
+from __future__ import annotations
+
 import logging
+from typing import ClassVar
 
 import pandas as pd
 
-from transaction_formatters.base_formatter import BaseFormatter
+from transaction_formatters.base_formatter import (
+    EXPENSE_LOG_COLUMNS,
+    BaseFormatter,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,10 +24,31 @@ class DiscoverFormatter(BaseFormatter):
     ----------
     file_path : str
         The path to the CSV file containing the transaction logs.
+    engine : str | None, optional
+        Engine used to parse the file. See
+        `utils.file_helper.resolve_csv_engine`. By default None.
+    chunk_size : int | None, optional
+        If given, the transaction log is not read up front, and is
+        streamed in chunks of this many rows. By default None.
 
     """
 
-    def __init__(self, file_path: str) -> None:
+    # Only the columns used by `format_discover_logs` are read. Schema
+    # does not include date columns.
+    SCHEMA: ClassVar[dict[str, str]] = {
+        "Description": "str",
+        "Amount": "float64",
+    }
+    DATE_COLS: ClassVar[list[str]] = ["Post Date"]
+    DATE_FORMAT: ClassVar[str] = "%m/%d/%Y"
+    PAYMENT_TYPE: ClassVar[str] = "Discover"
+
+    def __init__(
+        self,
+        file_path: str,
+        engine: str | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
         """
         Initialize the DiscoverFormatter object.
 
@@ -29,6 +56,13 @@ class DiscoverFormatter(BaseFormatter):
         ----------
         file_path : str
             The path to the CSV file containing the transaction logs.
+        engine : str | None, optional
+            Engine used to parse the file. See
+            `utils.file_helper.resolve_csv_engine`. By default None.
+        chunk_size : int | None, optional
+            If given, the transaction log is not read up front, and is
+            streamed in chunks of this many rows. See
+            `BaseFormatter.iter_formatted_logs`. By default None.
 
         Raises
         ------
@@ -36,16 +70,17 @@ class DiscoverFormatter(BaseFormatter):
             If the transaction logs cannot be read from the file path.
 
         """
-        super().__init__(file_path)
+        super().__init__(file_path, engine, chunk_size)
         self.logger = logger
+        if chunk_size is not None:
+            # The transaction log is streamed when it is formatted
+            self.discover_df = None
+            return
+
         self.discover_df = self._read_transaction_logs(
-            # Schema does not include date columns
-            schema={
-                "Description": "str",
-                "Amount": "float64",
-                "Category": "str",
-            },
-            date_cols=["Trans. Date", "Post Date"],
+            schema=self.SCHEMA,
+            date_cols=self.DATE_COLS,
+            date_format=self.DATE_FORMAT,
         )
 
         if self.discover_df is None:
@@ -60,42 +95,54 @@ class DiscoverFormatter(BaseFormatter):
         """
         Format the transaction logs for Discover.
 
+        When the formatter streams the transaction log, the formatted
+        chunks are concatenated.
+
         Returns
         -------
         pd.DataFrame
             The formatted DataFrame containing the transaction logs.
 
         """
-        format_df = self.discover_df.copy()
-        # Remove credit transactions (which are negative in Discover data)
-        format_df = format_df[format_df["Amount"] > 0]
+        if self.discover_df is None:
+            format_df = pd.concat(list(self.iter_formatted_logs()))
+        else:
+            format_df = self._format_chunk(self.discover_df)
 
-        # Insert blank columns for category and subcategory
-        format_df["category"] = ""
-        format_df["subcategory"] = ""
+        self.discover_formatted_df = format_df
+        return self.discover_formatted_df
+
+    def _format_chunk(self, trans_log: pd.DataFrame) -> pd.DataFrame:
+        """
+        Format part of the Discover transaction logs.
 
-        # Insert payment_type
-        format_df["payment_type"] = "Discover"
+        Parameters
+        ----------
+        trans_log : pd.DataFrame
+            The rows of the transaction log, with parsed dates.
+
+        Returns
+        -------
+        pd.DataFrame
+            The debit transactions as expense log rows, with blank
+            category and subcategory.
+
+        """
+        # Remove credit transactions (which are negative in Discover data)
+        is_debit = trans_log["Amount"] > 0
 
         # Keep only relevant columns and rename them
-        format_df = format_df[
-            [
-                "Post Date",
-                "category",
-                "subcategory",
-                "Amount",
-                "payment_type",
-                "Description",
-            ]
-        ]
-
-        format_df = format_df.rename(
-            columns={
-                "Post Date": "date",
-                "Amount": "amount",
-                "Description": "note",
-            },
+        return (
+            trans_log.loc[is_debit, ["Post Date", "Amount", "Description"]]
+            .rename(
+                columns={
+                    "Post Date": "date",
+                    "Amount": "amount",
+                    "Description": "note",
+                }
+            )
+            .assign(
+                category="", subcategory="", payment_type=self.PAYMENT_TYPE
+            )
+            .reindex(columns=EXPENSE_LOG_COLUMNS)
         )
-
-        self.discover_formatted_df = format_df
-        return self.discover_formatted_df
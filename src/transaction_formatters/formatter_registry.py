@@ -0,0 +1,214 @@
+"""Registry of the transaction log formatters, by bank."""
+
+from __future__ import annotations
+
+import glob
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from transaction_formatters.base_formatter import (
+    DEFAULT_CHUNK_SIZE,
+    EXPENSE_LOG_COLUMNS,
+    BaseFormatter,
+)
+from transaction_formatters.capital_one import CapitalOneFormatter
+from transaction_formatters.discover import DiscoverFormatter
+
+if TYPE_CHECKING:
+    from categorizers.base_categorizer import BaseCategorizer
+    from transaction_formatters.deduplicator import TransactionDeduplicator
+    from transaction_formatters.merchant_normalizer import (
+        MerchantNormalizer,
+    )
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FORMATTERS = {
+    "capital_one": CapitalOneFormatter,
+    "discover": DiscoverFormatter,
+}
+# Rows read below the header to identify the bank of a transaction log
+SAMPLE_ROWS = 20
+
+
+def register_formatter(
+    bank: str, formatter_cls: type[BaseFormatter]
+) -> None:
+    """
+    Register a formatter for the transaction logs of a bank.
+
+    Parameters
+    ----------
+    bank : str
+        The name of the bank, e.g. "discover".
+    formatter_cls : type[BaseFormatter]
+        The formatter class. Replaces any formatter already registered
+        for the bank.
+
+    """
+    FORMATTERS[bank] = formatter_cls
+
+
+def detect_formatter(file_path: str) -> type[BaseFormatter]:
+    """
+    Identify the formatter of a transaction log from its first rows.
+
+    Only the header line and the first `SAMPLE_ROWS` rows are read.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the CSV file containing the transaction logs.
+
+    Returns
+    -------
+    type[BaseFormatter]
+        The only registered formatter matching the sample. See
+        `BaseFormatter.matches`.
+
+    Raises
+    ------
+    ValueError
+        If the file cannot be read as CSV, or if no formatter or more
+        than one formatter matches it.
+
+    """
+    try:
+        sample = pd.read_csv(file_path, nrows=SAMPLE_ROWS, dtype=str)
+    except (OSError, ValueError) as e:
+        msg = f"Cannot read transaction log {file_path}: {e}"
+        raise ValueError(msg) from e
+
+    banks = [
+        bank
+        for bank, formatter_cls in FORMATTERS.items()
+        if formatter_cls.matches(sample)
+    ]
+    if len(banks) != 1:
+        msg = (
+            f"Unrecognized transaction log {file_path}: "
+            f"{'no bank' if not banks else ', '.join(banks)} matched "
+            f"columns {', '.join(sample.columns)}."
+        )
+        raise ValueError(msg)
+    return FORMATTERS[banks[0]]
+
+
+def ingest_statements(  # noqa: PLR0913
+    patterns: str | list[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    skip_invalid: bool = False,
+    deduplicator: TransactionDeduplicator | None = None,
+    normalizer: MerchantNormalizer | None = None,
+    categorizer: BaseCategorizer | None = None,
+) -> pd.DataFrame:
+    """
+    Format transaction logs of any registered bank into one expense log.
+
+    The bank of every file is identified first with `detect_formatter`,
+    so unrecognized files are rejected before any file is fully read.
+    Each file is then streamed through its formatter.
+
+    Parameters
+    ----------
+    patterns : str | list[str]
+        Paths or glob patterns of the CSV files. "**" matches any number
+        of directories.
+    chunk_size : int, optional
+        Rows of a file formatted at a time. By default
+        `DEFAULT_CHUNK_SIZE`.
+    skip_invalid : bool, optional
+        Whether to log and skip unrecognized files rather than raise.
+        By default False.
+    deduplicator : TransactionDeduplicator | None, optional
+        If given, drops the formatted rows imported before or repeated
+        by an overlapping file, telling apart the cards of a bank whose
+        formatter reads card numbers. The kept rows are not recorded as
+        imported until `deduplicator.commit()` is called, which should
+        be done once they are saved. See
+        `transaction_formatters.deduplicator.TransactionDeduplicator`.
+        By default None, which keeps every row.
+    normalizer : MerchantNormalizer | None, optional
+        If given, adds the merchant name of each formatted row as a
+        "merchant" column, after deduplication, and persists its cache.
+        The notes keep the raw descriptions. See
+        `transaction_formatters.merchant_normalizer.MerchantNormalizer`.
+        By default None, which adds no merchant names.
+    categorizer : BaseCategorizer | None, optional
+        If given, fills the category and subcategory of the formatted
+        rows from their raw descriptions. See
+        `categorizers.base_categorizer.BaseCategorizer`. By default
+        None, which leaves them blank.
+
+    Returns
+    -------
+    pd.DataFrame
+        The formatted rows of every file, in file path order, with the
+        expense log columns, followed by "merchant" if a normalizer is
+        given, and a new index.
+
+    Raises
+    ------
+    ValueError
+        If a file is unrecognized and `skip_invalid` is False.
+
+    """
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    file_paths = sorted({
+        file_path
+        for pattern in patterns
+        for file_path in glob.glob(pattern, recursive=True)  # noqa: PTH207
+    })
+
+    formatters = []
+    errors = []
+    for file_path in file_paths:
+        try:
+            formatter_cls = detect_formatter(file_path)
+        except ValueError as e:
+            errors.append(str(e))
+            continue
+        formatters.append(formatter_cls(file_path, chunk_size=chunk_size))
+    if errors and not skip_invalid:
+        raise ValueError("\n".join(errors))
+    for error in errors:
+        logger.error("Skipping %s", error)
+
+    # Chunks with the position of their file, to deduplicate overlapping
+    # files
+    chunks = [
+        (source, chunk)
+        for source, formatter in enumerate(formatters)
+        for chunk in formatter.iter_formatted_logs(
+            keep_card=deduplicator is not None
+        )
+    ]
+    if not chunks:
+        return pd.DataFrame(columns=EXPENSE_LOG_COLUMNS)
+    expense_log = pd.concat(
+        [chunk for _, chunk in chunks], ignore_index=True
+    )
+    if deduplicator is not None:
+        sources = np.repeat(
+            [source for source, _ in chunks],
+            [len(chunk) for _, chunk in chunks],
+        )
+        # The card number tells apart the cards of a bank, but is not an
+        # expense log column
+        expense_log = (
+            deduplicator.deduplicate(expense_log, sources)
+            .drop(columns="card")
+            .reset_index(drop=True)
+        )
+    if normalizer is not None:
+        expense_log = normalizer.normalize_logs(expense_log)
+        normalizer.save()
+    if categorizer is not None:
+        expense_log = categorizer.categorize(expense_log)
+    return expense_log
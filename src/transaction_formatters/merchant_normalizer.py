@@ -0,0 +1,327 @@
+"""Normalization of transaction descriptions into merchant names."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.file_helper import load_yaml, setup_logging
+
+PARENT_DIR = Path(__file__).resolve().parent.parent.parent
+ALIASES_PATH = str(PARENT_DIR / "configs" / "merchant_aliases.yaml")
+# Bump when `clean_description` changes to invalidate persisted caches
+NORMALIZER_VERSION = 1
+# Default number of descriptions kept by a MerchantNormalizer
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Payment processor prefixes, e.g. "SQ *" or "PAYPAL *"
+PROCESSOR_PREFIX = re.compile(r"^(?:SQ|TST|PAYPAL|PP|SP)\s*\*\s*")
+# Web address suffixes, e.g. ".COM/BILL"
+WEB_SUFFIX = re.compile(r"\.(?:COM|NET|ORG)(?:/\S*)?")
+# Reference codes, store numbers and other numbers, e.g. "*2K3LL0",
+# "#123" or "0042"
+REFERENCE = re.compile(r"\*\S*|#\s*\d+|\b\d+\b")
+# A two-letter state code ending a description of several words
+TRAILING_STATE = re.compile(r"(?<=\S)\s+[A-Z]{2}$")
+
+
+def clean_description(description: str) -> str:
+    """
+    Remove the parts of a description that vary between transactions.
+
+    Parameters
+    ----------
+    description : str
+        The raw description, e.g. "SQ *BLUE BOTTLE #12 OAKLAND CA".
+
+    Returns
+    -------
+    str
+        The uppercased description without payment processor prefix,
+        web address suffix, reference codes, numbers and trailing state
+        code, e.g. "BLUE BOTTLE OAKLAND". The uppercased description if
+        nothing would be left.
+
+    """
+    raw = " ".join(description.upper().split())
+    cleaned = PROCESSOR_PREFIX.sub("", raw)
+    cleaned = WEB_SUFFIX.sub("", cleaned)
+    cleaned = " ".join(REFERENCE.sub(" ", cleaned).split())
+    cleaned = TRAILING_STATE.sub("", cleaned).strip(" -*,")
+    return cleaned or raw
+
+
+def load_aliases(aliases_path: str) -> list[tuple[str, re.Pattern]]:
+    """
+    Load the canonical merchant names from a YAML file.
+
+    Each merchant has a "name" and a list of substrings under
+    "contains". See `configs/merchant_aliases.yaml`.
+
+    Parameters
+    ----------
+    aliases_path : str
+        The path to the aliases YAML file.
+
+    Returns
+    -------
+    list[tuple[str, re.Pattern]]
+        The name of each merchant and a case-insensitive pattern matching
+        any of its substrings, in file order.
+
+    Raises
+    ------
+    ValueError
+        If a merchant is missing its name or substrings.
+
+    """
+    aliases = []
+    for entry in (load_yaml(aliases_path) or {}).get("merchants", []):
+        if not entry.get("name") or not entry.get("contains"):
+            msg = f"Merchant {entry} needs a 'name' and 'contains'."
+            raise ValueError(msg)
+        pattern = "|".join(re.escape(s) for s in entry["contains"])
+        aliases.append((
+            str(entry["name"]),
+            re.compile(pattern, re.IGNORECASE),
+        ))
+    return aliases
+
+
+class MerchantNormalizer:
+    """
+    Maps raw transaction descriptions to canonical merchant names.
+
+    Each distinct description is normalized once per batch. Normalized
+    descriptions are kept in a cache holding at most `max_entries` of
+    the most recently used ones. When a cache path is given, the cache
+    is loaded from it and written back by `save`, so descriptions seen
+    in earlier imports are not normalized again. A persisted cache is
+    ignored when the aliases or the normalization rules change.
+
+    Parameters
+    ----------
+    cache_path : str | None, optional
+        The path of the JSON file persisting the cache. By default None,
+        which keeps the cache in memory only.
+    max_entries : int, optional
+        The maximum number of cached descriptions. By default
+        `DEFAULT_MAX_ENTRIES`.
+    aliases_path : str, optional
+        The path to the aliases YAML file. By default `ALIASES_PATH`.
+
+    """
+
+    def __init__(
+        self,
+        cache_path: str | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        aliases_path: str = ALIASES_PATH,
+    ) -> None:
+        """
+        Initialize the MerchantNormalizer object.
+
+        Parameters
+        ----------
+        cache_path : str | None, optional
+            The path of the JSON file persisting the cache. By default
+            None, which keeps the cache in memory only.
+        max_entries : int, optional
+            The maximum number of cached descriptions. By default
+            `DEFAULT_MAX_ENTRIES`.
+        aliases_path : str, optional
+            The path to the aliases YAML file. By default
+            `ALIASES_PATH`.
+
+        """
+        self.log = setup_logging()
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.aliases = load_aliases(aliases_path)
+        self.fingerprint = hashlib.sha256(
+            json.dumps([
+                NORMALIZER_VERSION,
+                [(name, p.pattern) for name, p in self.aliases],
+            ]).encode("utf-8")
+        ).hexdigest()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.timings = {}
+        # Most recently used descriptions are at the end
+        self._entries = OrderedDict()
+        if cache_path is not None:
+            self._load()
+
+    def canonical_name(self, description: str) -> str:
+        """
+        Return the merchant name of a description, without the cache.
+
+        Parameters
+        ----------
+        description : str
+            The raw description.
+
+        Returns
+        -------
+        str
+            The name of the first merchant whose substrings occur in the
+            cleaned description, or the cleaned description. See
+            `clean_description`.
+
+        """
+        cleaned = clean_description(description)
+        return next(
+            (
+                name
+                for name, pattern in self.aliases
+                if pattern.search(cleaned)
+            ),
+            cleaned,
+        )
+
+    def normalize(self, descriptions: pd.Series) -> pd.Series:
+        """
+        Map descriptions to their merchant names.
+
+        Parameters
+        ----------
+        descriptions : pd.Series
+            The raw descriptions.
+
+        Returns
+        -------
+        pd.Series
+            The merchant name of each description, with the same index.
+            Missing descriptions stay missing.
+
+        """
+        start = time.perf_counter()
+        codes, uniques = pd.factorize(descriptions)
+        # The last name, for the missing descriptions, whose code is -1,
+        # is missing
+        names = np.array(
+            [self._lookup(str(description)) for description in uniques]
+            + [np.nan],
+            dtype=object,
+        )
+        merchants = pd.Series(names[codes], index=descriptions.index)
+        self.timings["normalize_s"] = time.perf_counter() - start
+        return merchants
+
+    def normalize_logs(self, expense_log: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add the merchant name of each note of an expense log.
+
+        The notes are kept as described by the bank, so that they can
+        still be categorized by their raw text. The expense log is not
+        modified.
+
+        Parameters
+        ----------
+        expense_log : pd.DataFrame
+            The expense log, e.g. formatted transaction logs.
+
+        Returns
+        -------
+        pd.DataFrame
+            A copy of the expense log with a "merchant" column holding
+            the merchant name of each note.
+
+        """
+        result = expense_log.copy(deep=False)
+        result["merchant"] = self.normalize(expense_log["note"])
+        self.log.info(
+            "Normalized %s notes, cache hit rate %.1f%%",
+            len(result),
+            100 * self.stats()["hit_rate"],
+        )
+        return result
+
+    def _lookup(self, description: str) -> str:
+        """
+        Return the merchant name of a description, using the cache.
+
+        Parameters
+        ----------
+        description : str
+            The raw description.
+
+        Returns
+        -------
+        str
+            The merchant name. See `canonical_name`.
+
+        """
+        name = self._entries.get(description)
+        if name is not None:
+            self.hits += 1
+            self._entries.move_to_end(description)
+            return name
+        self.misses += 1
+        name = self.canonical_name(description)
+        self._entries[description] = name
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return name
+
+    def _load(self) -> None:
+        """Load the persisted cache, if it matches the aliases."""
+        try:
+            with Path(self.cache_path).open(encoding="utf-8") as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if cache.get("fingerprint") != self.fingerprint:
+            self.log.info("Ignoring outdated merchant cache")
+            return
+        # Entries are persisted from least to most recently used
+        for description, name in cache["entries"][-self.max_entries :]:
+            self._entries[description] = name
+
+    def save(self) -> None:
+        """Persist the cache to `cache_path`, if it is set."""
+        if self.cache_path is None:
+            return
+        cache_path = Path(self.cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file so a partially written cache is never
+        # read
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "fingerprint": self.fingerprint,
+                    "entries": list(self._entries.items()),
+                },
+                f,
+            )
+        tmp_path.replace(cache_path)
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Return the cache statistics.
+
+        Returns
+        -------
+        dict[str, int | float]
+            The number of hits, misses and evictions, the hit rate, and
+            the number of cached descriptions.
+
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,364 @@
+"""Utils functions to cache parsed DataFrames and reports."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+# Bump when the layout of cache entries changes to invalidate old entries
+CACHE_VERSION = 1
+METADATA_FILE = "metadata.json"
+# Default memory budget of a ReportCache, in bytes
+REPORT_CACHE_BYTES = 256 * 2**20
+
+
+def cache_format() -> str:
+    """
+    Return the file format used for cached DataFrames.
+
+    Returns
+    -------
+    str
+        "parquet" if pyarrow is installed, otherwise "pickle".
+
+    """
+    return "parquet" if find_spec("pyarrow") is not None else "pickle"
+
+
+def cache_entry_name(excel_path: str, sheet_names: list[str]) -> str:
+    """
+    Return the name of the cache entry for sheets of a source file.
+
+    Parameters
+    ----------
+    excel_path : str
+        The path to the source Excel file.
+    sheet_names : list[str]
+        The names of the cached sheets.
+
+    Returns
+    -------
+    str
+        A stable name identifying the source file and sheets.
+
+    """
+    identity = json.dumps([str(Path(excel_path).resolve()), sheet_names])
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+
+
+def source_fingerprint(excel_path: str, schema: dict) -> str:
+    """
+    Fingerprint a source file and the schema used to validate it.
+
+    The fingerprint changes whenever the file is modified or the schema
+    changes, which invalidates any cache entry saved under the old one.
+
+    Parameters
+    ----------
+    excel_path : str
+        The path to the source Excel file.
+    schema : dict
+        The schema used to validate the sheets of the file.
+
+    Returns
+    -------
+    str
+        The fingerprint of the file and schema.
+
+    """
+    stat = Path(excel_path).stat()
+    payload = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "schema": schema,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_frame(file_path: Path, file_format: str) -> pd.DataFrame:
+    """
+    Read a single cached DataFrame.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the cached DataFrame.
+    file_format : str
+        The format of the file. See `cache_format`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The cached DataFrame.
+
+    """
+    if file_format == "pickle":
+        # Pickles are only ever read from entries written by this module
+        return pd.read_pickle(file_path)  # noqa: S301
+
+    cached_df = pd.read_parquet(file_path)
+    # Parquet restores missing strings as None, whereas Excel gives NaN
+    object_cols = cached_df.select_dtypes(include=["object"]).columns
+    cached_df[object_cols] = cached_df[object_cols].mask(
+        cached_df[object_cols].isna(), np.nan
+    )
+    return cached_df
+
+
+def load_cached_frames(
+    cache_dir: str,
+    entry_name: str,
+    fingerprint: str,
+) -> dict[str, pd.DataFrame] | None:
+    """
+    Load cached DataFrames if the entry matches the given fingerprint.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The directory containing the cache entries.
+    entry_name : str
+        The name of the cache entry. See `cache_entry_name`.
+    fingerprint : str
+        The current fingerprint of the source. See `source_fingerprint`.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame] | None
+        The cached DataFrames by name, or None if the entry is missing,
+        stale, or unreadable.
+
+    """
+    entry_dir = Path(cache_dir) / entry_name
+    try:
+        with Path.open(entry_dir / METADATA_FILE, encoding="utf-8") as f:
+            metadata = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if metadata.get("fingerprint") != fingerprint:
+        return None
+
+    try:
+        return {
+            name: _read_frame(entry_dir / file_name, metadata["format"])
+            for name, file_name in metadata["frames"].items()
+        }
+    except (FileNotFoundError, ImportError):
+        return None
+
+
+def save_cached_frames(
+    cache_dir: str,
+    entry_name: str,
+    fingerprint: str,
+    frames: dict[str, pd.DataFrame],
+) -> Path:
+    """
+    Save DataFrames to a cache entry, replacing any previous version.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The directory containing the cache entries.
+    entry_name : str
+        The name of the cache entry. See `cache_entry_name`.
+    fingerprint : str
+        The current fingerprint of the source. See `source_fingerprint`.
+    frames : dict[str, pd.DataFrame]
+        The DataFrames to cache, by name.
+
+    Returns
+    -------
+    Path
+        The directory of the cache entry.
+
+    """
+    entry_dir = Path(cache_dir) / entry_name
+    entry_dir.mkdir(parents=True, exist_ok=True)
+    # Invalidate the previous version before overwriting its frames
+    (entry_dir / METADATA_FILE).unlink(missing_ok=True)
+    file_format = cache_format()
+    suffix = ".parquet" if file_format == "parquet" else ".pkl"
+
+    file_names = {}
+    for i, (name, df) in enumerate(frames.items()):
+        file_names[name] = f"frame_{i}{suffix}"
+        if file_format == "parquet":
+            df.to_parquet(entry_dir / file_names[name])
+        else:
+            df.to_pickle(entry_dir / file_names[name])
+
+    # Write the metadata last so a partially written entry is never read
+    metadata = {
+        "fingerprint": fingerprint,
+        "format": file_format,
+        "frames": file_names,
+    }
+    tmp_path = entry_dir / f"{METADATA_FILE}.tmp"
+    with Path.open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f)
+    tmp_path.replace(entry_dir / METADATA_FILE)
+
+    return entry_dir
+
+
+def report_size(report: pd.DataFrame | list[pd.DataFrame, ...]) -> int:
+    """
+    Return the memory used by a report, in bytes.
+
+    Parameters
+    ----------
+    report : pd.DataFrame | list[pd.DataFrame, ...]
+        A DataFrame, or a list of DataFrames such as monthly reports.
+
+    Returns
+    -------
+    int
+        The memory used by the DataFrames, including object values.
+
+    """
+    if isinstance(report, pd.DataFrame):
+        return int(report.memory_usage(deep=True).sum())
+    return sum(report_size(df) for df in report)
+
+
+class ReportCache:
+    """
+    In-memory cache of reports, evicting the least recently used ones.
+
+    Keys must identify both the report parameters and the version of the
+    data the report was built from, so that entries for outdated data are
+    never returned and are eventually evicted.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget of the cached reports. Reports larger than the
+        budget are not cached. By default `REPORT_CACHE_BYTES`.
+
+    """
+
+    def __init__(self, max_bytes: int = REPORT_CACHE_BYTES) -> None:
+        """
+        Initialize the ReportCache object.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Memory budget of the cached reports. Reports larger than the
+            budget are not cached. By default `REPORT_CACHE_BYTES`.
+
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Most recently used entries are at the end
+        self._entries = OrderedDict()
+
+    def get(
+        self, key: Hashable
+    ) -> pd.DataFrame | list[pd.DataFrame, ...] | None:
+        """
+        Return a cached report and mark it as recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the report.
+
+        Returns
+        -------
+        pd.DataFrame | list[pd.DataFrame, ...] | None
+            The cached report, or None if it is not cached. Cached reports
+            are shared, and must not be modified.
+
+        """
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def put(
+        self,
+        key: Hashable,
+        report: pd.DataFrame | list[pd.DataFrame, ...],
+    ) -> None:
+        """
+        Cache a report, evicting least recently used reports as needed.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the report.
+        report : pd.DataFrame | list[pd.DataFrame, ...]
+            The report.
+
+        """
+        self.discard(key)
+        size = report_size(report)
+        if size > self.max_bytes:
+            return
+        while self.size_bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.evictions += 1
+        self._entries[key] = (report, size)
+        self.size_bytes += size
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove a report from the cache, if it is cached.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the report.
+
+        """
+        if key in self._entries:
+            _, size = self._entries.pop(key)
+            self.size_bytes -= size
+
+    def clear(self) -> None:
+        """Remove every report from the cache."""
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the cache statistics.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of hits, misses and evictions, and the number and
+            total size in bytes of the cached reports.
+
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+        }
@@ -1,8 +1,30 @@
 """Utils functions to help with data operations."""
 
+from __future__ import annotations
+
 from calendar import month_name
 
 import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Column order of the grouped expense report
+GROUPED_REPORT_COLUMNS = [
+    "month",
+    "category",
+    "subcategory",
+    "amount_budgeted",
+    "total_amount_spent",
+    "difference",
+]
+# Column order of the monthly reports split from the grouped report
+MONTHLY_REPORT_COLUMNS = [
+    "category",
+    "subcategory",
+    "month",
+    "total_amount_spent",
+    "amount_budgeted",
+    "difference",
+]
 
 
 def convert_datetime_to_str(df: pd.DataFrame) -> pd.DataFrame:
@@ -17,170 +39,499 @@ def convert_datetime_to_str(df: pd.DataFrame) -> pd.DataFrame:
     Returns
     -------
     pd.DataFrame
-        The DataFrame with datetime columns converted to string columns.
+        A DataFrame with datetime columns converted to string columns.
+        The input DataFrame is not modified, and is returned as is if it
+        has no datetime columns.
 
     """
-    for column in df.select_dtypes(include=["datetime64[ns]"]).columns:
-        df[column] = df[column].dt.date.astype(str)
-    return df
-
-
-def append_totals_row(df: pd.DataFrame) -> pd.DataFrame:
+    datetime_cols = df.select_dtypes(include=["datetime64[ns]"]).columns
+    if datetime_cols.empty:
+        return df
+    # Replacing columns of a shallow copy leaves the input untouched
+    # without copying its other columns
+    converted_df = df.copy(deep=False)
+    for column in datetime_cols:
+        converted_df[column] = df[column].dt.date.astype(str)
+    return converted_df
+
+
+def align_categories(
+    df: pd.DataFrame,
+    reference: pd.DataFrame,
+    columns: list[str],
+) -> pd.DataFrame:
     """
-    Append an overall totals row to a DataFrame.
+    Give categorical columns the same categories as a reference DataFrame.
+
+    Sharing categories lets columns be grouped, merged and compared on
+    their integer codes. Values missing from the reference categories
+    become NaN, so the DataFrame should be validated against the
+    reference first.
 
     Parameters
     ----------
     df : pd.DataFrame
-        The DataFrame to which the totals row will be appended.
+        The DataFrame whose columns will be recoded.
+    reference : pd.DataFrame
+        The DataFrame whose categories will be used.
+    columns : list[str]
+        The columns to align. Columns that are not categorical in the
+        reference are left unchanged.
 
     Returns
     -------
     pd.DataFrame
-        The DataFrame with the totals row appended.
+        The DataFrame with aligned categorical columns.
 
     """
-    totals = pd.DataFrame({
-        "category": ["Total"],
-        "subcategory": [None],
-        "month": [None],
-        "total_amount_spent": [df["total_amount_spent"].sum()],
-        "amount_budgeted": [df["amount_budgeted"].sum()],
-        "difference": [df["difference"].sum()],
-    })
-    return pd.concat([df, totals], ignore_index=True)
+    dtypes = {
+        col: reference[col].dtype
+        for col in columns
+        if isinstance(reference[col].dtype, pd.CategoricalDtype)
+        and df[col].dtype != reference[col].dtype
+    }
+    if not dtypes:
+        return df
+    return df.astype(dtypes)
+
+
+def union_categories(
+    frames: list[pd.DataFrame],
+    columns: list[str],
+) -> list[pd.DataFrame]:
+    """
+    Give categorical columns of DataFrames the union of their categories.
+
+    Concatenating categorical columns with different categories gives
+    object columns. Once recoded, the DataFrames concatenate into
+    categorical columns, with the sorted categories a single DataFrame of
+    all their rows would have.
+
+    Parameters
+    ----------
+    frames : list[pd.DataFrame]
+        The DataFrames, with categorical columns.
+    columns : list[str]
+        The columns to recode. Columns whose categories already match
+        across DataFrames are left unchanged.
 
+    Returns
+    -------
+    list[pd.DataFrame]
+        The DataFrames with shared categories.
 
-def append_category_totals(expense_report: pd.DataFrame) -> pd.DataFrame:
     """
-    Append category totals to a DataFrame.
+    dtypes = {
+        col: pd.CategoricalDtype(
+            union_categoricals(
+                [df[col] for df in frames], sort_categories=True
+            ).categories
+        )
+        for col in columns
+        if len({df[col].dtype for df in frames}) > 1
+    }
+    if not dtypes:
+        return frames
+    return [df.astype(dtypes) for df in frames]
+
+
+def period_window(
+    start: str | pd.Period | None = None,
+    end: str | pd.Period | None = None,
+) -> tuple[pd.Period | None, pd.Period | None]:
+    """
+    Convert the bounds of a range of months to monthly periods.
 
     Parameters
     ----------
-    expense_report : pd.DataFrame
-        The DataFrame to which the category totals will be appended.
+    start : str | pd.Period | None, optional
+        First month of the range, e.g. "2025-01". By default None.
+    end : str | pd.Period | None, optional
+        Last month of the range, e.g. "2025-12". By default None.
 
     Returns
     -------
-    pd.DataFrame
-        The DataFrame with the category totals appended.
+    tuple[pd.Period | None, pd.Period | None]
+        The first and last months of the range. Open bounds stay None.
 
     """
-    # Calculate category totals
-    category_totals = (
-        expense_report.groupby(["category"]).sum().reset_index()
+    return tuple(
+        None if bound is None else pd.Period(bound, freq="M")
+        for bound in (start, end)
     )
-    # Drop overall total
-    category_totals = category_totals[
-        category_totals["category"] != "Total"
-    ]
-    category_totals["subcategory"] = "Total"
-    category_totals["month"] = None
-    category_totals["difference"] = (
-        category_totals["amount_budgeted"]
-        - category_totals["total_amount_spent"]
-    )
-    # Append category totals to the expense report
-    return pd.concat([expense_report, category_totals], ignore_index=True)
 
 
-def place_totals_rows(expense_report: pd.DataFrame) -> pd.DataFrame:
+def select_periods(
+    expense_log: pd.DataFrame,
+    start: str | pd.Period | None = None,
+    end: str | pd.Period | None = None,
+) -> pd.DataFrame:
     """
-    Place totals rows in the expense report in their correct locations.
-    Category totals are placed below their respective categories,
-    and an overall total is placed at the end.
+    Select the transactions dated within a range of months.
 
     Parameters
     ----------
-    expense_report : pd.DataFrame
-        The expense report with totals rows unordered.
+    expense_log : pd.DataFrame
+        The expense log.
+    start : str | pd.Period | None, optional
+        First month of the range, e.g. "2025-01". By default None, which
+        leaves the range open.
+    end : str | pd.Period | None, optional
+        Last month of the range, e.g. "2025-12". By default None, which
+        leaves the range open.
 
     Returns
     -------
     pd.DataFrame
-        The DataFrame with the totals rows in their correct locations.
+        The transactions within the range. The expense log itself is
+        returned if the range is fully open.
 
     """
-    # Identify category total rows
-    category_totals = expense_report[
-        expense_report["subcategory"] == "Total"
-    ]
+    start, end = period_window(start, end)
+    if start is None and end is None:
+        return expense_log
+
+    # Compare dates with the bounds directly, without converting every
+    # transaction to a period
+    in_range = pd.Series(data=True, index=expense_log.index)
+    if start is not None:
+        in_range &= expense_log["date"] >= start.start_time
+    if end is not None:
+        in_range &= expense_log["date"] < (end + 1).start_time
+    return expense_log.loc[in_range]
+
+
+def aggregate_spending(
+    expense_log: pd.DataFrame,
+    months: pd.Series,
+) -> pd.DataFrame:
+    """
+    Sum the amount spent per month, category and subcategory.
+
+    Parameters
+    ----------
+    expense_log : pd.DataFrame
+        The validated expense log.
+    months : pd.Series
+        The month of each transaction, aligned with the expense log.
+        Monthly periods keep the same month of different years apart.
 
-    # Identify overall total row
-    overall_total = expense_report[expense_report["category"] == "Total"]
+    Returns
+    -------
+    pd.DataFrame
+        The amount spent in the "total_amount_spent" column, sorted by
+        month, category and subcategory. Amounts of each group are summed
+        in the order of the expense log.
 
-    # Identify non-total rows
-    non_totals = expense_report[
-        ~(
-            (expense_report["subcategory"] == "Total")
-            | (expense_report["category"] == "Total")
+    """
+    return (
+        expense_log["amount"]
+        .groupby(
+            [
+                months.rename("month"),
+                expense_log["category"],
+                expense_log["subcategory"],
+            ],
+            observed=True,
+            sort=True,
         )
-    ]
+        .sum()
+        .rename("total_amount_spent")
+        .reset_index()
+    )
 
-    # Create separate DataFrames for each category
-    category_dfs = []
-    category_list = category_totals["category"].unique()
 
-    for cat in category_list:
-        # Filter rows for the current category
-        cat_df = non_totals[(non_totals["category"] == cat)]
-        cat_total = category_totals[category_totals["category"] == cat]
+def join_budget(spent: pd.DataFrame, budget: pd.DataFrame) -> pd.DataFrame:
+    """
+    Join the amount spent per month to the budget.
+
+    Parameters
+    ----------
+    spent : pd.DataFrame
+        The amount spent. See `aggregate_spending`.
+    budget : pd.DataFrame
+        The validated budget.
 
-        # Append the category total row to the DataFrame
-        cat_df = pd.concat([cat_df, cat_total], ignore_index=True)
-        category_dfs.append(cat_df)
+    Returns
+    -------
+    pd.DataFrame
+        The grouped report, in the order of `spent`, with columns in
+        `GROUPED_REPORT_COLUMNS` order.
 
-    # Concatenate all category DataFrames
-    sorted_report = pd.concat(category_dfs, ignore_index=True)
+    """
+    grouped_report = spent.merge(
+        budget[["category", "subcategory", "amount_budgeted"]],
+        on=["category", "subcategory"],
+        how="left",
+    )
 
-    # Append overall total at the end
-    sorted_report = pd.concat([sorted_report, overall_total])
+    # Calculate difference between budgeted and spent
+    grouped_report["difference"] = (
+        grouped_report["amount_budgeted"]
+        - grouped_report["total_amount_spent"]
+    )
 
-    return sorted_report.reset_index(drop=True)
+    return grouped_report[GROUPED_REPORT_COLUMNS]
 
 
-def fill_missing_expenses(
-    expense_report: pd.DataFrame,
+def build_grouped_report(
+    expense_log: pd.DataFrame,
     budget: pd.DataFrame,
-    month: str,
+    months: pd.Series,
 ) -> pd.DataFrame:
     """
-    Fill budgeted expenses with no transactions attached to them.
+    Build an expense report grouped by month, category and subcategory.
+
+    Transactions are aggregated first, in a single groupby, and only the
+    aggregated rows are joined to the budget. The cost of the join is
+    therefore proportional to the number of groups, not transactions.
 
     Parameters
     ----------
-    expense_report : pd.DataFrame
-        The expense report for a given month.
+    expense_log : pd.DataFrame
+        The validated expense log.
     budget : pd.DataFrame
-        The DataFrame containing the budget for a given month.
-    month : str
-        The month corresponding to the expense report and budget.
+        The validated budget.
+    months : pd.Series
+        The month of each transaction, aligned with the expense log.
+        Monthly periods keep the same month of different years apart.
 
     Returns
     -------
     pd.DataFrame
-        The DataFrame with missing expenses filled in.
+        The grouped report, sorted by month, category and subcategory,
+        with columns in `GROUPED_REPORT_COLUMNS` order.
 
     """
-    # Find categories and subcategories that are in the budget
-    # but not in the expense log
-    missing_expenses = budget[
-        ~budget.set_index(["category", "subcategory"]).index.isin(
-            expense_report.set_index(["category", "subcategory"]).index
+    return join_budget(aggregate_spending(expense_log, months), budget)
+
+
+def build_period_pivot(
+    grouped_report: pd.DataFrame,
+    budget: pd.DataFrame,
+    values: str = "total_amount_spent",
+) -> pd.DataFrame:
+    """
+    Pivot a grouped report to one row per budget line and one column per
+    month.
+
+    Parameters
+    ----------
+    grouped_report : pd.DataFrame
+        The grouped report. See `build_grouped_report`.
+    budget : pd.DataFrame
+        The budget. Budget lines without transactions are filled with 0.
+    values : str, optional
+        The grouped report column to pivot. By default
+        "total_amount_spent".
+
+    Returns
+    -------
+    pd.DataFrame
+        The pivoted report, indexed by category and subcategory, with
+        months as columns in chronological order.
+
+    """
+    budget_lines = pd.MultiIndex.from_frame(
+        budget[["category", "subcategory"]]
+        .drop_duplicates()
+        .sort_values(by=["category", "subcategory"])
+    )
+    return grouped_report.pivot_table(
+        index=["category", "subcategory"],
+        columns="month",
+        values=values,
+        aggfunc="sum",
+        fill_value=0,
+        observed=True,
+    ).reindex(budget_lines, fill_value=0)
+
+
+def fill_missing_budget_lines(
+    grouped_report: pd.DataFrame,
+    budget: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Fill the budget lines with no transactions in each month of a grouped
+    report.
+
+    Budget lines missing from each month are found all at once, with a
+    cross join of the months and the budget followed by a single
+    anti-join on the grouped report.
+
+    Parameters
+    ----------
+    grouped_report : pd.DataFrame
+        The grouped report. See `build_grouped_report`.
+    budget : pd.DataFrame
+        The budget.
+
+    Returns
+    -------
+    pd.DataFrame
+        The report of every month, sorted by month, category and
+        subcategory, with columns in `MONTHLY_REPORT_COLUMNS` order.
+        Rows are numbered within each month: the budget lines with
+        transactions first, then the others.
+
+    """
+    keys = ["month", "category", "subcategory"]
+    monthly_report = grouped_report[MONTHLY_REPORT_COLUMNS]
+
+    # Pair every month with every budget line and keep the pairs
+    # without transactions
+    budget_lines = (
+        monthly_report[["month"]]
+        .drop_duplicates()
+        .merge(
+            budget[["category", "subcategory", "amount_budgeted"]],
+            how="cross",
+        )
+    )
+    missing_lines = budget_lines[
+        ~pd.MultiIndex.from_frame(budget_lines[keys]).isin(
+            pd.MultiIndex.from_frame(monthly_report[keys])
         )
     ]
-    # Create a new DataFrame with the missing expenses
-    missing_expenses = pd.DataFrame({
-        "category": missing_expenses["category"],
-        "subcategory": missing_expenses["subcategory"],
-        "month": month,
-        "total_amount_spent": [0] * len(missing_expenses),
-        "amount_budgeted": missing_expenses["amount_budgeted"],
-        "difference": missing_expenses["amount_budgeted"],
-    })
+    missing_lines = missing_lines.assign(
+        total_amount_spent=0.0,
+        difference=missing_lines["amount_budgeted"],
+    )[MONTHLY_REPORT_COLUMNS]
+
+    filled_report = pd.concat(
+        [monthly_report, missing_lines], ignore_index=True
+    )
+    # Number rows within each month, spent lines before missing lines,
+    # as when the missing lines of a month are appended to its report
+    filled_report.index = (
+        filled_report.groupby("month", sort=False).cumcount().to_numpy()
+    )
+    return filled_report.sort_values(by=keys, kind="stable")
+
+
+def build_split_report(
+    grouped_report: pd.DataFrame,
+    budget: pd.DataFrame,
+) -> list[pd.DataFrame, ...]:
+    """
+    Split a grouped report into one report per month, including budget
+    lines with no transactions in the month.
+
+    The missing lines of all months are filled at once by
+    `fill_missing_budget_lines`, and the report is split in a single
+    groupby.
+
+    Parameters
+    ----------
+    grouped_report : pd.DataFrame
+        The grouped report. See `build_grouped_report`.
+    budget : pd.DataFrame
+        The budget.
+
+    Returns
+    -------
+    list[pd.DataFrame, ...]
+        The monthly reports in chronological order, each sorted by
+        category and subcategory, with columns in
+        `MONTHLY_REPORT_COLUMNS` order.
+
+    """
+    filled_report = fill_missing_budget_lines(grouped_report, budget)
+    return [
+        month_report
+        for _, month_report in filled_report.groupby("month", sort=False)
+    ]
+
+
+def build_rollup_report(
+    monthly_report: pd.DataFrame,
+) -> list[pd.DataFrame, ...]:
+    """
+    Add category subtotals and a grand total to the report of each month.
 
-    # Append the missing expenses to the expense report
-    return pd.concat([expense_report, missing_expenses], ignore_index=True)
+    Subtotals of every month are computed in one grouped pass, and rows
+    are put in place by sorting on computed keys: month, then category
+    with the grand total last, then subcategory lines before their
+    category total.
+
+    Parameters
+    ----------
+    monthly_report : pd.DataFrame
+        The report of every month, with columns in
+        `MONTHLY_REPORT_COLUMNS` order. See `fill_missing_budget_lines`.
+
+    Returns
+    -------
+    list[pd.DataFrame, ...]
+        One report per month, in the order of the months in
+        `monthly_report`, with the category totals below their category
+        and the grand total at the end.
+
+    """
+    amount_cols = ["total_amount_spent", "amount_budgeted"]
+
+    category_totals = (
+        monthly_report.groupby(
+            ["month", "category"], observed=True, sort=False
+        )[amount_cols]
+        .sum()
+        .reset_index()
+    )
+    category_totals["difference"] = (
+        category_totals["amount_budgeted"]
+        - category_totals["total_amount_spent"]
+    )
+    # The grand total difference is summed, like the amounts
+    grand_totals = (
+        monthly_report.groupby("month", sort=False)[
+            [*amount_cols, "difference"]
+        ]
+        .sum()
+        .reset_index()
+    )
+
+    # "Total" is not one of the budget's categories and totals have no
+    # month, so label columns are stored as plain objects. The month of
+    # every row is kept as a sort key.
+    rollup_report = pd.concat(
+        [
+            monthly_report.astype(
+                dict.fromkeys(["category", "subcategory", "month"], object)
+            ).assign(
+                _month=monthly_report["month"].array,
+                _is_grand_total=False,
+                _is_subtotal=False,
+            ),
+            category_totals.astype(
+                dict.fromkeys(["category", "month"], object)
+            ).assign(
+                _month=category_totals["month"].array,
+                subcategory="Total",
+                month=None,
+                _is_grand_total=False,
+                _is_subtotal=True,
+            ),
+            grand_totals.assign(
+                _month=grand_totals["month"].array,
+                category="Total",
+                subcategory=None,
+                month=None,
+                _is_grand_total=True,
+                _is_subtotal=True,
+            ),
+        ],
+        ignore_index=True,
+    )
+    # A stable sort keeps subcategory lines in their order within their
+    # category
+    rollup_report = rollup_report.sort_values(
+        by=["_month", "_is_grand_total", "category", "_is_subtotal"],
+        kind="stable",
+    )
+    return [
+        month_report[MONTHLY_REPORT_COLUMNS].reset_index(drop=True)
+        for _, month_report in rollup_report.groupby("_month", sort=False)
+    ]
 
 
 def sort_month_order(
@@ -193,8 +544,9 @@ def sort_month_order(
     ----------
     df_list : list[pd.DataFrame, ...]
         The list of DataFrames to be sorted. Each DataFrame must contain
-        a "month" column. The month column should contain the full month
-        name, and all month values should be the same.
+        a "month" column. The month column should contain either monthly
+        periods or full month names, and all month values should be the
+        same.
 
     Returns
     -------
@@ -203,4 +555,11 @@ def sort_month_order(
 
     """
     month_order = {month: i for i, month in enumerate(month_name) if month}
-    return sorted(df_list, key=lambda df: month_order[df["month"].iloc[0]])
+
+    def month_key(df: pd.DataFrame) -> int:
+        month = df["month"].iloc[0]
+        if isinstance(month, pd.Period):
+            return month.ordinal
+        return month_order[month]
+
+    return sorted(df_list, key=month_key)
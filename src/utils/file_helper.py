@@ -1,12 +1,60 @@
 """Utils functions to help with file operations."""
 
+from __future__ import annotations
+
+import copy
 import logging
-from calendar import month_name
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import numpy as np
+import openpyxl
 import pandas as pd
 import xlsxwriter
 import yaml
+from pandas.api.types import union_categoricals
+
+from utils.validation import validate_excel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Engines supported by `read_excel_sheets`, in order of preference when
+# the engine is picked automatically.
+EXCEL_ENGINES = ("calamine", "openpyxl")
+EXCEL_ENGINE_MODULES = {
+    "calamine": "python_calamine",
+    "openpyxl": "openpyxl",
+}
+# Oldest pandas version accepting each engine, as (major, minor)
+EXCEL_ENGINE_PANDAS_VERSIONS = {"calamine": (2, 2)}
+
+# Engines supported by `resolve_csv_engine`, in order of preference when
+# the engine is picked automatically.
+CSV_ENGINES = ("pyarrow", "c")
+CSV_ENGINE_MODULES = {
+    "pyarrow": "pyarrow",
+    "c": "pandas",
+}
+
+# Cell formats of the Excel report, as xlsxwriter format properties. The
+# header format matches the one written by `DataFrame.to_excel`.
+HEADER_FORMAT = {
+    "bold": True,
+    "border": 1,
+    "align": "center",
+    "valign": "top",
+}
+DATE_FORMAT = {"num_format": "yyyy-mm-dd"}
+NUMBER_FORMAT = {"num_format": "#,##0.00"}
+# Excel stores dates as days since 1899-12-30
+EXCEL_EPOCH = pd.Timestamp("1899-12-30")
+# Bounds of the column widths of the Excel report, in characters
+MIN_COLUMN_WIDTH = 8
+MAX_COLUMN_WIDTH = 60
 
 
 def load_yaml(yaml_path: str) -> dict:
@@ -42,66 +90,505 @@ def load_yaml(yaml_path: str) -> dict:
         raise yaml.YAMLError(msg) from e
 
 
-def convert_dfs_to_workbook(
-    df_list: list[pd.DataFrame, ...],
-    file_path: str,
+def load_schema(yaml_path: str) -> dict:
+    """
+    Load a data schema YAML file, parsing it only when it has changed.
+
+    Parameters
+    ----------
+    yaml_path : str
+        The path to the data schema YAML file.
+
+    Returns
+    -------
+    dict
+        A copy of the data schema, safe to modify.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified YAML file does not exist.
+
+    """
+    try:
+        mtime_ns = Path(yaml_path).stat().st_mtime_ns
+    except FileNotFoundError as e:
+        msg = f"File not found: {yaml_path}"
+        raise FileNotFoundError(msg) from e
+    return copy.deepcopy(_load_schema_cached(str(yaml_path), mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _load_schema_cached(yaml_path: str, mtime_ns: int) -> dict:  # noqa: ARG001
+    """
+    Load a YAML file, caching the result per path and modification time.
+
+    Parameters
+    ----------
+    yaml_path : str
+        The path to the YAML file.
+    mtime_ns : int
+        The modification time of the file. Only used as part of the
+        cache key.
+
+    Returns
+    -------
+    dict
+        The contents of the YAML file as a dictionary.
+
+    """
+    return load_yaml(yaml_path)
+
+
+def resolve_excel_engine(engine: str | None = None) -> str:
+    """
+    Resolve the name of the engine used to parse Excel files.
+
+    Parameters
+    ----------
+    engine : str | None, optional
+        The requested engine. ``None`` uses openpyxl (pandas' default,
+        which opens workbooks in read-only streaming mode), and ``"auto"``
+        picks the fastest engine that is installed and supported by the
+        installed pandas. By default None.
+
+    Returns
+    -------
+    str
+        The name of the engine to pass to pandas.
+
+    Raises
+    ------
+    ValueError
+        If the requested engine is not supported, or needs a newer
+        version of pandas.
+
+    """
+    if engine is None:
+        return "openpyxl"
+    pandas_version = tuple(
+        int(part) for part in pd.__version__.split(".")[:2]
+    )
+    if engine == "auto":
+        return next(
+            name
+            for name in EXCEL_ENGINES
+            if find_spec(EXCEL_ENGINE_MODULES[name]) is not None
+            and pandas_version
+            >= EXCEL_ENGINE_PANDAS_VERSIONS.get(name, (0, 0))
+        )
+    if engine not in EXCEL_ENGINES:
+        msg = (
+            f"Unsupported Excel engine: {engine}. "
+            f"Expected one of: {', '.join(EXCEL_ENGINES)} or 'auto'."
+        )
+        raise ValueError(msg)
+    min_version = EXCEL_ENGINE_PANDAS_VERSIONS.get(engine, (0, 0))
+    if pandas_version < min_version:
+        msg = (
+            f"The {engine} Excel engine needs pandas "
+            f"{'.'.join(map(str, min_version))} or later, not "
+            f"{pd.__version__}."
+        )
+        raise ValueError(msg)
+    return engine
+
+
+def resolve_csv_engine(engine: str | None = None) -> str:
+    """
+    Resolve the name of the engine used to parse CSV files.
+
+    Parameters
+    ----------
+    engine : str | None, optional
+        The requested engine. ``None`` uses pandas' C parser, and
+        ``"auto"`` picks the fastest engine that is installed (pyarrow,
+        which parses with several threads). By default None.
+
+    Returns
+    -------
+    str
+        The name of the engine to pass to `pd.read_csv`.
+
+    Raises
+    ------
+    ValueError
+        If the requested engine is not supported.
+
+    """
+    if engine is None:
+        return "c"
+    if engine == "auto":
+        return next(
+            name
+            for name in CSV_ENGINES
+            if find_spec(CSV_ENGINE_MODULES[name]) is not None
+        )
+    if engine not in CSV_ENGINES:
+        msg = (
+            f"Unsupported CSV engine: {engine}. "
+            f"Expected one of: {', '.join(CSV_ENGINES)} or 'auto'."
+        )
+        raise ValueError(msg)
+    return engine
+
+
+def read_excel_sheets(
+    excel_path: str,
     sheet_names: list[str],
-) -> xlsxwriter.Workbook:
+    engine: str | None = None,
+) -> dict[str, pd.DataFrame]:
     """
-    Convert a list of DataFrames to an xlsxwriter Workbook.
+    Read several sheets from an Excel file, opening the file only once.
 
     Parameters
     ----------
-    df_list : list[pd.DataFrame, ...]
-        A list of DataFrames to be written to the Excel file.
-    file_path : str
-        The path for the Excel file to be created.
+    excel_path : str
+        The path to the Excel file.
     sheet_names : list[str]
-        A list of sheet names corresponding to each DataFrame in the tuple.
+        The names of the sheets to read.
+    engine : str | None, optional
+        The engine used to parse the file. See `resolve_excel_engine`.
+        By default None.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        A dictionary mapping each sheet name to its DataFrame.
+
+    """
+    with pd.ExcelFile(
+        excel_path, engine=resolve_excel_engine(engine)
+    ) as workbook:
+        return {
+            sheet_name: workbook.parse(sheet_name=sheet_name)
+            for sheet_name in sheet_names
+        }
+
+
+def stream_excel_sheet(
+    excel_path: str,
+    sheet_name: str,
+    sheet_schema: dict,
+    chunk_size: int = 50_000,
+) -> pd.DataFrame:
+    """
+    Read and validate an Excel sheet in fixed-size chunks of rows.
+
+    The sheet is iterated in openpyxl's read-only mode, so only one chunk
+    of cells is held in memory at a time. Each chunk is validated and cast
+    against the schema before it is buffered, which keeps peak memory
+    close to the size of the final DataFrame.
+
+    Parameters
+    ----------
+    excel_path : str
+        The path to the Excel file.
+    sheet_name : str
+        The name of the sheet to read.
+    sheet_schema : dict
+        The expected schema for the sheet. See `validate_excel`.
+    chunk_size : int, optional
+        The number of rows parsed and validated at a time.
+        By default 50,000.
+
+    Returns
+    -------
+    pd.DataFrame
+        The validated DataFrame.
+
+    Raises
+    ------
+    ValueError
+        If the sheet is empty or fails validation.
+
+    """
+    workbook = openpyxl.load_workbook(
+        excel_path, read_only=True, data_only=True
+    )
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            msg = "Sheet is empty."
+            raise ValueError(msg)
+
+        buffers = {column: [] for column in header}
+        while chunk := list(islice(rows, chunk_size)):
+            # Skip blank rows left behind by formatted cells
+            records = [
+                row for row in chunk if any(v is not None for v in row)
+            ]
+            if not records:
+                continue
+            chunk_df = pd.DataFrame.from_records(records, columns=header)
+            # Represent empty cells as NaN, like pd.read_excel does
+            object_cols = chunk_df.select_dtypes(
+                include=["object"]
+            ).columns
+            chunk_df[object_cols] = chunk_df[object_cols].mask(
+                chunk_df[object_cols].isna(), np.nan
+            )
+            chunk_df = validate_excel(chunk_df, sheet_schema)
+            for column in header:
+                buffers[column].append(chunk_df[column])
+    finally:
+        workbook.close()
+
+    if not buffers[header[0]]:
+        msg = "Sheet is empty."
+        raise ValueError(msg)
+
+    # Concatenate one column at a time so chunks are released as we go
+    columns = {}
+    for column in header:
+        chunks = buffers.pop(column)
+        if isinstance(chunks[0].dtype, pd.CategoricalDtype):
+            # Each chunk infers its own categories, so combine them
+            columns[column] = pd.Series(
+                union_categoricals(chunks, sort_categories=True),
+                name=column,
+            )
+        else:
+            columns[column] = pd.concat(chunks, ignore_index=True)
+    return pd.DataFrame(columns, copy=False)
+
+
+def _column_width(column: pd.Series) -> int:
+    """
+    Compute the width of a report column from the length of its values.
+
+    Parameters
+    ----------
+    column : pd.Series
+        The column, as written by `write_excel_report`.
 
     Returns
     -------
-    xlsx.Workbook
-        A Workbook object containing the DataFrames as sheets.
+    int
+        The column width, in characters.
+
+    """
+    max_length = len(str(column.name))
+    if column.notna().any():
+        if pd.api.types.is_datetime64_any_dtype(column):
+            max_length = max(max_length, len("yyyy-mm-dd"))
+        elif pd.api.types.is_bool_dtype(column):
+            max_length = max(max_length, len("FALSE"))
+        elif pd.api.types.is_numeric_dtype(column):
+            # Length of the largest magnitude formatted as "#,##0.00"
+            largest = max(abs(column.max()), abs(column.min()), 1)
+            digits = int(np.log10(largest)) + 1
+            sign = int(column.min() < 0)
+            max_length = max(
+                max_length, sign + digits + (digits - 1) // 3 + len(".00")
+            )
+        else:
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Measure each category once rather than every row
+                column = (
+                    column.cat.remove_unused_categories().cat.categories
+                )
+            max_length = max(
+                max_length, int(column.astype(str).str.len().max())
+            )
+    return min(max(max_length + 2, MIN_COLUMN_WIDTH), MAX_COLUMN_WIDTH)
+
 
+def _is_string_column(column: pd.Series) -> bool:
     """
-    writer = pd.ExcelWriter(file_path, engine="xlsxwriter")
+    Check whether every value of a column is a string or missing.
 
-    for df, sheet_name in zip(df_list, sheet_names):
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
+    Parameters
+    ----------
+    column : pd.Series
+        The column.
 
-    return writer.book
+    Returns
+    -------
+    bool
+        Whether the column only holds strings and missing values.
+
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.cat.categories
+    return pd.api.types.infer_dtype(column, skipna=True) in {
+        "string",
+        "empty",
+    }
 
 
-def bold_totals(report_wb: xlsxwriter.Workbook) -> xlsxwriter.Workbook:
+def _total_rows(df: pd.DataFrame) -> np.ndarray:
     """
-    Bold the total rows in the report Workbook.
+    Find the total rows of a monthly report.
 
     Parameters
     ----------
-    report_wb : xlsxwriter.Workbook
-        The report Workbook containing the total rows.
+    df : pd.DataFrame
+        The monthly report.
 
     Returns
     -------
-    report_wb : xlsxwriter.Workbook
-        The report Workbook with bolded total rows.
+    np.ndarray
+        Whether each row is a category subtotal or the grand total.
+
+    """
+    is_total = np.zeros(len(df), dtype=bool)
+    for column in ("category", "subcategory"):
+        if column in df.columns:
+            is_total |= (df[column] == "Total").to_numpy()
+    return is_total
+
+
+def write_excel_report(
+    df_list: list[pd.DataFrame, ...],
+    file_path: str,
+    sheet_names: list[str],
+    total_sheets: list[str] | None = None,
+    chunk_size: int = 10_000,
+) -> None:
+    """
+    Write DataFrames to an Excel report, one sheet per DataFrame.
+
+    The workbook is written in xlsxwriter's constant memory mode: rows
+    are written directly, in order, and flushed to disk as they are
+    written. Dates and numbers are formatted per column. Column widths
+    are computed from the length of the values before writing, and
+    total rows are bolded as they are written.
+
+    Parameters
+    ----------
+    df_list : list[pd.DataFrame, ...]
+        A list of DataFrames to be written to the Excel file.
+    file_path : str
+        The path for the Excel file to be created.
+    sheet_names : list[str]
+        A list of sheet names corresponding to each DataFrame.
+    total_sheets : list[str] | None, optional
+        The monthly report sheets, whose category subtotal and grand
+        total rows are bolded. By default None.
+    chunk_size : int, optional
+        Number of rows converted to Python values at a time, which
+        bounds the memory used while writing. By default 10_000.
+
+    """
+    total_sheets = set(total_sheets or [])
+    workbook = xlsxwriter.Workbook(file_path, {"constant_memory": True})
+    header_format = workbook.add_format(HEADER_FORMAT)
+    column_formats = {
+        "date": (
+            workbook.add_format(DATE_FORMAT),
+            workbook.add_format({**DATE_FORMAT, "bold": True}),
+        ),
+        "number": (
+            workbook.add_format(NUMBER_FORMAT),
+            workbook.add_format({**NUMBER_FORMAT, "bold": True}),
+        ),
+        "other": (None, workbook.add_format({"bold": True})),
+    }
 
+    try:
+        for df, sheet_name in zip(df_list, sheet_names):
+            worksheet = workbook.add_worksheet(sheet_name)
+            is_total = (
+                _total_rows(df)
+                if sheet_name in total_sheets
+                else np.zeros(len(df), dtype=bool)
+            )
+
+            # Pick the writer and format of each column once
+            kinds = []
+            writers = []
+            for col_idx, column in enumerate(df.columns):
+                values = df[column]
+                if pd.api.types.is_datetime64_any_dtype(values):
+                    kind, writer = "date", worksheet.write_number
+                elif pd.api.types.is_bool_dtype(values):
+                    kind, writer = "other", worksheet.write_boolean
+                elif pd.api.types.is_numeric_dtype(values):
+                    kind, writer = "number", worksheet.write_number
+                elif _is_string_column(values):
+                    # Skip the type checks of `worksheet.write`
+                    kind, writer = "other", worksheet.write_string
+                else:
+                    kind, writer = "other", worksheet.write
+                kinds.append(kind)
+                writers.append(writer)
+                worksheet.set_column(
+                    col_idx,
+                    col_idx,
+                    _column_width(values),
+                    column_formats[kind][0],
+                )
+            bold_formats = [column_formats[kind][1] for kind in kinds]
+
+            worksheet.write_row(
+                0, 0, list(map(str, df.columns)), header_format
+            )
+            for start in range(0, len(df), chunk_size):
+                _write_rows(
+                    df.iloc[start : start + chunk_size],
+                    first_row=start + 1,
+                    writers=writers,
+                    kinds=kinds,
+                    bold_formats=bold_formats,
+                    is_total=is_total[start : start + chunk_size],
+                )
+    finally:
+        workbook.close()
+
+
+def _write_rows(  # noqa: PLR0913
+    df: pd.DataFrame,
+    first_row: int,
+    *,
+    writers: list[Callable],
+    kinds: list[str],
+    bold_formats: list[xlsxwriter.format.Format],
+    is_total: np.ndarray,
+) -> None:
     """
-    # Define a format for bold text
-    bold_format = report_wb.add_format({"bold": True})
+    Write a chunk of rows of a DataFrame to a worksheet.
 
-    # Iterate through all the sheets in the workbook
-    for sheet_name in report_wb.sheetnames:
-        worksheet = report_wb.get_worksheet_by_name(sheet_name)
-        # Apply bold format to monthly reports
-        if sheet_name in month_name:
-            # Get the number of rows in the worksheet
-            num_rows = worksheet.dim_rowmax
-            # Apply bold format to the last row (total row)
-            worksheet.set_row(num_rows, None, bold_format)
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The chunk of rows.
+    first_row : int
+        The worksheet row of the first row of the chunk.
+    writers : list[Callable]
+        The worksheet method writing the cells of each column.
+    kinds : list[str]
+        The kind of each column: "date", "number" or "other".
+    bold_formats : list[xlsxwriter.format.Format]
+        The format of the total row cells of each column.
+    is_total : np.ndarray
+        Whether each row of the chunk is a total row.
+
+    """
+    columns = []
+    for column, kind in zip(df.columns, kinds):
+        values = df[column]
+        if kind == "date":
+            # Write dates as Excel serial numbers, converted all at once
+            values = (values - EXCEL_EPOCH) / pd.Timedelta(days=1)
+        elif kind == "other":
+            values = values.astype(object).where(values.notna(), None)
+        columns.append(values.tolist())
 
-    return report_wb
+    for row_offset, row in enumerate(zip(*columns)):
+        row_idx = first_row + row_offset
+        formats = bold_formats if is_total[row_offset] else None
+        for col_idx, value in enumerate(row):
+            # Missing values (None or NaN) are left blank
+            if value is None or value != value:  # noqa: PLR0124
+                continue
+            writers[col_idx](
+                row_idx,
+                col_idx,
+                value,
+                formats[col_idx] if formats else None,
+            )
 
 
 def setup_logging() -> logging.Logger:
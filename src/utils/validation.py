@@ -1,6 +1,105 @@
 """Utils functions for validation."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, pandas_dtype
+
+# Sheet row number of the first row of a DataFrame: sheet rows are
+# numbered from 1, and the first one holds the header
+FIRST_SHEET_ROW = 2
+
+
+@dataclass(frozen=True)
+class ValidationPlan:
+    """
+    A sheet schema compiled for validating DataFrames in a single pass.
+
+    Parameters
+    ----------
+    columns : tuple[str, ...]
+        The columns expected in the sheet, in schema order.
+    dtypes : dict[str, str]
+        The data types of the non-datetime columns.
+    datetime_formats : dict[str, str | None]
+        The parsing format of each datetime column, or None if unknown.
+    datetime_dtypes : dict[str, str]
+        The data types of the datetime columns.
+
+    """
+
+    columns: tuple[str, ...]
+    dtypes: dict[str, str]
+    datetime_formats: dict[str, str | None]
+    datetime_dtypes: dict[str, str]
+
+
+def compile_schema(sheet_schema: dict) -> ValidationPlan:
+    """
+    Compile a sheet schema into a reusable validation plan.
+
+    Each column of the schema maps either to a data type, or to a mapping
+    with a "dtype" and an optional datetime "format". Plans are cached per
+    schema, so compiling the same schema again is free.
+
+    Parameters
+    ----------
+    sheet_schema : dict
+        The expected schema for the sheet.
+
+    Returns
+    -------
+    ValidationPlan
+        The compiled validation plan.
+
+    """
+    return _compile_frozen_schema(
+        tuple(
+            (col, spec["dtype"], spec.get("format"))
+            if isinstance(spec, dict)
+            else (col, spec, None)
+            for col, spec in sheet_schema.items()
+        )
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_frozen_schema(
+    frozen_schema: tuple[tuple[str, str, str | None], ...],
+) -> ValidationPlan:
+    """
+    Compile a hashable representation of a sheet schema.
+
+    Parameters
+    ----------
+    frozen_schema : tuple[tuple[str, str, str | None], ...]
+        The (column, dtype, datetime format) of each schema column.
+
+    Returns
+    -------
+    ValidationPlan
+        The compiled validation plan.
+
+    """
+    dtypes = {}
+    datetime_formats = {}
+    datetime_dtypes = {}
+    for col, dtype, date_format in frozen_schema:
+        if is_datetime64_any_dtype(pandas_dtype(dtype)):
+            datetime_formats[col] = date_format
+            datetime_dtypes[col] = dtype
+        else:
+            dtypes[col] = dtype
+    return ValidationPlan(
+        columns=tuple(col for col, _, _ in frozen_schema),
+        dtypes=dtypes,
+        datetime_formats=datetime_formats,
+        datetime_dtypes=datetime_dtypes,
+    )
 
 
 def validate_excel(
@@ -16,7 +115,7 @@ def validate_excel(
     sheet_df : pd.DataFrame
         The DataFrame pulled from an Excel sheet.
     sheet_schema : dict
-        The expected schema for the given sheet.
+        The expected schema for the given sheet. See `compile_schema`.
 
     Returns
     -------
@@ -35,27 +134,135 @@ def validate_excel(
         msg = "Sheet is empty."
         raise ValueError(msg)
 
+    plan = compile_schema(sheet_schema)
+
     # Validate columns
-    expected_columns = sheet_schema.keys()
-    if not all(col in sheet_df.columns for col in expected_columns):
-        msg = f"Missing columns in sheet. Expected: {expected_columns}"
+    missing_columns = set(plan.columns).difference(sheet_df.columns)
+    if missing_columns:
+        msg = (
+            f"Missing columns in sheet. Expected: {list(plan.columns)}. "
+            f"Missing: {sorted(missing_columns)}"
+        )
         raise ValueError(msg)
 
-    # Validate data types
+    # Validate data types, casting every column that needs it at once
+    casts = {
+        col: dtype
+        for col, dtype in plan.dtypes.items()
+        if sheet_df[col].dtype != dtype
+    }
     try:
-        for col, dtype in sheet_schema.items():
-            sheet_df[col] = sheet_df[col].astype(dtype)
+        validated_df = (
+            sheet_df.astype(casts) if casts else sheet_df.copy(deep=False)
+        )
+    except ValueError:
+        # Cast column by column to report the offending column
+        for col, dtype in casts.items():
+            _cast_column(sheet_df[col], dtype)
+        raise
+
+    # Parse datetime columns, skipping those already parsed by the reader
+    for col, date_format in plan.datetime_formats.items():
+        dtype = plan.datetime_dtypes[col]
+        if validated_df[col].dtype == dtype:
+            continue
+        validated_df[col] = _cast_column(
+            validated_df[col], dtype, date_format=date_format
+        )
+
+    return validated_df
+
+
+def _cast_column(
+    column: pd.Series,
+    dtype: str,
+    date_format: str | None = None,
+) -> pd.Series:
+    """
+    Cast a single column to a data type.
+
+    Parameters
+    ----------
+    column : pd.Series
+        The column to cast.
+    dtype : str
+        The expected data type.
+    date_format : str | None, optional
+        The format used to parse datetime columns. By default None, which
+        parses each value independently.
+
+    Returns
+    -------
+    pd.Series
+        The cast column.
+
+    Raises
+    ------
+    ValueError
+        If the column cannot be cast to the data type.
+
+    """
+    try:
+        if date_format is not None:
+            return pd.to_datetime(column, format=date_format).astype(dtype)
+        return column.astype(dtype)
     except ValueError as e:
-        msg = f"Column '{col}' cannot be converted to {dtype}: {e}"
+        msg = f"Column '{column.name}' cannot be converted to {dtype}: {e}"
         raise ValueError(msg) from e
 
-    return sheet_df
+
+def find_missing_budget_lines(
+    expense_df: pd.DataFrame,
+    budget_df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Find expense category and subcategory pairs missing from the budget.
+
+    The pairs are matched as (category, subcategory) keys with a hash
+    anti-join, so the cost is linear in the number of expenses and neither
+    DataFrame is copied.
+
+    Parameters
+    ----------
+    expense_df : pd.DataFrame
+        The DataFrame containing expenses.
+    budget_df : pd.DataFrame
+        The DataFrame containing budgeted amounts.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per missing pair, with the number of expenses using it
+        ("count") and the sheet row number of the first of them
+        ("first_row"), ordered by first occurrence. Sheet rows are
+        numbered from 1 with the header as row 1, so the first expense
+        is row 2. Empty if every pair is budgeted.
+
+    """
+    keys = ["category", "subcategory"]
+    expense_keys = pd.MultiIndex.from_arrays([expense_df[k] for k in keys])
+    budget_keys = pd.MultiIndex.from_arrays([budget_df[k] for k in keys])
+    missing_rows = np.flatnonzero(~expense_keys.isin(budget_keys))
+
+    missing_expenses = pd.DataFrame({
+        **{
+            k: expense_df[k].iloc[missing_rows].to_numpy(dtype=object)
+            for k in keys
+        },
+        "row": missing_rows + FIRST_SHEET_ROW,
+    })
+    return (
+        missing_expenses.groupby(keys, sort=False, dropna=False)["row"]
+        .agg(count="size", first_row="min")
+        .reset_index()
+        .sort_values("first_row", ignore_index=True)
+    )
 
 
 def validate_expenses(
     expense_df: pd.DataFrame,
     budget_df: pd.DataFrame,
-) -> pd.DataFrame:
+) -> None:
     """
     Validate expenses to ensure all expense categories and subcategories
     have corresponding budgeted amounts.
@@ -71,25 +278,17 @@ def validate_expenses(
     ------
     ValueError
         If there are categories or subcategories in the expense report
-        that are not present in the budget.
+        that are not present in the budget. The message lists every
+        missing pair with its count and first sheet row number.
 
     """
-    tmp_expense_df = expense_df.copy()
-    tmp_budget_df = budget_df.copy()
-    tmp_expense_df["category_subcategory"] = (
-        tmp_expense_df["category"] + "_" + tmp_expense_df["subcategory"]
-    )
-    tmp_budget_df["category_subcategory"] = (
-        tmp_budget_df["category"] + "_" + tmp_budget_df["subcategory"]
-    )
-    missing_categories = tmp_expense_df[
-        ~tmp_expense_df["category_subcategory"].isin(
-            tmp_budget_df["category_subcategory"]
-        )
-    ]["category_subcategory"].unique()
-    if len(missing_categories) > 0:
+    missing_budget_lines = find_missing_budget_lines(expense_df, budget_df)
+    if not missing_budget_lines.empty:
         msg = (
             f"Categories or subcategories in the expense report are not "
-            f"present in the budget: {missing_categories}"
+            f"present in the budget. first_row is the row number of the "
+            f"first expense using them in the expense sheet, whose header "
+            f"is row 1:\n"
+            f"{missing_budget_lines.to_string(index=False)}"
         )
         raise ValueError(msg)
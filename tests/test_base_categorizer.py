@@ -0,0 +1,77 @@
+"""Unit tests for base_categorizer.py."""
+
+import pandas as pd
+import pytest
+
+from categorizers.base_categorizer import BaseCategorizer
+
+
+class CoffeeCategorizer(BaseCategorizer):
+    """Categorizes coffee shop transactions, for testing."""
+
+    def targets(self) -> list[tuple[str, str]]:  # noqa: PLR6301
+        """
+        Return the (category, subcategory) pairs the categorizer assigns.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The (category, subcategory) pairs.
+
+        """
+        return [("Food", "Coffee")]
+
+    def _predict(  # noqa: PLR6301
+        self, notes: pd.Series
+    ) -> pd.DataFrame:
+        """
+        Categorize the notes mentioning Starbucks.
+
+        Returns
+        -------
+        pd.DataFrame
+            The category and subcategory of each note.
+
+        """
+        is_coffee = notes.str.contains("STARBUCKS")
+        return pd.DataFrame({
+            "category": is_coffee.map({True: "Food", False: ""}),
+            "subcategory": is_coffee.map({True: "Coffee", False: ""}),
+        })
+
+
+def test_categorizer_without_predict() -> None:
+    """Test that a categorizer must implement _predict and targets."""
+
+    class IncompleteCategorizer(BaseCategorizer):
+        def targets(self) -> list[tuple[str, str]]:  # noqa: PLR6301
+            return []
+
+    with pytest.raises(TypeError, match="_predict"):
+        BaseCategorizer()
+    with pytest.raises(TypeError, match="_predict"):
+        IncompleteCategorizer()
+
+
+def test_categorize() -> None:
+    """
+    Test that only blank categories are filled in, unless overwriting,
+    and that the targets are checked against the budget.
+    """
+    expense_log = pd.DataFrame({
+        "category": ["", "Shopping", ""],
+        "subcategory": ["", "Misc", ""],
+        "note": ["STARBUCKS", "STARBUCKS", "AMAZON"],
+    })
+
+    result = CoffeeCategorizer().categorize(expense_log)
+    assert result["category"].tolist() == ["Food", "Shopping", ""]
+    assert result["subcategory"].tolist() == ["Coffee", "Misc", ""]
+    assert expense_log["category"].tolist() == ["", "Shopping", ""]
+
+    result = CoffeeCategorizer().categorize(expense_log, overwrite=True)
+    assert result["category"].tolist() == ["Food", "Food", ""]
+
+    CoffeeCategorizer().validate_targets(result.iloc[:1])
+    with pytest.raises(ValueError, match="Food / Coffee"):
+        CoffeeCategorizer().validate_targets(expense_log)
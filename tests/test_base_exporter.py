@@ -0,0 +1,115 @@
+"""Unit tests for base_exporter.py."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from report_exporters.base_exporter import (
+    BaseExporter,
+    sheet_file_name,
+    stack_sheets,
+)
+
+
+class PickleExporter(BaseExporter):
+    """Exports reports to pickle files, for testing."""
+
+    extension = ".pkl"
+
+    def _write_frame(  # noqa: PLR6301
+        self, df: pd.DataFrame, file_path: Path
+    ) -> None:
+        """Write a DataFrame to a pickle file."""
+        df.to_pickle(file_path)
+
+
+SHEETS = {
+    "Expense Log": pd.DataFrame({"amount": [1.0, 2.0]}),
+    "2025-01": pd.DataFrame({"category": ["Food"], "amount": [3.0]}),
+}
+
+
+def test_sheet_file_name() -> None:
+    """Test that sheet names are turned into safe file names."""
+    assert sheet_file_name("Expense Log") == "expense_log"
+    assert sheet_file_name("2025-01") == "2025-01"
+    assert sheet_file_name(" Budget / 2025 ") == "budget_2025"
+
+
+def test_stack_sheets() -> None:
+    """
+    Test that stack_sheets stacks the rows of every sheet with a leading
+    sheet column, leaving columns missing from a sheet empty.
+    """
+    result = stack_sheets(SHEETS)
+
+    assert list(result.columns) == ["sheet", "amount", "category"]
+    assert result["sheet"].tolist() == ["Expense Log"] * 2 + ["2025-01"]
+    assert result["amount"].tolist() == [1.0, 2.0, 3.0]
+    assert result["category"].isna().tolist() == [True, True, False]
+
+
+def test_export_directory(tmp_path: Path) -> None:
+    """Test that each sheet is written to its own file in a directory."""
+    file_paths = PickleExporter().export(SHEETS, str(tmp_path / "report"))
+
+    assert file_paths == [
+        tmp_path / "report" / "expense_log.pkl",
+        tmp_path / "report" / "2025-01.pkl",
+    ]
+    for file_path, df in zip(file_paths, SHEETS.values()):
+        pd.testing.assert_frame_equal(
+            pd.read_pickle(file_path),  # noqa: S301
+            df,
+        )
+
+
+def test_export_directory_parallel(tmp_path: Path) -> None:
+    """
+    Test that sheet files written by several processes match the files
+    written one after another, in the same order.
+    """
+    serial_paths = PickleExporter().export(
+        SHEETS, str(tmp_path / "serial")
+    )
+    parallel_paths = PickleExporter().export(
+        SHEETS, str(tmp_path / "parallel"), max_workers=2
+    )
+
+    assert [path.name for path in parallel_paths] == [
+        path.name for path in serial_paths
+    ]
+    for serial_path, parallel_path in zip(serial_paths, parallel_paths):
+        pd.testing.assert_frame_equal(
+            pd.read_pickle(parallel_path),  # noqa: S301
+            pd.read_pickle(serial_path),  # noqa: S301
+        )
+
+
+def test_export_single_file(tmp_path: Path) -> None:
+    """
+    Test that every sheet is stacked into a single file when the output
+    path has a file extension.
+    """
+    file_paths = PickleExporter().export(
+        SHEETS, str(tmp_path / "report.pkl")
+    )
+
+    assert file_paths == [tmp_path / "report.pkl"]
+    pd.testing.assert_frame_equal(
+        pd.read_pickle(file_paths[0]),  # noqa: S301
+        stack_sheets(SHEETS),
+    )
+
+
+def test_exporter_without_write_frame() -> None:
+    """Test that exporters must implement _write_frame."""
+
+    class IncompleteExporter(BaseExporter):
+        extension = ".txt"
+
+    with pytest.raises(TypeError, match="_write_frame"):
+        BaseExporter()
+    with pytest.raises(TypeError, match="_write_frame"):
+        IncompleteExporter()
@@ -1,16 +1,35 @@
 """Unit tests for base_formatter.py."""
 
 import pandas as pd
+import pytest
 
 from transaction_formatters.base_formatter import BaseFormatter
 
 
+class ReadingFormatter(BaseFormatter):
+    """Formatter returning the transaction log as it was read."""
+
+    def _format_chunk(  # noqa: PLR6301
+        self, trans_log: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Return the rows of the transaction log unchanged.
+
+        Returns
+        -------
+        pd.DataFrame
+            The rows of the transaction log.
+
+        """
+        return trans_log
+
+
 def test_read_transaction_logs_valid() -> None:
     """
     Test the _read_transaction_logs method of BaseFormatter with a valid
     CSV file.
     """
-    bf = BaseFormatter("tests/fixtures/example_cap_one.csv")
+    bf = ReadingFormatter("tests/fixtures/example_cap_one.csv")
     schema = {
         "Card No.": "Int64",
         "Description": "str",
@@ -41,7 +60,7 @@ def test_read_transaction_logs_invalid_file() -> None:
     Test the _read_transaction_logs method of BaseFormatter with an invalid
     CSV file.
     """
-    bf = BaseFormatter("tests/fixtures/invalid_file.csv")
+    bf = ReadingFormatter("tests/fixtures/invalid_file.csv")
     schema = {
         "Card No.": "Int64",
         "Description": "str",
@@ -59,7 +78,7 @@ def test_read_transaction_logs_invalid_dtype() -> None:
     Test the _read_transaction_logs method of BaseFormatter with an invalid
     data type in the schema.
     """
-    bf = BaseFormatter("tests/fixtures/example_cap_one.csv")
+    bf = ReadingFormatter("tests/fixtures/example_cap_one.csv")
     schema = {
         "Card No.": "Int64",
         "Description": "str",
@@ -70,3 +89,47 @@ def test_read_transaction_logs_invalid_dtype() -> None:
     date_cols = ["Transaction Date", "Posted Date"]
     test_df = bf._read_transaction_logs(schema, date_cols)
     assert test_df is None
+
+
+def test_read_transaction_logs_date_format() -> None:
+    """
+    Test that only the requested columns are read, and that dates are
+    parsed with the given format.
+    """
+    bf = ReadingFormatter("tests/fixtures/example_discover.csv")
+    test_df = bf._read_transaction_logs(
+        {"Amount": "float64"}, ["Post Date"], date_format="%m/%d/%Y"
+    )
+    assert list(test_df.columns) == ["Post Date", "Amount"]
+    assert test_df["Post Date"].iloc[0] == pd.Timestamp("2025-01-01")
+
+    # Dates that do not match the format are an error
+    test_df = bf._read_transaction_logs(
+        {"Amount": "float64"}, ["Post Date"], date_format="%Y-%m-%d"
+    )
+    assert test_df is None
+
+
+def test_read_transaction_logs_pyarrow() -> None:
+    """
+    Test that the pyarrow engine reads the same DataFrame as the default
+    engine.
+    """
+    pytest.importorskip("pyarrow")
+    schema = {"Description": "str", "Debit": "float64"}
+    date_cols = ["Posted Date"]
+    expected = ReadingFormatter(
+        "tests/fixtures/example_cap_one.csv"
+    )._read_transaction_logs(schema, date_cols, "%Y-%m-%d")
+
+    test_df = ReadingFormatter(
+        "tests/fixtures/example_cap_one.csv", engine="pyarrow"
+    )._read_transaction_logs(schema, date_cols, "%Y-%m-%d")
+
+    pd.testing.assert_frame_equal(test_df, expected)
+
+
+def test_formatter_without_format_chunk() -> None:
+    """Test that a formatter must implement _format_chunk."""
+    with pytest.raises(TypeError, match="_format_chunk"):
+        BaseFormatter("tests/fixtures/example_cap_one.csv", chunk_size=2)
@@ -0,0 +1,188 @@
+"""Unit tests for batch_reports.py."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import batch_reports
+from batch_reports import (
+    STAGES,
+    ReportJob,
+    jobs_from_patterns,
+    load_manifest,
+    main,
+    run_batch,
+    summarize_results,
+)
+
+FIXTURE = "tests/fixtures/example_excel_file.xlsx"
+RUN_JOB = batch_reports.run_job
+
+
+def run_job_killing_worker(
+    job: ReportJob, *args: object
+) -> batch_reports.JobResult:
+    """
+    Run a report job, killing the worker process for household_b.
+
+    Returns
+    -------
+    JobResult
+        The result of the job.
+
+    """
+    if "household_b" in job.excel_path:
+        os._exit(1)
+    return RUN_JOB(job, *args)
+
+
+@pytest.fixture
+def workbook_dir(tmp_path: Path) -> Path:
+    """
+    Create a directory of two valid workbooks and an invalid one.
+
+    Returns
+    -------
+    Path
+        The directory.
+
+    """
+    workbook_dir = tmp_path / "workbooks"
+    workbook_dir.mkdir()
+    for name in ("household_a", "household_b"):
+        shutil.copy(FIXTURE, workbook_dir / f"{name}.xlsx")
+    (workbook_dir / "household_c.xlsx").write_text("not a workbook")
+    return workbook_dir
+
+
+def test_jobs_from_patterns(workbook_dir: Path, tmp_path: Path) -> None:
+    """Test that one job is created per matching workbook."""
+    jobs = jobs_from_patterns(
+        [str(workbook_dir / "*.xlsx"), str(workbook_dir / "*_a.xlsx")],
+        str(tmp_path / "reports"),
+        report_format="csv",
+    )
+
+    assert [Path(job.excel_path).stem for job in jobs] == [
+        "household_a",
+        "household_b",
+        "household_c",
+    ]
+    assert jobs[0].output_path == str(
+        tmp_path / "reports" / "household_a_report"
+    )
+    assert jobs[0].report_format == "csv"
+
+
+def test_load_manifest(workbook_dir: Path) -> None:
+    """
+    Test that manifest entries are resolved against the manifest
+    directory, falling back to the default sheet names.
+    """
+    manifest_path = workbook_dir / "manifest.yaml"
+    manifest_path.write_text(
+        "- household_a.xlsx\n"
+        "- excel_path: household_b.xlsx\n"
+        "  budget_sheet: PLAN\n"
+        "  output_path: out/b.xlsx\n"
+    )
+
+    jobs = load_manifest(str(manifest_path), expense_sheet="LOG")
+
+    assert jobs == [
+        ReportJob(
+            excel_path=str(workbook_dir / "household_a.xlsx"),
+            output_path=str(workbook_dir / "household_a_report.xlsx"),
+            expense_sheet="LOG",
+        ),
+        ReportJob(
+            excel_path=str(workbook_dir / "household_b.xlsx"),
+            output_path=str(workbook_dir / "out" / "b.xlsx"),
+            expense_sheet="LOG",
+            budget_sheet="PLAN",
+        ),
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_batch(
+    workbook_dir: Path, tmp_path: Path, max_workers: int
+) -> None:
+    """
+    Test that every valid workbook gets its report, and that an invalid
+    workbook fails without stopping the others.
+    """
+    jobs = jobs_from_patterns(
+        [str(workbook_dir / "*.xlsx")],
+        str(tmp_path / "reports"),
+        expense_sheet="EXPENSE_LOG",
+        budget_sheet="BUDGET",
+    )
+
+    results = run_batch(jobs, max_workers=max_workers)
+
+    assert [result.job for result in results] == jobs
+    assert [result.error is None for result in results] == [
+        True,
+        True,
+        False,
+    ]
+    assert results[2].error.startswith("load failed")
+    assert list(results[0].timings) == list(STAGES)
+    expected = pd.read_excel(jobs[0].output_path, sheet_name=None)
+    pd.testing.assert_frame_equal(
+        pd.read_excel(jobs[1].output_path, sheet_name=None)["2025-01"],
+        expected["2025-01"],
+    )
+
+    summary = summarize_results(results)
+    assert summary["status"].tolist() == ["ok", "ok", "failed", "2 ok"]
+    assert summary["total_s"].iloc[-1] == pytest.approx(
+        summary["total_s"].iloc[:-1].sum(), abs=0.01
+    )
+
+
+def test_run_batch_killed_worker(
+    workbook_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that a worker process dying only fails the job it was running,
+    even though it breaks the pool the other jobs were submitted to.
+    """
+    monkeypatch.setattr(batch_reports, "run_job", run_job_killing_worker)
+    jobs = jobs_from_patterns(
+        [str(workbook_dir / "*.xlsx")],
+        str(tmp_path / "reports"),
+        expense_sheet="EXPENSE_LOG",
+        budget_sheet="BUDGET",
+    )
+
+    results = run_batch(jobs, max_workers=2)
+
+    assert [result.job for result in results] == jobs
+    assert results[0].error is None
+    assert list(results[0].timings) == list(STAGES)
+    assert Path(jobs[0].output_path).exists()
+    assert results[1].error.startswith("BrokenProcessPool")
+    assert results[2].error.startswith("load failed")
+
+
+def test_main(workbook_dir: Path, tmp_path: Path) -> None:
+    """Test that the exit code reports whether any workbook failed."""
+    output_dir = tmp_path / "reports"
+
+    assert (
+        main([
+            str(workbook_dir / "household_a.xlsx"),
+            "--output-dir",
+            str(output_dir),
+            "--workers",
+            "1",
+        ])
+        == 0
+    )
+    assert (output_dir / "household_a_report.xlsx").exists()
+    assert main([str(workbook_dir / "*.xlsx"), "--workers", "1"]) == 1
@@ -0,0 +1,115 @@
+"""Unit tests for cache_helper.py."""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from utils.cache_helper import (
+    ReportCache,
+    cache_entry_name,
+    load_cached_frames,
+    report_size,
+    save_cached_frames,
+    source_fingerprint,
+)
+
+
+def test_save_and_load_cached_frames(tmp_path: Path) -> None:
+    """
+    Test that cached frames are returned unchanged when the fingerprint
+    matches, and not returned when it does not.
+    """
+    frames = {
+        "expense_log": pd.DataFrame({
+            "date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+            "amount": [1.5, 2.5],
+        }),
+        "budget": pd.DataFrame({"category": ["Food"], "amount": [10.0]}),
+    }
+    save_cached_frames(str(tmp_path), "entry", "fingerprint-1", frames)
+
+    loaded = load_cached_frames(str(tmp_path), "entry", "fingerprint-1")
+    assert loaded is not None
+    for name, df in frames.items():
+        pd.testing.assert_frame_equal(loaded[name], df)
+
+    assert load_cached_frames(str(tmp_path), "entry", "other") is None
+    assert load_cached_frames(str(tmp_path), "missing", "other") is None
+
+
+def test_source_fingerprint_changes(tmp_path: Path) -> None:
+    """
+    Test that the source fingerprint changes when the file is modified
+    or the schema changes.
+    """
+    source = tmp_path / "source.xlsx"
+    source.write_bytes(b"original")
+    schema = {"SHEET": {"column": "float64"}}
+    original = source_fingerprint(str(source), schema)
+
+    assert source_fingerprint(str(source), schema) == original
+    assert (
+        source_fingerprint(str(source), {"SHEET": {"column": "int64"}})
+        != original
+    )
+
+    source.write_bytes(b"modified contents")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert source_fingerprint(str(source), schema) != original
+
+
+def test_cache_entry_name() -> None:
+    """Test that cache entry names depend on the path and sheets."""
+    sheet_names = ["EXPENSE_LOG", "BUDGET"]
+    name = cache_entry_name("file.xlsx", sheet_names)
+    assert name == cache_entry_name("file.xlsx", sheet_names)
+    assert name != cache_entry_name("file.xlsx", ["OTHER", "BUDGET"])
+    assert name != cache_entry_name("other.xlsx", sheet_names)
+
+
+def test_report_cache_lru_eviction() -> None:
+    """
+    Test that the report cache counts hits and misses, and evicts the
+    least recently used reports to stay within its memory budget.
+    """
+    reports = {
+        name: pd.DataFrame({"amount": [float(i)] * 100})
+        for i, name in enumerate(["a", "b", "c"])
+    }
+    size = report_size(reports["a"])
+    cache = ReportCache(max_bytes=2 * size)
+
+    cache.put("a", reports["a"])
+    cache.put("b", reports["b"])
+    assert cache.get("a") is reports["a"]
+    # "b" is now the least recently used report
+    cache.put("c", reports["c"])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is reports["a"]
+    assert cache.get("c") is reports["c"]
+    assert cache.stats() == {
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "entries": 2,
+        "size_bytes": 2 * size,
+    }
+
+
+def test_report_cache_oversized_report() -> None:
+    """
+    Test that a report larger than the memory budget is not cached and
+    does not evict other reports.
+    """
+    small_report = pd.DataFrame({"amount": [1.0]})
+    cache = ReportCache(max_bytes=report_size(small_report))
+    cache.put("small", small_report)
+
+    cache.put("large", [small_report, small_report])
+
+    assert cache.get("large") is None
+    assert cache.get("small") is small_report
+    assert cache.stats()["evictions"] == 0
@@ -1,5 +1,8 @@
 """Unit tests for capital_one.py."""
 
+import tracemalloc
+from pathlib import Path
+
 import pandas as pd
 
 from transaction_formatters.capital_one import CapitalOneFormatter
@@ -30,6 +33,20 @@ def test_format_cap_one_logs_valid() -> None:
     )
 
 
+def test_cap_one_df_columns() -> None:
+    """Test that only the declared columns of the export are read."""
+    formatter = CapitalOneFormatter("tests/fixtures/example_cap_one.csv")
+
+    assert list(formatter.cap_one_df.columns) == [
+        "Posted Date",
+        "Card No.",
+        "Description",
+        "Debit",
+        "Credit",
+    ]
+    assert formatter.cap_one_df["Card No."].dtype == "Int64"
+
+
 def test_format_cap_one_logs_empty_df() -> None:
     """
     Test case for formatting Capital One logs with an empty
@@ -63,3 +80,90 @@ def test_format_cap_one_logs_all_credit_rows() -> None:
         "payment_type",
         "note",
     ]
+
+
+def test_format_cap_one_logs_streaming(tmp_path: Path) -> None:
+    """
+    Test that streaming the Capital One logs in chunks gives the same
+    rows as formatting the whole log, in memory or written to a file.
+    """
+    file_path = "tests/fixtures/example_cap_one.csv"
+    expected = CapitalOneFormatter(file_path).format_cap_one_logs()
+    chunk_size = 2
+    formatter = CapitalOneFormatter(file_path, chunk_size=chunk_size)
+
+    assert formatter.cap_one_df is None
+    pd.testing.assert_frame_equal(
+        formatter.format_cap_one_logs(), expected
+    )
+    assert all(
+        len(chunk) <= chunk_size
+        for chunk in formatter.iter_formatted_logs()
+    )
+
+    output_path = tmp_path / "formatted.csv"
+    assert formatter.write_formatted_logs(str(output_path)) == len(
+        expected
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_csv(
+            output_path, parse_dates=["date"], keep_default_na=False
+        ),
+        expected.reset_index(drop=True),
+    )
+
+
+def test_write_formatted_logs_bounded_memory(tmp_path: Path) -> None:
+    """
+    Test that streaming a large export to a file uses a fraction of the
+    memory of formatting it whole.
+    """
+    input_path = tmp_path / "export.csv"
+    rows = 40_000
+    pd.DataFrame({
+        "Transaction Date": ["2024-01-01"] * rows,
+        "Posted Date": ["2024-01-02"] * rows,
+        "Card No.": [1234] * rows,
+        "Description": [f"STORE {i}" for i in range(rows)],
+        "Category": ["Dining"] * rows,
+        "Debit": [5.25] * rows,
+        "Credit": [None] * rows,
+    }).to_csv(input_path, index=False)
+
+    tracemalloc.start()
+    try:
+        CapitalOneFormatter(str(input_path)).format_cap_one_logs()
+        _, full_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        CapitalOneFormatter(
+            str(input_path), chunk_size=2_000
+        ).write_formatted_logs(str(tmp_path / "formatted.csv"))
+        _, streaming_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert streaming_peak < full_peak / 4
+
+
+def test_iter_formatted_logs_card() -> None:
+    """Test that the card number of each row is kept on request."""
+    formatter = CapitalOneFormatter(
+        "tests/fixtures/example_cap_one.csv", chunk_size=3
+    )
+
+    result = pd.concat(list(formatter.iter_formatted_logs(keep_card=True)))
+
+    assert list(result.columns) == [
+        *formatter.format_cap_one_logs().columns,
+        "card",
+    ]
+    assert result["card"].tolist() == [
+        "1234",
+        "5678",
+        "1234",
+        "5678",
+        "5678",
+        "1234",
+        "5678",
+        "5678",
+    ]
@@ -1,14 +1,26 @@
 """Unit tests for data_helper.py."""
 
+import numpy as np
 import pandas as pd
 
-from utils.data_helper import (
+from benchmarks.reference_reports import (
     append_category_totals,
     append_totals_row,
-    convert_datetime_to_str,
     fill_missing_expenses,
     place_totals_rows,
+)
+from utils.data_helper import (
+    MONTHLY_REPORT_COLUMNS,
+    align_categories,
+    build_grouped_report,
+    build_period_pivot,
+    build_rollup_report,
+    build_split_report,
+    convert_datetime_to_str,
+    fill_missing_budget_lines,
+    select_periods,
     sort_month_order,
+    union_categories,
 )
 
 
@@ -44,6 +56,9 @@ def test_convert_datetime_to_str() -> None:
     # Check that non-datetime columns remain unchanged
     assert df_converted["num_col"].tolist() == [1, 2, 3]
     assert df_converted["str_col"].tolist() == ["a", "b", "c"]
+
+    # Check that the input DataFrame is not modified
+    assert test_df["date_col"].dtype == "datetime64[ns]"
     assert df_converted["num_col"].dtype == test_df["num_col"].dtype
     assert df_converted["str_col"].dtype == test_df["str_col"].dtype
 
@@ -272,3 +287,289 @@ def test_sort_month_order() -> None:
     assert result_order == expected_order, (
         f"Expected {expected_order} but got {result_order}"
     )
+
+
+def test_sort_month_order_periods() -> None:
+    """
+    Test that sort_month_order sorts monthly periods chronologically
+    across years.
+    """
+    df_list = [
+        pd.DataFrame({"month": [pd.Period(month, freq="M")] * 2})
+        for month in ["2025-01", "2024-12", "2024-01"]
+    ]
+    sorted_list = sort_month_order(df_list)
+
+    result_order = [str(df["month"].iloc[0]) for df in sorted_list]
+    assert result_order == ["2024-01", "2024-12", "2025-01"]
+
+
+def test_select_periods() -> None:
+    """
+    Test that select_periods keeps the transactions of whole months
+    within the range, including the last day of the last month.
+    """
+    expense_log = pd.DataFrame({
+        "date": pd.to_datetime([
+            "2024-12-31 00:00",
+            "2025-01-01 00:00",
+            "2025-02-28 23:59",
+            "2025-03-01 00:00",
+        ]),
+        "amount": [1.0, 2.0, 3.0, 4.0],
+    })
+
+    result = select_periods(expense_log, start="2025-01", end="2025-02")
+    assert result["amount"].tolist() == [2.0, 3.0]
+
+    result = select_periods(expense_log, end="2024-12")
+    assert result["amount"].tolist() == [1.0]
+
+    assert select_periods(expense_log) is expense_log
+
+
+def test_build_period_pivot() -> None:
+    """
+    Test that build_period_pivot returns one row per budget line and one
+    column per month, filling months without spending with 0.
+    """
+    budget = pd.DataFrame({
+        "category": ["Food", "Food", "Auto"],
+        "subcategory": ["Groceries", "Dining", "Gas"],
+        "amount_budgeted": [300.0, 100.0, 80.0],
+    }).astype({"category": "category", "subcategory": "category"})
+    grouped_report = pd.DataFrame({
+        "month": pd.PeriodIndex(
+            ["2024-12", "2025-01", "2025-01"], freq="M"
+        ),
+        "category": ["Food", "Food", "Auto"],
+        "subcategory": ["Groceries", "Groceries", "Gas"],
+        "total_amount_spent": [10.0, 20.0, 30.0],
+    }).astype({"category": "category", "subcategory": "category"})
+
+    result = build_period_pivot(grouped_report, budget)
+
+    assert [str(month) for month in result.columns] == [
+        "2024-12",
+        "2025-01",
+    ]
+    assert result.index.tolist() == [
+        ("Auto", "Gas"),
+        ("Food", "Dining"),
+        ("Food", "Groceries"),
+    ]
+    assert result.to_numpy().tolist() == [
+        [0.0, 30.0],
+        [0.0, 0.0],
+        [10.0, 20.0],
+    ]
+
+
+def test_align_categories() -> None:
+    """
+    Test that align_categories gives categorical columns the categories
+    of the reference DataFrame, leaving other columns unchanged.
+    """
+    budget = pd.DataFrame({
+        "category": pd.Categorical(["Food", "Transport", "Housing"]),
+        "note": ["a", "b", "c"],
+    })
+    expenses = pd.DataFrame({
+        "category": pd.Categorical(["Transport", "Transport"]),
+        "note": ["x", "y"],
+    })
+
+    result = align_categories(expenses, budget, ["category", "note"])
+
+    assert result["category"].dtype == budget["category"].dtype
+    assert result["category"].tolist() == ["Transport", "Transport"]
+    assert result["note"].dtype == object
+
+
+def test_union_categories() -> None:
+    """
+    Test that union_categories lets categorical columns concatenate into
+    the dtype of a single DataFrame of all the rows.
+    """
+    first = pd.DataFrame({
+        "payment_type": pd.Categorical(["Visa", "Cash"])
+    })
+    second = pd.DataFrame({"payment_type": pd.Categorical(["Amex"])})
+
+    result = pd.concat(
+        union_categories([first, second], ["payment_type"]),
+        ignore_index=True,
+    )
+
+    expected = pd.DataFrame({
+        "payment_type": pd.Categorical(["Visa", "Cash", "Amex"])
+    })
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_append_category_totals_categorical() -> None:
+    """
+    Test that append_category_totals only emits totals for observed
+    categories when the category columns are categorical.
+    """
+    categories = ["Food", "Housing", "Transport"]
+    expense_report = pd.DataFrame({
+        "category": pd.Categorical(
+            ["Food", "Food"], categories=categories
+        ),
+        "subcategory": pd.Categorical(["Groceries", "Dining"]),
+        "month": ["Jan", "Jan"],
+        "amount_budgeted": [200, 150],
+        "total_amount_spent": [180, 140],
+    })
+
+    result = append_category_totals(expense_report)
+
+    result_totals = result[result["subcategory"] == "Total"]
+    assert result_totals["category"].tolist() == ["Food"]
+    assert result_totals["amount_budgeted"].tolist() == [350]
+    assert result_totals["difference"].tolist() == [30]
+
+
+def test_build_grouped_report_matches_transaction_level() -> None:
+    """
+    Test that build_grouped_report, which aggregates before joining the
+    budget, matches a report built by joining every transaction to the
+    budget, then dropping duplicates.
+    """
+    rng = np.random.default_rng(0)
+    budget = pd.DataFrame({
+        "category": ["Food", "Food", "Auto", "Housing"],
+        "subcategory": ["Groceries", "Dining", "Gas", "Rent"],
+        "amount_budgeted": [300.0, 100.0, 80.0, 1000.0],
+    }).astype({"category": "category", "subcategory": "category"})
+    lines = rng.integers(0, len(budget), 500)
+    expense_log = pd.DataFrame({
+        "date": pd.Timestamp("2025-01-01")
+        + pd.to_timedelta(rng.integers(0, 200, 500), unit="D"),
+        "category": budget["category"].to_numpy()[lines],
+        "subcategory": budget["subcategory"].to_numpy()[lines],
+        "amount": rng.integers(100, 10_000, 500) / 100,
+    })
+    months = expense_log["date"].dt.month_name()
+
+    # Transaction-level report: sum per row, join, then deduplicate
+    transactions = expense_log.assign(month=months)
+    transactions["total_amount_spent"] = transactions.groupby(
+        ["month", "category", "subcategory"], observed=True
+    )["amount"].transform("sum")
+    expected = (
+        transactions.merge(budget, on=["category", "subcategory"])
+        .drop(columns=["date", "amount"])
+        .sort_values(by=["month", "category", "subcategory"])
+        .drop_duplicates()
+    )
+    expected["difference"] = (
+        expected["amount_budgeted"] - expected["total_amount_spent"]
+    )
+    expected = expected[
+        [
+            "month",
+            "category",
+            "subcategory",
+            "amount_budgeted",
+            "total_amount_spent",
+            "difference",
+        ]
+    ].reset_index(drop=True)
+
+    result = build_grouped_report(expense_log, budget, months)
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+
+def test_build_split_report_matches_per_month_fill() -> None:
+    """
+    Test that build_split_report, which fills the missing budget lines of
+    all months at once, matches filling each month separately.
+    """
+    rng = np.random.default_rng(0)
+    budget = pd.DataFrame({
+        "category": ["Food", "Food", "Auto", "Housing", "Auto"],
+        "subcategory": ["Groceries", "Dining", "Gas", "Rent", "Repairs"],
+        "amount_budgeted": [300.0, 100.0, 80.0, 1000.0, 50.0],
+    }).astype({"category": "category", "subcategory": "category"})
+    lines = np.concatenate([
+        rng.integers(0, len(budget), 40),
+        # Every budget line has a transaction in the last month
+        np.arange(len(budget)),
+    ])
+    days = np.concatenate([
+        rng.integers(0, 150, 40),
+        np.full(len(budget), 200),
+    ])
+    expense_log = pd.DataFrame({
+        "date": pd.Timestamp("2024-11-01")
+        + pd.to_timedelta(days, unit="D"),
+        "category": budget["category"].to_numpy()[lines],
+        "subcategory": budget["subcategory"].to_numpy()[lines],
+        "amount": rng.integers(100, 10_000, len(lines)) / 100,
+    })
+    grouped_report = build_grouped_report(
+        expense_log, budget, expense_log["date"].dt.to_period("M")
+    )
+
+    # Filter and fill each month separately
+    monthly_report = grouped_report[MONTHLY_REPORT_COLUMNS]
+    expected = [
+        fill_missing_expenses(
+            monthly_report[monthly_report["month"] == month],
+            budget,
+            month,
+        ).sort_values(by=["category", "subcategory"])
+        for month in monthly_report["month"].unique()
+    ]
+
+    result = build_split_report(grouped_report, budget)
+
+    assert len(result) == len(expected)
+    for result_month, expected_month in zip(result, expected):
+        pd.testing.assert_frame_equal(
+            result_month, expected_month, check_exact=True
+        )
+
+
+def test_build_rollup_report_matches_totals_helpers() -> None:
+    """
+    Test that build_rollup_report, which computes the totals of every
+    month in one pass, matches appending and placing the totals rows of
+    each month separately.
+    """
+    rng = np.random.default_rng(1)
+    budget = pd.DataFrame({
+        "category": ["Food", "Food", "Auto", "Housing", "Auto"],
+        "subcategory": ["Groceries", "Dining", "Gas", "Rent", "Repairs"],
+        "amount_budgeted": [300.25, 100.5, 80.0, 1000.0, 50.75],
+    }).astype({"category": "category", "subcategory": "category"})
+    lines = rng.integers(0, len(budget), 200)
+    expense_log = pd.DataFrame({
+        "date": pd.Timestamp("2024-11-01")
+        + pd.to_timedelta(rng.integers(0, 200, 200), unit="D"),
+        "category": budget["category"].to_numpy()[lines],
+        "subcategory": budget["subcategory"].to_numpy()[lines],
+        # Quarters are summed exactly in any order
+        "amount": rng.integers(1, 40_000, 200) / 4,
+    })
+    grouped_report = build_grouped_report(
+        expense_log, budget, expense_log["date"].dt.to_period("M")
+    )
+
+    expected = [
+        place_totals_rows(append_category_totals(append_totals_row(month)))
+        for month in build_split_report(grouped_report, budget)
+    ]
+
+    result = build_rollup_report(
+        fill_missing_budget_lines(grouped_report, budget)
+    )
+
+    assert len(result) == len(expected)
+    for result_month, expected_month in zip(result, expected):
+        pd.testing.assert_frame_equal(
+            result_month, expected_month, check_exact=True
+        )
@@ -0,0 +1,164 @@
+"""Unit tests for deduplicator.py."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from transaction_formatters.deduplicator import (
+    SCHEME_FILE,
+    TransactionDeduplicator,
+    TransactionIndex,
+    transaction_fingerprints,
+)
+
+
+@pytest.fixture
+def statement() -> pd.DataFrame:
+    """
+    Build formatted transactions with two identical coffees.
+
+    Returns
+    -------
+    pd.DataFrame
+        The formatted transactions.
+
+    """
+    return pd.DataFrame({
+        "date": pd.to_datetime([
+            "2024-01-02",
+            "2024-01-02",
+            "2024-01-03",
+            "2024-01-04",
+        ]),
+        "category": "",
+        "subcategory": "",
+        "amount": [4.5, 4.5, 40.1, 12.0],
+        "payment_type": "Venture",
+        "note": [
+            "STARBUCKS #12",
+            "STARBUCKS #12",
+            "SHELL OIL 123",
+            "NETFLIX.COM",
+        ],
+    })
+
+
+def test_transaction_fingerprints(statement: pd.DataFrame) -> None:
+    """Test that repeats differ and that fingerprints are stable."""
+    fingerprints = transaction_fingerprints(statement)
+
+    assert fingerprints.dtype == np.uint64
+    assert len(set(fingerprints)) == len(statement)
+    # Letter case and web suffixes do not change the fingerprint
+    renamed = statement.assign(note=statement["note"].str.lower())
+    renamed.loc[3, "note"] = "Netflix.com"
+    np.testing.assert_array_equal(
+        transaction_fingerprints(renamed), fingerprints
+    )
+    # Another payment type or card does
+    assert not np.isin(
+        transaction_fingerprints(
+            statement.assign(payment_type="Discover")
+        ),
+        fingerprints,
+    ).any()
+    assert not np.isin(
+        transaction_fingerprints(statement.assign(card="5678")),
+        fingerprints,
+    ).any()
+    np.testing.assert_array_equal(
+        transaction_fingerprints(statement.assign(card="")), fingerprints
+    )
+
+
+def test_transaction_fingerprints_sources(statement: pd.DataFrame) -> None:
+    """Test that repeats are counted within each statement."""
+    overlap = pd.concat([statement, statement.iloc[:2]], ignore_index=True)
+
+    fingerprints = transaction_fingerprints(
+        overlap, np.array([0, 0, 0, 0, 1, 1])
+    )
+
+    np.testing.assert_array_equal(fingerprints[4:], fingerprints[:2])
+
+
+def test_transaction_index(tmp_path: Path) -> None:
+    """Test that fingerprints are found after reopening and compacting."""
+    index = TransactionIndex(str(tmp_path / "index"), max_segments=2)
+    index.add(np.array([5, 1], dtype=np.uint64))
+    index.add(np.array([3], dtype=np.uint64))
+    index.add(np.array([9], dtype=np.uint64))
+
+    reopened = TransactionIndex(str(tmp_path / "index"))
+
+    assert len(reopened.segments) == 1
+    assert len(reopened) == len([1, 3, 5, 9])
+    assert reopened.contains(
+        np.array([1, 2, 9, 10], dtype=np.uint64)
+    ).tolist() == [True, False, True, False]
+
+
+def test_transaction_index_scheme(tmp_path: Path) -> None:
+    """Test that an index of another fingerprint scheme is refused."""
+    index_dir = tmp_path / "index"
+    TransactionIndex(str(index_dir)).add(np.array([1], dtype=np.uint64))
+    TransactionIndex(str(index_dir))
+
+    (index_dir / SCHEME_FILE).write_text('{"fingerprint_version": 0}')
+    with pytest.raises(ValueError, match="fingerprint scheme"):
+        TransactionIndex(str(index_dir))
+
+    (index_dir / SCHEME_FILE).unlink()
+    with pytest.raises(ValueError, match="fingerprint scheme"):
+        TransactionIndex(str(index_dir))
+
+
+def test_deduplicate_overlapping_imports(
+    tmp_path: Path, statement: pd.DataFrame
+) -> None:
+    """Test that re-exported transactions are skipped, repeats kept."""
+    index_dir = str(tmp_path / "index")
+    first_import = TransactionDeduplicator(index_dir)
+    first = first_import.deduplicate(statement.iloc[:3])
+    first_import.commit()
+    deduplicator = TransactionDeduplicator(index_dir)
+    # The next export overlaps the first and has a third coffee
+    next_export = pd.concat(
+        [statement, statement.iloc[[0]]], ignore_index=True
+    )
+
+    result = deduplicator.deduplicate(next_export)
+
+    assert len(first) == len(statement) - 1
+    assert result.index.tolist() == [3, 4]
+    assert deduplicator.stats() == {
+        "kept": 2,
+        "skipped": 3,
+        "pending": 2,
+        "indexed": 3,
+    }
+    deduplicator.commit()
+    assert deduplicator.stats()["pending"] == 0
+    assert TransactionDeduplicator(index_dir).stats()["indexed"] == len(
+        next_export
+    )
+
+
+def test_deduplicate_without_commit(
+    tmp_path: Path, statement: pd.DataFrame
+) -> None:
+    """
+    Test that transactions are not recorded as imported until they are
+    committed, so a failed import can be run again.
+    """
+    index_dir = str(tmp_path / "index")
+    deduplicator = TransactionDeduplicator(index_dir)
+    deduplicator.deduplicate(statement)
+
+    retry = deduplicator.deduplicate(statement)
+
+    assert len(retry) == len(statement)
+    assert deduplicator.stats()["pending"] == len(statement)
+    assert len(TransactionDeduplicator(index_dir).index) == 0
@@ -0,0 +1,41 @@
+"""Unit tests for the delimited text report exporters."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from report_exporters.delimited import CsvExporter, TsvExporter
+
+
+def test_csv_exporter(tmp_path: Path) -> None:
+    """Test that sheets are written to CSV files with ISO dates."""
+    expense_log = pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-31", "2025-02-15"]),
+        "category": pd.Categorical(["Food", "Housing"]),
+        "amount": [10.5, 1000.0],
+    })
+
+    (file_path,) = CsvExporter().export(
+        {"Expense Log": expense_log}, str(tmp_path)
+    )
+
+    assert file_path.name == "expense_log.csv"
+    assert file_path.read_text(encoding="utf-8").splitlines() == [
+        "date,category,amount",
+        "2025-01-31,Food,10.5",
+        "2025-02-15,Housing,1000.0",
+    ]
+
+
+def test_tsv_exporter(tmp_path: Path) -> None:
+    """Test that stacked sheets are written to a single TSV file."""
+    sheets = {
+        "Budget": pd.DataFrame({"amount_budgeted": [100.0]}),
+        "2025-01": pd.DataFrame({"total_amount_spent": [10.0]}),
+    }
+
+    (file_path,) = TsvExporter().export(sheets, str(tmp_path / "all.tsv"))
+
+    result = pd.read_csv(file_path, sep="\t")
+    assert result["sheet"].tolist() == ["Budget", "2025-01"]
+    assert result["amount_budgeted"].iloc[:1].tolist() == [100.0]
@@ -1,5 +1,7 @@
 """Unit tests for the DiscoverFormatter class."""
 
+from pathlib import Path
+
 import pandas as pd
 
 from transaction_formatters.discover import DiscoverFormatter
@@ -60,3 +62,38 @@ def test_format_discover_logs_all_credit_rows() -> None:
         "payment_type",
         "note",
     ]
+
+
+def test_format_discover_logs_streaming(tmp_path: Path) -> None:
+    """
+    Test that streaming the Discover logs in chunks gives the same rows
+    as formatting the whole log, in memory or written to a file.
+    """
+    file_path = "tests/fixtures/example_discover.csv"
+    expected = DiscoverFormatter(file_path).format_discover_logs()
+    formatter = DiscoverFormatter(file_path, chunk_size=2)
+
+    assert formatter.discover_df is None
+    pd.testing.assert_frame_equal(
+        formatter.format_discover_logs(), expected
+    )
+
+    output_path = tmp_path / "formatted.csv"
+    assert formatter.write_formatted_logs(str(output_path)) == len(
+        expected
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_csv(
+            output_path, parse_dates=["date"], keep_default_na=False
+        ),
+        expected.reset_index(drop=True),
+    )
+
+
+def test_iter_formatted_logs_card() -> None:
+    """Test that Discover rows have no card number."""
+    formatter = DiscoverFormatter("tests/fixtures/example_discover.csv")
+
+    result = pd.concat(list(formatter.iter_formatted_logs(keep_card=True)))
+
+    assert result["card"].tolist() == [""] * len(result)
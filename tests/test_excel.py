@@ -0,0 +1,43 @@
+"""Unit tests for the ExcelExporter class."""
+
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+
+from report_exporters.excel import ExcelExporter
+
+
+def test_excel_exporter(tmp_path: Path) -> None:
+    """
+    Test that sheets are written to worksheets of one workbook, bolding
+    the total rows of monthly report sheets only.
+    """
+    monthly_report = pd.DataFrame({
+        "category": ["Food", "Total"],
+        "total_amount_spent": [10.5, 10.5],
+    })
+    sheets = {"Budget": monthly_report, "2025-01": monthly_report}
+
+    (file_path,) = ExcelExporter().export(
+        sheets, str(tmp_path / "report.xlsx"), total_sheets=["2025-01"]
+    )
+
+    workbook = openpyxl.load_workbook(file_path)
+    assert workbook.sheetnames == ["Budget", "2025-01"]
+    assert not workbook["Budget"]["A3"].font.b
+    assert workbook["2025-01"]["A3"].font.b
+    pd.testing.assert_frame_equal(
+        pd.read_excel(file_path, sheet_name="2025-01"), monthly_report
+    )
+
+
+def test_excel_exporter_write_frame(tmp_path: Path) -> None:
+    """Test that a single DataFrame is written to one worksheet."""
+    sheet = pd.DataFrame({"category": ["Food"], "amount": [3.5]})
+    file_path = tmp_path / "frame.xlsx"
+
+    ExcelExporter()._write_frame(sheet, file_path)
+
+    assert openpyxl.load_workbook(file_path).sheetnames == ["Sheet1"]
+    pd.testing.assert_frame_equal(pd.read_excel(file_path), sheet)
@@ -1,7 +1,12 @@
 """Unit tests for expense_tracker.py."""
 
+import tracemalloc
+from pathlib import Path
+
 import pandas as pd
+import pytest
 
+from benchmarks.synthetic_data import make_budget, make_expense_log
 from expense_tracker import ExpenseTracker
 
 
@@ -18,18 +23,20 @@ def test_create_grouped_report() -> None:
 
     # Expected data after processing
     expected_report = pd.DataFrame({
-        "month": ["February", "January", "March"],
-        "category": ["Housing", "Household", "Auto"],
-        "subcategory": ["Rent", "Household Items", "Gas"],
-        "amount_budgeted": [1000, 100, 100],
-        "total_amount_spent": [1000, 10, 20],
-        "difference": [0, 90, 80],
+        "month": pd.PeriodIndex(
+            ["2025-01", "2025-02", "2025-03"], freq="M"
+        ),
+        "category": ["Household", "Housing", "Auto"],
+        "subcategory": ["Household Items", "Rent", "Gas"],
+        "amount_budgeted": [100, 1000, 100],
+        "total_amount_spent": [10, 1000, 20],
+        "difference": [90, 0, 80],
     })
 
     expected_dtypes = {
-        "month": "object",
-        "category": "object",
-        "subcategory": "object",
+        "month": "period[M]",
+        "category": "category",
+        "subcategory": "category",
         "amount_budgeted": "float64",
         "total_amount_spent": "float64",
         "difference": "float64",
@@ -58,7 +65,11 @@ def test_create_split_report() -> None:
     assert all(isinstance(df, pd.DataFrame) for df in result)
 
     # Check that each DataFrame corresponds to a unique month
-    expected_months = {"January", "February", "March"}
+    expected_months = {
+        pd.Period("2025-01", freq="M"),
+        pd.Period("2025-02", freq="M"),
+        pd.Period("2025-03", freq="M"),
+    }
     result_months = {df["month"].iloc[0] for df in result if not df.empty}
 
     assert result_months == expected_months
@@ -66,3 +77,415 @@ def test_create_split_report() -> None:
     # Check that the number of rows in each DataFrame is correct
     for df in result:
         assert len(df) == len(test_tracker.budget["subcategory"].unique())
+
+
+def test_cache_warm_start(tmp_path: Path) -> None:
+    """
+    Test that a second tracker over an unchanged workbook is loaded from
+    the sidecar cache and matches the tracker parsed from Excel.
+    """
+    kwargs = {
+        "excel_path": "tests/fixtures/example_excel_file.xlsx",
+        "budget_sheet": "BUDGET",
+        "expense_sheet": "EXPENSE_LOG",
+        "cache_dir": str(tmp_path),
+    }
+    cold_tracker = ExpenseTracker(**kwargs)
+    warm_tracker = ExpenseTracker(**kwargs)
+
+    assert not cold_tracker.cache_hit
+    assert warm_tracker.cache_hit
+    assert "load" in warm_tracker.timings
+    pd.testing.assert_frame_equal(
+        warm_tracker.get_budget(), cold_tracker.get_budget()
+    )
+    pd.testing.assert_frame_equal(
+        warm_tracker.get_expense_log(), cold_tracker.get_expense_log()
+    )
+
+
+def test_lazy_tracker_defers_parsing() -> None:
+    """
+    Test that a lazy tracker parses each sheet on first access only and
+    validates expenses once both sheets are loaded.
+    """
+    test_tracker = ExpenseTracker(
+        excel_path="tests/fixtures/example_excel_file.xlsx",
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+        lazy=True,
+    )
+    assert test_tracker._expense_log is None
+    assert test_tracker._budget is None
+
+    budget = test_tracker.get_budget()
+    assert test_tracker._expense_log is None
+    assert not test_tracker._expenses_validated
+    # The parsed sheet is memoized
+    assert test_tracker.get_budget() is budget
+
+    test_tracker.get_expense_log()
+    assert test_tracker._expenses_validated
+
+
+def test_lazy_tracker_validates_on_both_sheets(tmp_path: Path) -> None:
+    """
+    Test that a lazy tracker can read the budget of a workbook whose
+    expenses are invalid, and raises once the expense log is loaded.
+    """
+    excel_path = tmp_path / "invalid_expenses.xlsx"
+    with pd.ExcelWriter(excel_path) as writer:
+        pd.DataFrame({
+            "date": pd.to_datetime(["2025-01-01"]),
+            "category": ["Entertainment"],
+            "subcategory": ["Movies"],
+            "amount": [10.0],
+            "payment_type": ["Cash"],
+            "note": ["Cinema"],
+        }).to_excel(writer, sheet_name="EXPENSE_LOG", index=False)
+        pd.DataFrame({
+            "category": ["Food"],
+            "subcategory": ["Groceries"],
+            "amount_budgeted": [100.0],
+        }).to_excel(writer, sheet_name="BUDGET", index=False)
+
+    test_tracker = ExpenseTracker(
+        excel_path=str(excel_path),
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+        lazy=True,
+    )
+    assert len(test_tracker.get_budget()) == 1
+    with pytest.raises(ValueError, match="Categories or subcategories"):
+        test_tracker.get_expense_log()
+
+
+def test_streamed_expense_log() -> None:
+    """
+    Test that a tracker streaming its expense log in chunks loads the same
+    data as a tracker reading the whole sheet.
+    """
+    kwargs = {
+        "excel_path": "tests/fixtures/example_excel_file.xlsx",
+        "budget_sheet": "BUDGET",
+        "expense_sheet": "EXPENSE_LOG",
+    }
+    streamed_tracker = ExpenseTracker(**kwargs, chunk_size=1)
+    test_tracker = ExpenseTracker(**kwargs)
+
+    pd.testing.assert_frame_equal(
+        streamed_tracker.get_expense_log(), test_tracker.get_expense_log()
+    )
+
+
+def test_from_frames() -> None:
+    """
+    Test that a tracker created from DataFrames matches a tracker loaded
+    from the same workbook.
+    """
+    test_tracker = ExpenseTracker(
+        excel_path="tests/fixtures/example_excel_file.xlsx",
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+    )
+    frames_tracker = ExpenseTracker.from_frames(
+        expense_log=pd.read_excel(
+            "tests/fixtures/example_excel_file.xlsx",
+            sheet_name="EXPENSE_LOG",
+        ),
+        budget=pd.read_excel(
+            "tests/fixtures/example_excel_file.xlsx", sheet_name="BUDGET"
+        ),
+    )
+
+    pd.testing.assert_frame_equal(
+        frames_tracker.get_expense_log(), test_tracker.get_expense_log()
+    )
+    pd.testing.assert_frame_equal(
+        frames_tracker.create_grouped_report(),
+        test_tracker.create_grouped_report(),
+    )
+
+
+def test_reports_keep_years_apart() -> None:
+    """
+    Test that the same month of different years is reported separately,
+    and that reports can be restricted to a range of months.
+    """
+    budget = pd.DataFrame({
+        "category": ["Food"],
+        "subcategory": ["Groceries"],
+        "amount_budgeted": [100.0],
+    })
+    expense_log = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-15", "2025-01-15", "2025-02-15"]),
+        "category": ["Food"] * 3,
+        "subcategory": ["Groceries"] * 3,
+        "amount": [10.0, 20.0, 40.0],
+        "payment_type": ["Cash"] * 3,
+        "note": ["a", "b", "c"],
+    })
+    test_tracker = ExpenseTracker.from_frames(expense_log, budget)
+
+    report = test_tracker.create_grouped_report()
+    assert [str(month) for month in report["month"]] == [
+        "2024-01",
+        "2025-01",
+        "2025-02",
+    ]
+    assert report["total_amount_spent"].tolist() == [10.0, 20.0, 40.0]
+
+    report = test_tracker.create_grouped_report(start="2025-01")
+    assert report["total_amount_spent"].tolist() == [20.0, 40.0]
+
+    pivot = test_tracker.create_pivot_report(end="2025-01")
+    assert [str(month) for month in pivot.columns] == [
+        "2024-01",
+        "2025-01",
+    ]
+    assert pivot.loc["Food", "Groceries"].tolist() == [10.0, 20.0]
+
+
+def test_report_pipeline_leaves_sources_unchanged(tmp_path: Path) -> None:
+    """
+    Test that building and writing the report does not modify the
+    expense log and budget, and that repeated calls give the same report.
+    """
+    test_tracker = ExpenseTracker(
+        excel_path="tests/fixtures/example_excel_file.xlsx",
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+    )
+    expense_log = test_tracker.get_expense_log().copy()
+    budget = test_tracker.get_budget().copy()
+
+    test_tracker.write_report_to_excel(str(tmp_path / "report.xlsx"))
+    first_report = test_tracker.split_report
+    test_tracker.append_totals_rows()
+    test_tracker.write_report_to_excel(str(tmp_path / "report.xlsx"))
+
+    pd.testing.assert_frame_equal(
+        test_tracker.get_expense_log(), expense_log
+    )
+    pd.testing.assert_frame_equal(test_tracker.get_budget(), budget)
+    assert len(test_tracker.split_report) == len(first_report)
+    for report, first in zip(test_tracker.split_report, first_report):
+        pd.testing.assert_frame_equal(report, first)
+
+
+def test_report_pipeline_peak_memory() -> None:
+    """
+    Test that the peak memory of building the monthly reports with totals
+    stays within a fixed multiple of the size of the expense log.
+    """
+    budget = make_budget()
+    test_tracker = ExpenseTracker.from_frames(
+        make_expense_log(budget, rows=50_000, years=2), budget
+    )
+    log_size = test_tracker.get_expense_log().memory_usage(deep=True).sum()
+
+    tracemalloc.start()
+    try:
+        test_tracker.create_grouped_report()
+        test_tracker.append_totals_rows()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 2 * log_size
+
+
+def test_add_transactions_matches_full_recompute() -> None:
+    """
+    Test that reports kept up to date with add_transactions are identical
+    to the reports of a tracker created with every transaction at once,
+    and that only the months of the new transactions are marked dirty.
+    """
+    budget = make_budget(n_categories=5, n_subcategories=4)
+    expense_log = make_expense_log(budget, rows=5_000, years=2)
+    full_tracker = ExpenseTracker.from_frames(expense_log, budget)
+    test_tracker = ExpenseTracker.from_frames(
+        expense_log.iloc[:-300], budget
+    )
+    test_tracker.append_totals_rows()
+
+    new_transactions = expense_log.iloc[-300:]
+    test_tracker.add_transactions(new_transactions)
+    assert test_tracker.dirty_periods == set(
+        new_transactions["date"].dt.to_period("M")
+    )
+
+    totals_report = test_tracker.append_totals_rows()
+    assert not test_tracker.dirty_periods
+    pd.testing.assert_frame_equal(
+        test_tracker.get_expense_log(), full_tracker.get_expense_log()
+    )
+    pd.testing.assert_frame_equal(
+        test_tracker.grouped_report,
+        full_tracker.create_grouped_report(),
+        check_exact=True,
+    )
+    expected_report = full_tracker.append_totals_rows()
+    assert len(totals_report) == len(expected_report)
+    for report, expected in zip(totals_report, expected_report):
+        pd.testing.assert_frame_equal(report, expected, check_exact=True)
+
+
+def test_add_transactions_keeps_dtypes() -> None:
+    """
+    Test that the expense log keeps the dtypes of a fresh load when added
+    transactions have other payment types.
+    """
+    budget = make_budget(n_categories=3, n_subcategories=2)
+    expense_log = make_expense_log(budget, rows=200, years=1)
+    expense_log.loc[expense_log.index[-20:], "payment_type"] = "Gift Card"
+    full_tracker = ExpenseTracker.from_frames(expense_log, budget)
+    test_tracker = ExpenseTracker.from_frames(
+        expense_log.iloc[:-20], budget
+    )
+
+    test_tracker.add_transactions(expense_log.iloc[-20:])
+
+    result = test_tracker.get_expense_log()
+    assert isinstance(result["payment_type"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_series_equal(
+        result.dtypes, full_tracker.get_expense_log().dtypes
+    )
+    pd.testing.assert_frame_equal(result, full_tracker.get_expense_log())
+
+
+def test_add_transactions_invalid() -> None:
+    """
+    Test that add_transactions rejects transactions outside the budget
+    and leaves the tracker unchanged.
+    """
+    test_tracker = ExpenseTracker(
+        excel_path="tests/fixtures/example_excel_file.xlsx",
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+    )
+    report = test_tracker.create_grouped_report()
+
+    with pytest.raises(ValueError, match="not present in the budget"):
+        test_tracker.add_transactions(
+            pd.DataFrame({
+                "date": pd.to_datetime(["2025-04-01"]),
+                "category": ["Entertainment"],
+                "subcategory": ["Movies"],
+                "amount": [15.0],
+                "payment_type": ["Cash"],
+                "note": ["Cinema"],
+            })
+        )
+
+    assert not test_tracker.dirty_periods
+    pd.testing.assert_frame_equal(test_tracker.grouped_report, report)
+
+
+def test_report_cache() -> None:
+    """
+    Test that repeated reports are served from the report cache, and that
+    replacing the budget invalidates them.
+    """
+    test_tracker = ExpenseTracker(
+        excel_path="tests/fixtures/example_excel_file.xlsx",
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+    )
+    report = test_tracker.create_grouped_report(start="2025-02")
+    hits = test_tracker.report_cache.stats()["hits"]
+
+    pd.testing.assert_frame_equal(
+        test_tracker.create_grouped_report(start="2025-02"), report
+    )
+    assert test_tracker.report_cache.stats()["hits"] == hits + 1
+    assert len(test_tracker.create_grouped_report()) != len(report)
+
+    budget = test_tracker.get_budget().copy()
+    budget["amount_budgeted"] *= 2
+    test_tracker.budget = budget
+
+    new_report = test_tracker.create_grouped_report(start="2025-02")
+    pd.testing.assert_series_equal(
+        new_report["amount_budgeted"], report["amount_budgeted"] * 2
+    )
+
+
+def test_report_cache_copies() -> None:
+    """Test that modifying a returned report does not change the cache."""
+    test_tracker = ExpenseTracker(
+        excel_path="tests/fixtures/example_excel_file.xlsx",
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+    )
+    grouped = test_tracker.create_grouped_report()
+    split = test_tracker.create_split_report()
+    monthly = test_tracker.append_totals_rows()
+    expected = [grouped.copy(), split[0].copy(), monthly[0].copy()]
+
+    for report in (grouped, split[0], monthly[0]):
+        report.loc[report.index[0], "total_amount_spent"] = -1
+    split.clear()
+
+    pd.testing.assert_frame_equal(
+        test_tracker.create_grouped_report(), expected[0]
+    )
+    pd.testing.assert_frame_equal(
+        test_tracker.create_split_report()[0], expected[1]
+    )
+    pd.testing.assert_frame_equal(
+        test_tracker.append_totals_rows()[0], expected[2]
+    )
+
+
+def test_report_cache_disabled() -> None:
+    """
+    Test that reports are rebuilt on every call when the report cache has
+    no memory budget.
+    """
+    test_tracker = ExpenseTracker(
+        excel_path="tests/fixtures/example_excel_file.xlsx",
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+        report_cache_bytes=0,
+    )
+    report = test_tracker.create_grouped_report()
+
+    assert test_tracker.create_grouped_report() is not report
+    assert test_tracker.report_cache.stats()["entries"] == 0
+
+
+def test_export_report(tmp_path: Path) -> None:
+    """
+    Test that the report is exported to one file per sheet, with the same
+    sheets as the Excel report.
+    """
+    test_tracker = ExpenseTracker(
+        excel_path="tests/fixtures/example_excel_file.xlsx",
+        budget_sheet="BUDGET",
+        expense_sheet="EXPENSE_LOG",
+    )
+    excel_path = tmp_path / "report.xlsx"
+    test_tracker.write_report_to_excel(str(excel_path))
+
+    file_paths = test_tracker.export_report(
+        str(tmp_path / "csv"), report_format="csv"
+    )
+
+    excel_sheets = pd.read_excel(excel_path, sheet_name=None)
+    assert [file_path.stem for file_path in file_paths] == [
+        "expense_log",
+        "budget",
+        "2025-01",
+        "2025-02",
+        "2025-03",
+    ]
+    assert len(excel_sheets) == len(file_paths)
+    for file_path, expected in zip(file_paths, excel_sheets.values()):
+        pd.testing.assert_frame_equal(
+            pd.read_csv(file_path, parse_dates=["date"])
+            if file_path.stem == "expense_log"
+            else pd.read_csv(file_path),
+            expected,
+            check_dtype=False,
+        )
@@ -5,11 +5,24 @@ import tempfile
 import time
 from pathlib import Path
 
+import numpy as np
+import openpyxl
 import pandas as pd
 import pytest
 import yaml
 
-from utils.file_helper import convert_dfs_to_workbook, load_yaml
+from benchmarks.reference_reports import convert_dfs_to_workbook
+from utils import file_helper
+from utils.file_helper import (
+    load_schema,
+    load_yaml,
+    read_excel_sheets,
+    resolve_csv_engine,
+    resolve_excel_engine,
+    stream_excel_sheet,
+    write_excel_report,
+)
+from utils.validation import validate_excel
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
@@ -122,3 +135,155 @@ def test_convert_dfs_to_workbook() -> None:
                 break
             except PermissionError:
                 time.sleep(0.1)
+
+
+def test_load_schema() -> None:
+    """
+    Test that load_schema returns the schema file contents, and that
+    modifying the returned schema does not affect later calls.
+    """
+    schema_path = "configs/data_schema.yaml"
+    schema = load_schema(schema_path)
+    assert schema == load_yaml(schema_path)
+
+    schema["EXPENSE_LOG"]["amount"] = "int64"
+    assert load_schema(schema_path)["EXPENSE_LOG"]["amount"] == "float64"
+
+    with pytest.raises(FileNotFoundError):
+        load_schema("non_existent_file.yaml")
+
+
+def test_read_excel_sheets() -> None:
+    """
+    Test that read_excel_sheets returns every requested sheet, matching
+    a separate pd.read_excel call per sheet.
+    """
+    excel_path = "tests/fixtures/example_excel_file.xlsx"
+    sheet_names = ["EXPENSE_LOG", "BUDGET"]
+
+    sheets = read_excel_sheets(excel_path, sheet_names=sheet_names)
+
+    assert list(sheets) == sheet_names
+    for sheet_name in sheet_names:
+        pd.testing.assert_frame_equal(
+            sheets[sheet_name],
+            pd.read_excel(excel_path, sheet_name=sheet_name),
+        )
+
+
+def test_resolve_excel_engine() -> None:
+    """
+    Test that resolve_excel_engine defaults to openpyxl, resolves "auto"
+    to an available engine, and rejects unsupported engines.
+    """
+    assert resolve_excel_engine() == "openpyxl"
+    assert resolve_excel_engine("auto") in {"calamine", "openpyxl"}
+    with pytest.raises(ValueError, match="Unsupported Excel engine"):
+        resolve_excel_engine("not_an_engine")
+
+
+def test_resolve_excel_engine_old_pandas(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that calamine is only used with pandas 2.2 or later, even when
+    python-calamine is installed.
+    """
+    monkeypatch.setattr(file_helper, "find_spec", lambda _: object())
+
+    monkeypatch.setattr(pd, "__version__", "2.2.0")
+    assert resolve_excel_engine("auto") == "calamine"
+
+    monkeypatch.setattr(pd, "__version__", "2.1.4")
+    assert resolve_excel_engine("auto") == "openpyxl"
+    with pytest.raises(ValueError, match=r"needs pandas 2\.2"):
+        resolve_excel_engine("calamine")
+
+
+def test_resolve_csv_engine() -> None:
+    """
+    Test that resolve_csv_engine defaults to the C parser, resolves
+    "auto" to an available engine, and rejects unsupported engines.
+    """
+    assert resolve_csv_engine() == "c"
+    assert resolve_csv_engine("auto") in {"pyarrow", "c"}
+    with pytest.raises(ValueError, match="Unsupported CSV engine"):
+        resolve_csv_engine("python")
+
+
+def test_stream_excel_sheet() -> None:
+    """
+    Test that streaming a sheet in chunks gives the same validated
+    DataFrame as reading it whole with pd.read_excel.
+    """
+    excel_path = "tests/fixtures/example_excel_file.xlsx"
+    schema = {
+        "date": "datetime64[ns]",
+        "category": "object",
+        "subcategory": "object",
+        "amount": "float64",
+        "payment_type": "object",
+        "note": "object",
+    }
+    expected = validate_excel(
+        pd.read_excel(excel_path, sheet_name="EXPENSE_LOG"), schema
+    )
+
+    # A chunk size of 2 splits the three rows across two chunks
+    streamed = stream_excel_sheet(
+        excel_path, "EXPENSE_LOG", schema, chunk_size=2
+    )
+
+    pd.testing.assert_frame_equal(streamed, expected)
+
+
+def test_write_excel_report(tmp_path: Path) -> None:
+    """
+    Test that write_excel_report writes the values of each DataFrame with
+    per-column formats and widths, and bolds the subtotal and grand total
+    rows of monthly report sheets.
+    """
+    expense_log = pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-02", "2025-01-15"]),
+        "category": pd.Categorical(["Food", "Entertainment"]),
+        "amount": [1234.5, 20.0],
+        "note": ["Groceries", np.nan],
+    })
+    monthly_report = pd.DataFrame({
+        "category": ["Food", "Food", "Food", "Total"],
+        "subcategory": ["Dining", "Groceries", "Total", np.nan],
+        "total_amount_spent": [10.5, 20.0, 30.5, 30.5],
+    })
+    file_path = tmp_path / "report.xlsx"
+
+    # A chunk size of 3 splits the monthly report across two chunks
+    write_excel_report(
+        [expense_log, monthly_report],
+        str(file_path),
+        ["Expense Log", "2025-01"],
+        total_sheets=["2025-01"],
+        chunk_size=3,
+    )
+
+    sheets = pd.read_excel(file_path, sheet_name=None)
+    pd.testing.assert_frame_equal(
+        sheets["Expense Log"],
+        expense_log.astype({"category": object}),
+    )
+    pd.testing.assert_frame_equal(sheets["2025-01"], monthly_report)
+
+    workbook = openpyxl.load_workbook(file_path)
+    worksheet = workbook["Expense Log"]
+    assert worksheet["A2"].number_format == "yyyy-mm-dd"
+    assert worksheet["C2"].number_format == "#,##0.00"
+    # "Entertainment" is the longest category
+    assert worksheet.column_dimensions["B"].width >= len("Entertainment")
+    assert not any(cell.font.b for cell in worksheet[2])
+
+    worksheet = workbook["2025-01"]
+    bold_rows = [
+        row[0].row
+        for row in worksheet.iter_rows(min_row=2)
+        if row[0].font.b
+    ]
+    assert bold_rows == [4, 5]
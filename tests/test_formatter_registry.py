@@ -0,0 +1,272 @@
+"""Unit tests for formatter_registry.py."""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from categorizers.learned import NaiveBayesCategorizer
+from categorizers.rule_based import RuleBasedCategorizer
+from transaction_formatters import formatter_registry
+from transaction_formatters.capital_one import CapitalOneFormatter
+from transaction_formatters.deduplicator import TransactionDeduplicator
+from transaction_formatters.discover import DiscoverFormatter
+from transaction_formatters.formatter_registry import (
+    detect_formatter,
+    ingest_statements,
+    register_formatter,
+)
+from transaction_formatters.merchant_normalizer import MerchantNormalizer
+
+
+@pytest.fixture
+def statement_dir(tmp_path: Path) -> Path:
+    """
+    Create a directory of mixed bank statements.
+
+    Returns
+    -------
+    Path
+        The directory.
+
+    """
+    for name in ("example_cap_one.csv", "example_discover.csv"):
+        shutil.copy(f"tests/fixtures/{name}", tmp_path / name)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("file_name", "expected"),
+    [
+        ("example_cap_one.csv", CapitalOneFormatter),
+        ("empty_cap_one.csv", CapitalOneFormatter),
+        ("example_discover.csv", DiscoverFormatter),
+        ("discover_all_credit.csv", DiscoverFormatter),
+    ],
+)
+def test_detect_formatter(
+    file_name: str, expected: type[CapitalOneFormatter]
+) -> None:
+    """Test that the bank of a statement is identified from its header."""
+    assert detect_formatter(f"tests/fixtures/{file_name}") is expected
+
+
+def test_detect_formatter_invalid(tmp_path: Path) -> None:
+    """
+    Test that files with unknown columns, dates in another format, or
+    that are not CSV are rejected.
+    """
+    unknown_path = tmp_path / "unknown.csv"
+    unknown_path.write_text("Date,Payee,Value\n2025-01-01,Store,1.00\n")
+    wrong_date_path = tmp_path / "wrong_date.csv"
+    wrong_date_path.write_text(
+        "Trans. Date,Post Date,Description,Amount,Category\n"
+        "2025-01-31,2025-01-31,Store,1.00,Groceries\n"
+    )
+    binary_path = tmp_path / "statement.csv"
+    binary_path.write_bytes(b"\xff\xfe\x00\x01\x80")
+
+    for file_path in (unknown_path, wrong_date_path):
+        with pytest.raises(ValueError, match="no bank matched"):
+            detect_formatter(str(file_path))
+    with pytest.raises(ValueError, match="Cannot read transaction log"):
+        detect_formatter(str(binary_path))
+
+
+def test_detect_formatter_ambiguous(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a statement matching two formatters is rejected."""
+    monkeypatch.setattr(
+        formatter_registry,
+        "FORMATTERS",
+        dict(formatter_registry.FORMATTERS),
+    )
+    register_formatter("capital_one_copy", CapitalOneFormatter)
+
+    with pytest.raises(ValueError, match="capital_one, capital_one_copy"):
+        detect_formatter("tests/fixtures/example_cap_one.csv")
+
+
+def test_ingest_statements(statement_dir: Path) -> None:
+    """
+    Test that a folder of mixed statements is formatted into a single
+    expense log, in file path order.
+    """
+    result = ingest_statements(str(statement_dir / "*.csv"), chunk_size=2)
+
+    cap_one = CapitalOneFormatter(
+        "tests/fixtures/example_cap_one.csv"
+    ).format_cap_one_logs()
+    discover = DiscoverFormatter(
+        "tests/fixtures/example_discover.csv"
+    ).format_discover_logs()
+    pd.testing.assert_frame_equal(
+        result, pd.concat([cap_one, discover], ignore_index=True)
+    )
+
+
+def test_ingest_statements_invalid(statement_dir: Path) -> None:
+    """
+    Test that an unrecognized file stops the ingestion unless invalid
+    files are skipped.
+    """
+    (statement_dir / "notes.csv").write_text("not,a\nstatement,file\n")
+
+    with pytest.raises(ValueError, match=r"notes\.csv"):
+        ingest_statements(str(statement_dir / "*.csv"))
+
+    result = ingest_statements(
+        str(statement_dir / "*.csv"), skip_invalid=True
+    )
+    assert set(result["payment_type"]) == {"Venture", "Discover"}
+
+
+def test_ingest_statements_categorizer(statement_dir: Path) -> None:
+    """Test that ingested statements are categorized when requested."""
+    result = ingest_statements(
+        str(statement_dir / "*.csv"), categorizer=RuleBasedCategorizer()
+    )
+
+    starbucks = result[result["note"] == "STARBUCKS"]
+    assert starbucks["category"].tolist() == ["Entertainment"]
+    assert starbucks["subcategory"].tolist() == ["Meals"]
+
+
+def test_ingest_statements_normalizer(
+    tmp_path: Path, statement_dir: Path
+) -> None:
+    """
+    Test that merchant names are added next to the raw notes, and that
+    the cache is persisted.
+    """
+    cache_path = tmp_path / "cache" / "merchants.json"
+    expected = ingest_statements(str(statement_dir / "*.csv"))
+
+    result = ingest_statements(
+        str(statement_dir / "*.csv"),
+        normalizer=MerchantNormalizer(str(cache_path)),
+    )
+
+    pd.testing.assert_frame_equal(
+        result.drop(columns="merchant"), expected
+    )
+    amazon = result[result["note"] == "AMAZON.COM"]
+    assert amazon["merchant"].tolist() == ["AMAZON"]
+    assert cache_path.exists()
+
+
+def test_ingest_statements_shipped_rules(
+    tmp_path: Path, statement_dir: Path
+) -> None:
+    """
+    Test that the shipped categorization rules match the raw
+    descriptions of statements whose merchants are normalized with the
+    shipped aliases.
+    """
+    (statement_dir / "cap_one_raw.csv").write_text(
+        "Transaction Date,Posted Date,Card No.,Description,Category,"
+        "Debit,Credit\n"
+        "2024-02-01,2024-02-02,1234,SQ *BLUE BOTTLE #12 OAKLAND CA,"
+        "Dining,6.50,\n"
+        "2024-02-02,2024-02-03,1234,BP#8812 GAS,Gas/Automotive,30.00,\n"
+        "2024-02-03,2024-02-04,1234,AMAZON MKTPLACE PMTS AMZN.COM/BILL WA,"
+        "Merchandise,19.99,\n"
+    )
+
+    result = ingest_statements(
+        str(statement_dir / "cap_one_raw.csv"),
+        normalizer=MerchantNormalizer(str(tmp_path / "merchants.json")),
+        categorizer=RuleBasedCategorizer(),
+    )
+
+    assert result["note"].tolist() == [
+        "SQ *BLUE BOTTLE #12 OAKLAND CA",
+        "BP#8812 GAS",
+        "AMAZON MKTPLACE PMTS AMZN.COM/BILL WA",
+    ]
+    assert result["merchant"].tolist() == [
+        "BLUE BOTTLE OAKLAND",
+        "BP GAS",
+        "AMAZON",
+    ]
+    assert result["subcategory"].tolist() == [
+        "Meals",
+        "Gas",
+        "Household Items",
+    ]
+
+
+def test_ingest_statements_deduplicator(
+    tmp_path: Path, statement_dir: Path
+) -> None:
+    """Test that overlapping and re-imported statements are skipped."""
+    shutil.copy(
+        statement_dir / "example_cap_one.csv",
+        statement_dir / "example_cap_one_copy.csv",
+    )
+    deduplicator = TransactionDeduplicator(str(tmp_path / "index"))
+    expected = ingest_statements(
+        str(statement_dir / "example_*[er].csv"), skip_invalid=True
+    )
+
+    result = ingest_statements(
+        str(statement_dir / "*.csv"), deduplicator=deduplicator
+    )
+    deduplicator.commit()
+    reimport = ingest_statements(
+        str(statement_dir / "*.csv"), deduplicator=deduplicator
+    )
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert reimport.empty
+    assert deduplicator.stats()["kept"] == 0
+    assert deduplicator.stats()["indexed"] == len(expected)
+
+
+def test_ingest_statements_deduplicator_cards(tmp_path: Path) -> None:
+    """
+    Test that identical charges exported for two cards of a bank are
+    both kept, and that the card number is not an expense log column.
+    """
+    for card in ("1234", "5678"):
+        (tmp_path / f"cap_one_{card}.csv").write_text(
+            "Transaction Date,Posted Date,Card No.,Description,Category,"
+            f"Debit,Credit\n2024-01-01,2024-01-02,{card},STARBUCKS,Dining,"
+            "5.25,\n"
+        )
+    pattern = str(tmp_path / "cap_one_*.csv")
+    deduplicator = TransactionDeduplicator(str(tmp_path / "index"))
+
+    result = ingest_statements(pattern, deduplicator=deduplicator)
+    deduplicator.commit()
+    reimport = ingest_statements(pattern, deduplicator=deduplicator)
+
+    pd.testing.assert_frame_equal(result, ingest_statements(pattern))
+    assert len(result) == len(["1234", "5678"])
+    assert reimport.empty
+
+
+def test_ingest_statements_deduplicator_failure(
+    tmp_path: Path, statement_dir: Path
+) -> None:
+    """
+    Test that transactions of an import failing after deduplication are
+    not recorded, so that running it again keeps them.
+    """
+    deduplicator = TransactionDeduplicator(str(tmp_path / "index"))
+    expected = ingest_statements(str(statement_dir / "*.csv"))
+
+    with pytest.raises(ValueError, match="has not been trained"):
+        ingest_statements(
+            str(statement_dir / "*.csv"),
+            deduplicator=deduplicator,
+            categorizer=NaiveBayesCategorizer(),
+        )
+    assert deduplicator.stats()["indexed"] == 0
+
+    result = ingest_statements(
+        str(statement_dir / "*.csv"), deduplicator=deduplicator
+    )
+    pd.testing.assert_frame_equal(result, expected)
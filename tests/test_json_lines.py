@@ -0,0 +1,33 @@
+"""Unit tests for the JsonLinesExporter class."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from report_exporters.json_lines import JsonLinesExporter
+
+
+def test_json_lines_exporter(tmp_path: Path) -> None:
+    """
+    Test that each row is written as a JSON object, with ISO dates and
+    missing values as null.
+    """
+    expense_log = pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-31"]),
+        "amount": [10.5],
+        "note": [np.nan],
+    })
+
+    (file_path,) = JsonLinesExporter().export(
+        {"Expense Log": expense_log}, str(tmp_path / "report.jsonl")
+    )
+
+    records = [
+        json.loads(line)
+        for line in file_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert records == [
+        {"date": "2025-01-31T00:00:00.000", "amount": 10.5, "note": None}
+    ]
@@ -0,0 +1,118 @@
+"""Unit tests for the NaiveBayesCategorizer class."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from categorizers.learned import NaiveBayesCategorizer, hash_tokens
+
+
+@pytest.fixture
+def history() -> pd.DataFrame:
+    """
+    Build a categorized expense log of coffee and gas transactions.
+
+    Returns
+    -------
+    pd.DataFrame
+        The expense log.
+
+    """
+    return pd.DataFrame({
+        "category": ["Dining", "Dining", "Auto", "Auto", "", "Auto"],
+        "subcategory": ["Coffee", "Coffee", "Gas", "Gas", "", "Gas"],
+        "note": [
+            "STARBUCKS #12",
+            "Starbucks Store 4",
+            "SHELL OIL 123",
+            "SHELL OIL 77",
+            "UNKNOWN SHOP",
+            "SPEEDWAY 9",
+        ],
+    })
+
+
+def test_hash_tokens() -> None:
+    """Test that words are hashed stably, without digits."""
+    notes = pd.Series(
+        ["Shell oil #12", None, "OIL", "12"], index=[5, 6, 7, 8]
+    )
+
+    n_features = 1_000
+
+    rows, features = hash_tokens(notes, n_features)
+
+    assert rows.tolist() == [0, 0, 2]
+    assert features[1] == features[2]
+    assert (features < n_features).all()
+    assert hash_tokens(pd.Series(["OIL"]), n_features)[1][0] == features[2]
+
+
+def test_predict(history: pd.DataFrame) -> None:
+    """Test that notes get the budget line of their tokens."""
+    categorizer = NaiveBayesCategorizer().fit(history)
+    notes = pd.Series(["STARBUCKS #99", "Shell Oil 5", "12", None])
+
+    result = categorizer.predict(notes)
+
+    assert categorizer.targets() == [("Dining", "Coffee"), ("Auto", "Gas")]
+    assert result["category"].tolist() == ["Dining", "Auto", "", ""]
+    assert result["subcategory"].tolist() == ["Coffee", "Gas", "", ""]
+    assert (result["confidence"].iloc[:2] > 0.5).all()  # noqa: PLR2004
+    assert result["confidence"].iloc[2:].tolist() == [0, 0]
+
+
+def test_categorize_min_confidence(history: pd.DataFrame) -> None:
+    """Test that unsure predictions leave transactions blank."""
+    categorizer = NaiveBayesCategorizer(min_confidence=0.8).fit(history)
+    expense_log = pd.DataFrame({
+        "category": ["", ""],
+        "subcategory": ["", ""],
+        "note": ["STARBUCKS SHELL", "STARBUCKS STARBUCKS STARBUCKS"],
+    })
+
+    result = categorizer.categorize(expense_log)
+
+    assert result["category"].tolist() == ["", "Dining"]
+    assert list(result.columns) == list(expense_log.columns)
+
+
+def test_partial_fit_matches_fit(history: pd.DataFrame) -> None:
+    """Test that training in two steps gives the same model as in one."""
+    full = NaiveBayesCategorizer(n_features=64).fit(history)
+    incremental = NaiveBayesCategorizer(n_features=64).fit(
+        history.iloc[:2]
+    )
+
+    incremental.partial_fit(history.iloc[2:])
+
+    assert incremental.classes == full.classes
+    np.testing.assert_array_equal(
+        incremental.class_counts, full.class_counts
+    )
+    np.testing.assert_array_equal(
+        incremental.feature_counts, full.feature_counts
+    )
+
+
+def test_save_load(tmp_path: Path, history: pd.DataFrame) -> None:
+    """Test that a saved model predicts the same after loading."""
+    categorizer = NaiveBayesCategorizer().fit(history)
+    model_path = tmp_path / "models" / "categorizer.npz"
+    notes = pd.Series(["STARBUCKS #1", "SPEEDWAY OIL", "NEW SHOP"])
+
+    categorizer.save(str(model_path))
+    loaded = NaiveBayesCategorizer.load(str(model_path))
+
+    assert loaded.classes == categorizer.classes
+    pd.testing.assert_frame_equal(
+        loaded.predict(notes), categorizer.predict(notes)
+    )
+
+
+def test_predict_untrained() -> None:
+    """Test that an untrained model cannot predict."""
+    with pytest.raises(ValueError, match="not been trained"):
+        NaiveBayesCategorizer().predict(pd.Series(["STARBUCKS"]))
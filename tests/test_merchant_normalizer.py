@@ -0,0 +1,137 @@
+"""Unit tests for the MerchantNormalizer class."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from transaction_formatters.merchant_normalizer import (
+    MerchantNormalizer,
+    clean_description,
+    load_aliases,
+)
+
+ALIASES = """
+merchants:
+  - name: AMAZON
+    contains: ["AMAZON", "AMZN"]
+  - name: STARBUCKS
+    contains: ["STARBUCKS"]
+"""
+
+
+@pytest.fixture
+def aliases_path(tmp_path: Path) -> str:
+    """
+    Write an aliases file with Amazon and Starbucks.
+
+    Returns
+    -------
+    str
+        The path of the aliases file.
+
+    """
+    aliases_path = tmp_path / "aliases.yaml"
+    aliases_path.write_text(ALIASES)
+    return str(aliases_path)
+
+
+@pytest.mark.parametrize(
+    ("description", "expected"),
+    [
+        ("SQ *Blue Bottle #12 OAKLAND CA", "BLUE BOTTLE OAKLAND"),
+        ("NETFLIX.COM", "NETFLIX"),
+        ("SHELL OIL 57444  OH", "SHELL OIL"),
+        ("AMZN MKTP US*2K3LL0", "AMZN MKTP"),
+        ("BP", "BP"),
+        ("1234", "1234"),
+    ],
+)
+def test_clean_description(description: str, expected: str) -> None:
+    """Test that varying parts of descriptions are removed."""
+    assert clean_description(description) == expected
+
+
+def test_load_aliases_invalid(tmp_path: Path) -> None:
+    """Test that merchants without substrings are rejected."""
+    aliases_path = tmp_path / "aliases.yaml"
+    aliases_path.write_text("merchants:\n  - name: X\n")
+
+    with pytest.raises(ValueError, match="needs a 'name'"):
+        load_aliases(str(aliases_path))
+
+
+def test_normalize(aliases_path: str) -> None:
+    """Test that each distinct description is normalized once."""
+    normalizer = MerchantNormalizer(aliases_path=aliases_path)
+    descriptions = pd.Series(
+        [
+            "AMAZON MKTPLACE PMTS AMZN.COM/BILL WA",
+            "Starbucks Store #1",
+            None,
+            "AMAZON MKTPLACE PMTS AMZN.COM/BILL WA",
+            "LOCAL SHOP 12",
+        ],
+        index=[10, 11, 12, 13, 14],
+    )
+
+    result = normalizer.normalize(descriptions)
+
+    assert result.index.tolist() == descriptions.index.tolist()
+    assert result.iloc[[0, 1, 3, 4]].tolist() == [
+        "AMAZON",
+        "STARBUCKS",
+        "AMAZON",
+        "LOCAL SHOP",
+    ]
+    assert pd.isna(result.iloc[2])
+    assert normalizer.stats()["misses"] == len(descriptions.dropna()) - 1
+
+    normalizer.normalize(descriptions)
+    assert normalizer.stats()["hit_rate"] == 0.5  # noqa: PLR2004
+
+
+def test_normalize_evicts_least_recently_used(aliases_path: str) -> None:
+    """Test that the cache keeps the most recently used descriptions."""
+    normalizer = MerchantNormalizer(
+        max_entries=2, aliases_path=aliases_path
+    )
+
+    normalizer.normalize(pd.Series(["A", "B"]))
+    normalizer.normalize(pd.Series(["A", "C"]))
+
+    stats = normalizer.stats()
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+    assert list(normalizer._entries) == ["A", "C"]
+
+
+def test_save_load(tmp_path: Path, aliases_path: str) -> None:
+    """Test that a persisted cache is reused by a new normalizer."""
+    cache_path = tmp_path / "cache" / "merchants.json"
+    descriptions = pd.Series(["STARBUCKS #1", "SHOP #2"])
+    normalizer = MerchantNormalizer(
+        str(cache_path), aliases_path=aliases_path
+    )
+    normalizer.normalize(descriptions)
+    normalizer.save()
+
+    warm = MerchantNormalizer(str(cache_path), aliases_path=aliases_path)
+
+    assert warm.normalize(descriptions).tolist() == ["STARBUCKS", "SHOP"]
+    assert warm.stats()["hits"] == len(descriptions)
+
+
+def test_load_outdated_cache(tmp_path: Path, aliases_path: str) -> None:
+    """Test that a cache saved with other aliases is ignored."""
+    cache_path = tmp_path / "merchants.json"
+    cache_path.write_text(
+        json.dumps({"fingerprint": "old", "entries": [["A #1", "B"]]})
+    )
+
+    normalizer = MerchantNormalizer(
+        str(cache_path), aliases_path=aliases_path
+    )
+
+    assert normalizer.normalize(pd.Series(["A #1"])).tolist() == ["A"]
+    assert normalizer.stats()["misses"] == 1
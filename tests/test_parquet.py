@@ -0,0 +1,35 @@
+"""Unit tests for the ParquetExporter class."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from report_exporters import parquet
+from report_exporters.parquet import ParquetExporter
+
+
+def test_parquet_exporter(tmp_path: Path) -> None:
+    """Test that sheets are written to Parquet files with their dtypes."""
+    pytest.importorskip("pyarrow")
+    expense_log = pd.DataFrame({
+        "date": pd.to_datetime(["2025-01-31", "2025-02-15"]),
+        "category": pd.Categorical(["Food", "Housing"]),
+        "amount": [10.5, 1000.0],
+    })
+
+    (file_path,) = ParquetExporter().export(
+        {"Expense Log": expense_log}, str(tmp_path)
+    )
+
+    pd.testing.assert_frame_equal(pd.read_parquet(file_path), expense_log)
+
+
+def test_parquet_exporter_missing_engine(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an ImportError is raised without a Parquet library."""
+    monkeypatch.setattr(parquet, "find_spec", lambda _: None)
+
+    with pytest.raises(ImportError, match="Parquet export requires"):
+        ParquetExporter()
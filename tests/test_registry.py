@@ -0,0 +1,23 @@
+"""Unit tests for the report exporter registry."""
+
+import pytest
+
+from report_exporters import registry
+from report_exporters.delimited import CsvExporter, TsvExporter
+from report_exporters.registry import get_exporter, register_exporter
+
+
+def test_get_exporter() -> None:
+    """Test that exporters are created by report format."""
+    assert isinstance(get_exporter("csv"), CsvExporter)
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        get_exporter("not_a_format")
+
+
+def test_register_exporter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that new report formats can be registered."""
+    monkeypatch.setattr(registry, "EXPORTERS", dict(registry.EXPORTERS))
+
+    register_exporter("tab", TsvExporter)
+
+    assert isinstance(get_exporter("tab"), TsvExporter)
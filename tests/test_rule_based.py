@@ -0,0 +1,190 @@
+"""Unit tests for the RuleBasedCategorizer class."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from categorizers.rule_based import (
+    RuleBasedCategorizer,
+    compile_rules,
+    load_rules,
+)
+
+RULES = """
+rules:
+  - name: coffee
+    contains: ["STARBUCKS", "A+B CAFE"]
+    category: Dining
+    subcategory: Coffee
+  - name: gas
+    contains: ["SHELL"]
+    regex: "^SPEEDWAY \\\\d+$"
+    category: Auto
+    subcategory: Gas
+"""
+
+
+@pytest.fixture
+def rules_path(tmp_path: Path) -> str:
+    """
+    Write a rules file with a coffee rule and a gas rule.
+
+    Returns
+    -------
+    str
+        The path of the rules file.
+
+    """
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(RULES)
+    return str(rules_path)
+
+
+def test_load_rules(rules_path: str) -> None:
+    """Test that substrings are escaped and combined with the regex."""
+    rules = load_rules(rules_path)
+
+    assert [rule.name for rule in rules] == ["coffee", "gas"]
+    assert rules[0].pattern == r"STARBUCKS|A\+B\ CAFE"
+    assert rules[1].pattern == r"SHELL|^SPEEDWAY \d+$"
+
+
+@pytest.mark.parametrize(
+    ("rules", "match"),
+    [
+        ("rules:\n  - name: x\n    contains: [A]\n", "missing"),
+        (
+            "rules:\n  - {name: x, category: a, subcategory: b}\n",
+            "neither",
+        ),
+        (
+            "rules:\n  - {name: x, regex: '(', category: a, "
+            "subcategory: b}\n",
+            "Invalid regex",
+        ),
+        (
+            "rules:\n"
+            "  - {name: x, contains: [A], category: a, subcategory: b}\n"
+            "  - {name: x, contains: [B], category: a, subcategory: b}\n",
+            "Duplicate",
+        ),
+        (
+            "rules:\n  - {name: x, regex: '(?i)foo', category: a, "
+            "subcategory: b}\n",
+            "global inline flags",
+        ),
+        (
+            "rules:\n  - {name: x, regex: '(a)\\1', category: a, "
+            "subcategory: b}\n",
+            "backreferences",
+        ),
+        (
+            "rules:\n  - {name: x, regex: '(?P<x>a)b', category: a, "
+            "subcategory: b}\n",
+            "named groups",
+        ),
+    ],
+)
+def test_load_rules_invalid(
+    tmp_path: Path, rules: str, match: str
+) -> None:
+    """Test that invalid rules are rejected."""
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(rules)
+
+    with pytest.raises(ValueError, match=match):
+        load_rules(str(rules_path))
+
+
+def test_load_rules_combinable(tmp_path: Path) -> None:
+    """
+    Test that escaped backslashes, scoped flags and numbered groups are
+    allowed, and that such rules match once combined.
+    """
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(
+        "rules:\n"
+        "  - {name: x, regex: 'A\\\\1', category: a, subcategory: b}\n"
+        "  - {name: y, regex: '(?i:b)(c)', category: a, subcategory: b}\n"
+    )
+
+    matcher = compile_rules(load_rules(str(rules_path)))
+
+    assert matcher.match("A\\1").lastgroup == "_rule0"
+    assert matcher.match("bc").lastgroup == "_rule1"
+
+
+def test_compile_rules(rules_path: str) -> None:
+    """
+    Test that the first rule in file order wins, wherever the patterns
+    occur in the note, and that matching ignores case.
+    """
+    matcher = compile_rules(load_rules(rules_path))
+
+    assert matcher.match("SHELL OIL STARBUCKS").lastgroup == "_rule0"
+    assert matcher.match("starbucks").lastgroup == "_rule0"
+    assert matcher.match("Speedway 123").lastgroup == "_rule1"
+    assert matcher.match("CAR WASH SPEEDWAY 123") is None
+    assert compile_rules([]).match("SHELL") is None
+
+
+def test_categorize(rules_path: str) -> None:
+    """
+    Test that blank categories are filled from the first matching rule,
+    leaving categorized, unmatched and missing notes unchanged.
+    """
+    expense_log = pd.DataFrame({
+        "category": ["", "", "Travel", "", ""],
+        "subcategory": ["", "", "Flights", "", ""],
+        "amount": [5.0, 40.0, 300.0, 10.0, 1.0],
+        "note": ["STARBUCKS #1", "SHELL 42", "STARBUCKS", "BOOKS", np.nan],
+    })
+    original = expense_log.copy()
+    categorizer = RuleBasedCategorizer(rules_path)
+
+    result = categorizer.categorize(expense_log)
+
+    assert result["category"].tolist() == [
+        "Dining",
+        "Auto",
+        "Travel",
+        "",
+        "",
+    ]
+    assert result["subcategory"].tolist() == [
+        "Coffee",
+        "Gas",
+        "Flights",
+        "",
+        "",
+    ]
+    pd.testing.assert_frame_equal(expense_log, original)
+    assert categorizer.stats()["matches"].tolist() == [2, 1]
+    assert categorizer.stats()["unique_notes"].tolist() == [2, 1]
+    assert {"compile_s", "match_s", "predict_s", "assign_s"} <= set(
+        categorizer.timings
+    )
+
+    result = categorizer.categorize(expense_log, overwrite=True)
+    assert result["category"].tolist()[2] == "Dining"
+
+
+def test_validate_targets(rules_path: str) -> None:
+    """Test that rule targets missing from the budget are rejected."""
+    budget = pd.DataFrame({
+        "category": ["Dining", "Auto"],
+        "subcategory": ["Coffee", "Gas"],
+        "amount_budgeted": [50.0, 100.0],
+    })
+    RuleBasedCategorizer(rules_path, budget=budget)
+
+    with pytest.raises(ValueError, match="Auto / Gas"):
+        RuleBasedCategorizer(rules_path, budget=budget.iloc[:1])
+
+
+def test_default_rules_match_blank_budget() -> None:
+    """Test that the default rules target the blank workbook's budget."""
+    budget = pd.read_excel("blank_expense_log.xlsx", sheet_name="BUDGET")
+    RuleBasedCategorizer(budget=budget)
@@ -3,7 +3,12 @@
 import pandas as pd
 import pytest
 
-from utils.validation import validate_excel, validate_expenses
+from utils.validation import (
+    compile_schema,
+    find_missing_budget_lines,
+    validate_excel,
+    validate_expenses,
+)
 
 
 @pytest.mark.parametrize(
@@ -60,6 +65,53 @@ def test_validate_excel_success() -> None:
         assert validated_df[col].dtype == dtype
 
 
+def test_compile_schema() -> None:
+    """
+    Test that compile_schema splits datetime columns from other columns
+    and reuses the compiled plan for an equal schema.
+    """
+    sheet_schema = {
+        "date": {"dtype": "datetime64[ns]", "format": "%d/%m/%Y"},
+        "amount": "float64",
+        "category": "category",
+    }
+
+    plan = compile_schema(sheet_schema)
+
+    assert plan.columns == ("date", "amount", "category")
+    assert plan.dtypes == {"amount": "float64", "category": "category"}
+    assert plan.datetime_formats == {"date": "%d/%m/%Y"}
+    assert compile_schema(dict(sheet_schema)) is plan
+
+
+def test_validate_excel_datetime_format() -> None:
+    """
+    Test that validate_excel parses datetime columns with the format
+    declared in the schema and does not modify the input DataFrame.
+    """
+    test_df = pd.DataFrame({
+        "date": ["31/01/2025", "01/02/2025"],
+        "amount": [1, 2],
+    })
+    sheet_schema = {
+        "date": {"dtype": "datetime64[ns]", "format": "%d/%m/%Y"},
+        "amount": "float64",
+    }
+
+    validated_df = validate_excel(test_df, sheet_schema)
+
+    assert validated_df["date"].tolist() == [
+        pd.Timestamp("2025-01-31"),
+        pd.Timestamp("2025-02-01"),
+    ]
+    assert validated_df["amount"].dtype == "float64"
+    assert test_df["date"].dtype == object
+    assert test_df["amount"].dtype == "int64"
+
+    with pytest.raises(ValueError, match="Column 'date' cannot be"):
+        validate_excel(test_df.assign(date="2025-01-31"), sheet_schema)
+
+
 def test_validate_expenses_valid() -> None:
     """Test valid case for validate_expenses() to ensure no output."""
     expense_df = pd.DataFrame({
@@ -93,4 +145,57 @@ def test_validate_expenses_invalid() -> None:
     ) as exc_info:
         validate_expenses(expense_df, budget_df)
 
-    assert "Entertainment_Movies" in str(exc_info.value)
+    assert "Entertainment" in str(exc_info.value)
+    assert "Movies" in str(exc_info.value)
+    # The third expense is on row 4 of the sheet, below the header
+    assert str(exc_info.value).splitlines()[-1].split()[-1] == "4"
+
+
+def test_validate_expenses_underscore_names() -> None:
+    """
+    Test that validate_expenses compares categories and subcategories as
+    separate keys, so names containing underscores cannot collide.
+    """
+    expense_df = pd.DataFrame({
+        "category": ["Food_Dining"],
+        "subcategory": ["Out"],
+    })
+    budget_df = pd.DataFrame({
+        "category": ["Food"],
+        "subcategory": ["Dining_Out"],
+    })
+
+    with pytest.raises(ValueError, match="Categories or subcategories"):
+        validate_expenses(expense_df, budget_df)
+
+
+def test_find_missing_budget_lines() -> None:
+    """
+    Test that find_missing_budget_lines reports every missing pair with
+    its count and first sheet row, in order of first occurrence.
+    """
+    expense_df = pd.DataFrame({
+        "category": ["Food", "Travel", "Food", "Travel", "Fun"],
+        "subcategory": [
+            "Groceries",
+            "Flights",
+            "Snacks",
+            "Flights",
+            "Bar",
+        ],
+    }).astype("category")
+    budget_df = pd.DataFrame({
+        "category": ["Food"],
+        "subcategory": ["Groceries"],
+    }).astype("category")
+
+    result = find_missing_budget_lines(expense_df, budget_df)
+
+    expected = pd.DataFrame({
+        "category": ["Travel", "Food", "Fun"],
+        "subcategory": ["Flights", "Snacks", "Bar"],
+        "count": [2, 1, 1],
+        # Sheet rows, after the header row
+        "first_row": [3, 4, 6],
+    })
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)